@@ -57,7 +57,8 @@ CLASSIFIERS = [
 ]
 
 version_txt = os.path.join(here, 'supvisors/version.txt')
-supvisors_version = open(version_txt).read().split('=')[1].strip()
+with open(version_txt, 'r') as ver:
+    supvisors_version = ver.read().split('=')[1].strip()
 
 setup(name='supvisors',
       version=supvisors_version,
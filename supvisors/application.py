@@ -24,8 +24,8 @@ from supervisor.loggers import Logger
 from supervisor.states import ProcessStates
 
 from .process import ProcessStatus
-from .ttypes import (ApplicationStates, DistributionRules, NameList, NameSet, Payload, StartingStrategies,
-                     StartingFailureStrategies, RunningFailureStrategies)
+from .ttypes import (ApplicationStates, ApplicationStateNames, DistributionRules, NameList, NameSet, Payload,
+                     StartingStrategies, StartingFailureStrategies, RunningFailureStrategies)
 from .utils import WILDCARD
 
 # additional annotation types
@@ -466,7 +466,7 @@ class ApplicationStatus:
         :return: the application status in a dictionary
         """
         return {'application_name': self.application_name, 'managed': self.rules.managed,
-                'statecode': self.state.value, 'statename': self.state.name,
+                'statecode': self._state.value, 'statename': ApplicationStateNames[self._state],
                 'major_failure': self.major_failure, 'minor_failure': self.minor_failure}
 
     def __str__(self) -> str:
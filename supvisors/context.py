@@ -214,13 +214,22 @@ class Context:
                 return True
         return False
 
-    def get_nodes_load(self) -> LoadMap:
+    def get_instances_load(self) -> LoadMap:
+        """ Get the load of all Supvisors instances.
+
+        :return: The Supvisors instances load
+        """
+        return {identifier: status.get_load() for identifier, status in self.instances.items()}
+
+    def get_nodes_load(self, instances_load: Optional[LoadMap] = None) -> LoadMap:
         """ Get the Supvisors instances load grouped by node.
 
+        :param instances_load: the Supvisors instances load, if already known
         :return: The nodes load
         """
-        return {ip_address: sum(self.instances[identifier].get_load()
-                                for identifier in identifiers)
+        if instances_load is None:
+            instances_load = self.get_instances_load()
+        return {ip_address: sum(instances_load[identifier] for identifier in identifiers)
                 for ip_address, identifiers in self.supvisors.mapper.nodes.items()}
 
     # methods on instances
@@ -326,12 +335,10 @@ class Context:
         :return: True if the namespec is valid
         """
         application_name, process_name = split_namespec(namespec)
-        if application_name not in self.applications:
+        application_status = self.applications.get(application_name)
+        if application_status is None:
             return False
-        if process_name:
-            application_status = self.applications[application_name]
-            return process_name in application_status.processes
-        return True
+        return not process_name or process_name in application_status.processes
 
     def get_process(self, namespec: str) -> Optional[ProcessStatus]:
         """ Return the ProcessStatus corresponding to the namespec.
@@ -357,18 +364,18 @@ class Context:
 
         :return: True if at least one conflict is detected
         """
-        return any((process.conflicting() for application in self.applications.values()
-                    for process in application.processes.values()
-                    if application.rules.managed))
+        return any(process.conflicting()
+                   for application in self.applications.values() if application.rules.managed
+                   for process in application.processes.values())
 
     def conflicts(self) -> List[ProcessStatus]:
         """ Get all conflicting processes.
 
         :return: the list of conflicting ProcessStatus
         """
-        return [process for application in self.applications.values()
-                for process in application.processes.values()
-                if application.rules.managed and process.conflicting()]
+        return [process
+                for application in self.applications.values() if application.rules.managed
+                for process in application.processes.values() if process.conflicting()]
 
     def setdefault_application(self, application_name: str) -> Optional[ApplicationStatus]:
         """ Return the application corresponding to application_name if found,
@@ -22,7 +22,7 @@ import json
 from typing import Dict, Optional, Set
 
 import websockets
-from supervisor.loggers import Logger
+from supervisor.loggers import Logger, LevelsByName
 
 from supvisors.external_com.eventinterface import (EventPublisherInterface, EventSubscriber, AsyncEventThread,
                                                    ASYNC_TIMEOUT)
@@ -102,7 +102,8 @@ class WsEventPublisher(EventPublisherInterface):
         :param status: the status to publish.
         :return: None.
         """
-        self.logger.trace(f'WsEventPublisher.send_supvisors_status: {status}')
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'WsEventPublisher.send_supvisors_status: {status}')
         clients = [ws for ws, subscriptions in websocket_clients.items()
                    if EventHeaders.SUPVISORS in subscriptions]
         websockets.broadcast(clients, json.dumps((EventHeaders.SUPVISORS.value, status)))
@@ -113,7 +114,8 @@ class WsEventPublisher(EventPublisherInterface):
         :param status: the status to publish.
         :return: None.
         """
-        self.logger.trace(f'WsEventPublisher.send_instance_status: {status}')
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'WsEventPublisher.send_instance_status: {status}')
         clients = [ws for ws, subscriptions in websocket_clients.items()
                    if EventHeaders.INSTANCE in subscriptions]
         websockets.broadcast(clients, json.dumps((EventHeaders.INSTANCE.value, status)))
@@ -124,7 +126,8 @@ class WsEventPublisher(EventPublisherInterface):
         :param status: the status to publish.
         :return: None.
         """
-        self.logger.trace(f'WsEventPublisher.send_application_status: {status}')
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'WsEventPublisher.send_application_status: {status}')
         clients = [ws for ws, subscriptions in websocket_clients.items()
                    if EventHeaders.APPLICATION in subscriptions]
         websockets.broadcast(clients, json.dumps((EventHeaders.APPLICATION.value, status)))
@@ -139,7 +142,8 @@ class WsEventPublisher(EventPublisherInterface):
         # build the event before it is sent
         evt = event.copy()
         evt['identifier'] = identifier
-        self.logger.trace(f'WsEventPublisher.send_process_event: {evt}')
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'WsEventPublisher.send_process_event: {evt}')
         clients = [ws for ws, subscriptions in websocket_clients.items()
                    if EventHeaders.PROCESS_EVENT in subscriptions]
         websockets.broadcast(clients, json.dumps((EventHeaders.PROCESS_EVENT.value, evt)))
@@ -150,7 +154,8 @@ class WsEventPublisher(EventPublisherInterface):
         :param status: the status to publish.
         :return: None.
         """
-        self.logger.trace(f'WsEventPublisher.send_process_status: {status}')
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'WsEventPublisher.send_process_status: {status}')
         clients = [ws for ws, subscriptions in websocket_clients.items()
                    if EventHeaders.PROCESS_STATUS in subscriptions]
         websockets.broadcast(clients, json.dumps((EventHeaders.PROCESS_STATUS.value, status)))
@@ -161,7 +166,8 @@ class WsEventPublisher(EventPublisherInterface):
         :param statistics: the statistics to publish.
         :return: None.
         """
-        self.logger.trace(f'WsEventPublisher.send_host_statistics: {statistics}')
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'WsEventPublisher.send_host_statistics: {statistics}')
         clients = [ws for ws, subscriptions in websocket_clients.items()
                    if EventHeaders.HOST_STATISTICS in subscriptions]
         websockets.broadcast(clients, json.dumps((EventHeaders.HOST_STATISTICS.value, statistics)))
@@ -172,7 +178,8 @@ class WsEventPublisher(EventPublisherInterface):
         :param statistics: the statistics to publish.
         :return: None;
         """
-        self.logger.trace(f'WsEventPublisher.send_process_statistics: {statistics}')
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'WsEventPublisher.send_process_statistics: {statistics}')
         clients = [ws for ws, subscriptions in websocket_clients.items()
                    if EventHeaders.PROCESS_STATISTICS in subscriptions]
         websockets.broadcast(clients, json.dumps((EventHeaders.PROCESS_STATISTICS.value, statistics)))
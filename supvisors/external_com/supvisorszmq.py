@@ -18,10 +18,16 @@
 # ======================================================================
 
 import asyncio
+import json
+import os
+import queue
+import tempfile
+from threading import Thread
+from typing import Dict, List, Optional, Tuple
 
 import zmq
 import zmq.asyncio
-from supervisor.loggers import Logger
+from supervisor.loggers import Logger, LevelsByName
 
 from supvisors.external_com.eventinterface import EventPublisherInterface, EventSubscriber, EventSubscriberInterface
 from supvisors.internal_com.mapper import SupvisorsInstanceId
@@ -30,9 +36,82 @@ from supvisors.ttypes import Payload, EventHeaders
 # Constant for Zmq sockets
 ZMQ_LINGER = 0
 
+# options of the publication socket, so that bursts of events are queued instead of being dropped
+ZMQ_PUB_SNDHWM = 10000
+ZMQ_PUB_SNDBUF = 1 << 20
+
+# node names for which the subscriber prefers the Unix domain socket
+LOCAL_NODE_NAMES = ['localhost', '127.0.0.1']
+
 # reference to the Zmq Context instance
 ZmqContext = zmq.Context.instance()
 
+# pre-encoded headers of the published messages
+EventHeadersBytes = {header: header.value.encode('utf-8') for header in EventHeaders}
+
+# annotation types
+PayloadCache = Dict[str, Tuple[Payload, bytes]]
+
+
+def get_ipc_path(event_port: int) -> str:
+    """ Return the path of the Unix domain socket used to publish the events to the local subscribers.
+
+    :param event_port: the port used to publish the events over TCP
+    :return: the path of the Unix domain socket
+    """
+    return os.path.join(tempfile.gettempdir(), f'supvisors-{event_port}.sock')
+
+
+class ZmqSendThread(Thread):
+    """ Thread sending the messages prepared by the ZmqEventPublisher.
+
+    The PyZmq socket is used only by this thread once started, and it is closed when the thread ends.
+    This way, the Supervisor thread is never blocked by the publication.
+    """
+
+    def __init__(self, socket: zmq.Socket, logger: Logger):
+        """ Initialization of the attributes.
+
+        :param socket: the PyZmq publication socket
+        :param logger: the Supvisors logger
+        """
+        super().__init__(daemon=True)
+        self.socket: zmq.Socket = socket
+        self.logger: Logger = logger
+        self.queue: queue.Queue = queue.Queue()
+
+    def push_message(self, message: List[bytes]) -> None:
+        """ Add a multipart message to the queue of messages to send.
+
+        :param message: the encoded header and body
+        :return: None
+        """
+        self.queue.put_nowait(message)
+
+    def stop(self) -> None:
+        """ Stop the thread once all the pending messages are sent.
+
+        :return: None
+        """
+        self.queue.put_nowait(None)
+
+    def run(self) -> None:
+        """ Send the queued messages until the thread is stopped.
+
+        :return: None
+        """
+        message = self.queue.get()
+        while message is not None:
+            try:
+                # the payload buffer is handed to libzmq without copy
+                self.socket.send_multipart(message, zmq.NOBLOCK, copy=False)
+            except zmq.Again:
+                self.logger.debug('ZmqSendThread.run: publication queue full - message dropped')
+            except zmq.ZMQError as exc:
+                self.logger.error(f'ZmqSendThread.run: failed to publish message: {exc}')
+            message = self.queue.get()
+        self.socket.close(ZMQ_LINGER)
+
 
 class ZmqEventPublisher(EventPublisherInterface):
     """ Class for PyZmq publication of Supvisors events. """
@@ -44,18 +123,73 @@ class ZmqEventPublisher(EventPublisherInterface):
         :param logger: the Supvisors logger
         """
         self.logger: Logger = logger
+        # serialized forms of the latest application status published, per application name
+        self.application_cache: PayloadCache = {}
         logger.info(f'ZmqEventPublisher: initiating PyZmq event publisher on {instance.event_port}')
         self.socket: zmq.Socket = ZmqContext.socket(zmq.PUB)
+        self.socket.setsockopt(zmq.SNDHWM, ZMQ_PUB_SNDHWM)
+        self.socket.setsockopt(zmq.SNDBUF, ZMQ_PUB_SNDBUF)
+        self.socket.setsockopt(zmq.LINGER, ZMQ_LINGER)
+        # queue messages only to the subscribers whose connection is completed
+        self.socket.setsockopt(zmq.IMMEDIATE, 1)
         url = f'tcp://0.0.0.0:{instance.event_port}'
         self.logger.debug(f'ZmqEventPublisher: binding {url}')
         self.socket.bind(url)
+        # local subscribers may use a Unix domain socket instead of the TCP loopback
+        self.ipc_path: Optional[str] = None
+        if zmq.has('ipc'):
+            ipc_path = get_ipc_path(instance.event_port)
+            url = f'ipc://{ipc_path}'
+            self.logger.debug(f'ZmqEventPublisher: binding {url}')
+            try:
+                self.socket.bind(url)
+            except zmq.ZMQError as exc:
+                self.logger.warn(f'ZmqEventPublisher: cannot bind {url} ({exc}) - local subscribers will use TCP')
+            else:
+                self.ipc_path = ipc_path
+        # the socket is used by the sender thread from now on
+        self.thread: ZmqSendThread = ZmqSendThread(self.socket, logger)
+        self.thread.start()
 
     def close(self) -> None:
-        """ Close the PyZmq socket.
+        """ Stop the sender thread, which closes the PyZmq socket.
 
         :return: None
         """
-        self.socket.close(ZMQ_LINGER)
+        if self.thread.is_alive():
+            self.thread.stop()
+            self.thread.join()
+        if self.ipc_path and os.path.exists(self.ipc_path):
+            os.remove(self.ipc_path)
+
+    def _encode_application_status(self, status: Payload) -> bytes:
+        """ Return the JSON-serialized application status, re-using the latest serialization if it is unchanged.
+
+        The application status is published on every state change of its processes, so it often repeats.
+        Other statuses carry time information and almost never repeat, so they are not cached.
+
+        :param status: the application status to serialize
+        :return: the serialized application status
+        """
+        application_name = status.get('application_name')
+        cached = self.application_cache.get(application_name)
+        if cached and cached[0] == status:
+            return cached[1]
+        encoded = json.dumps(status).encode('utf-8')
+        self.application_cache[application_name] = status, encoded
+        return encoded
+
+    def _send(self, header: EventHeaders, payload: Payload, encoded: Optional[bytes] = None) -> None:
+        """ Queue the pre-encoded header and the JSON-serialized payload as a single multipart message.
+
+        :param header: the header of the message
+        :param payload: the payload to publish
+        :param encoded: the payload already serialized, if any
+        :return: None
+        """
+        if encoded is None:
+            encoded = json.dumps(payload).encode('utf-8')
+        self.thread.push_message([EventHeadersBytes[header], encoded])
 
     def send_supvisors_status(self, status: Payload) -> None:
         """ Send a JSON-serialized supvisors status through the socket.
@@ -63,9 +197,9 @@ class ZmqEventPublisher(EventPublisherInterface):
         :param status: the status to publish
         :return: None
         """
-        self.logger.trace(f'ZmqEventPublisher.send_supvisors_status: {status}')
-        self.socket.send_string(EventHeaders.SUPVISORS.value, zmq.SNDMORE)
-        self.socket.send_json(status)
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'ZmqEventPublisher.send_supvisors_status: {status}')
+        self._send(EventHeaders.SUPVISORS, status)
 
     def send_instance_status(self, status: Payload) -> None:
         """ Send a JSON-serialized Supvisors instance status through the socket.
@@ -73,9 +207,9 @@ class ZmqEventPublisher(EventPublisherInterface):
         :param status: the status to publish
         :return: None
         """
-        self.logger.trace(f'ZmqEventPublisher.send_instance_status: {status}')
-        self.socket.send_string(EventHeaders.INSTANCE.value, zmq.SNDMORE)
-        self.socket.send_json(status)
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'ZmqEventPublisher.send_instance_status: {status}')
+        self._send(EventHeaders.INSTANCE, status)
 
     def send_application_status(self, status: Payload) -> None:
         """ Send a JSON-serialized application status through the socket.
@@ -83,9 +217,9 @@ class ZmqEventPublisher(EventPublisherInterface):
         :param status: the status to publish
         :return: None
         """
-        self.logger.trace(f'ZmqEventPublisher.send_application_status: {status}')
-        self.socket.send_string(EventHeaders.APPLICATION.value, zmq.SNDMORE)
-        self.socket.send_json(status)
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'ZmqEventPublisher.send_application_status: {status}')
+        self._send(EventHeaders.APPLICATION, status, self._encode_application_status(status))
 
     def send_process_event(self, identifier: str, event: Payload) -> None:
         """ Send a JSON-serialized process event through the socket.
@@ -97,9 +231,9 @@ class ZmqEventPublisher(EventPublisherInterface):
         # build the event before it is sent
         evt = event.copy()
         evt['identifier'] = identifier
-        self.logger.trace(f'ZmqEventPublisher.send_process_event: {evt}')
-        self.socket.send_string(EventHeaders.PROCESS_EVENT.value, zmq.SNDMORE)
-        self.socket.send_json(evt)
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'ZmqEventPublisher.send_process_event: {evt}')
+        self._send(EventHeaders.PROCESS_EVENT, evt)
 
     def send_process_status(self, status: Payload) -> None:
         """ This method sends a serialized form of the process status through the socket.
@@ -107,9 +241,9 @@ class ZmqEventPublisher(EventPublisherInterface):
         :param status: the status to publish
         :return: None
         """
-        self.logger.trace(f'ZmqEventPublisher.send_process_status: {status}')
-        self.socket.send_string(EventHeaders.PROCESS_STATUS.value, zmq.SNDMORE)
-        self.socket.send_json(status)
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'ZmqEventPublisher.send_process_status: {status}')
+        self._send(EventHeaders.PROCESS_STATUS, status)
 
     def send_host_statistics(self, statistics: Payload) -> None:
         """ This method sends host statistics through the socket.
@@ -117,9 +251,9 @@ class ZmqEventPublisher(EventPublisherInterface):
         :param statistics: the statistics to publish
         :return: None
         """
-        self.logger.trace(f'ZmqEventPublisher.send_host_statistics: {statistics}')
-        self.socket.send_string(EventHeaders.HOST_STATISTICS.value, zmq.SNDMORE)
-        self.socket.send_json(statistics)
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'ZmqEventPublisher.send_host_statistics: {statistics}')
+        self._send(EventHeaders.HOST_STATISTICS, statistics)
 
     def send_process_statistics(self, statistics: Payload) -> None:
         """ This method sends process statistics through the socket.
@@ -127,9 +261,9 @@ class ZmqEventPublisher(EventPublisherInterface):
         :param statistics: the statistics to publish
         :return: None
         """
-        self.logger.trace(f'ZmqEventPublisher.send_process_statistics: {statistics}')
-        self.socket.send_string(EventHeaders.PROCESS_STATISTICS.value, zmq.SNDMORE)
-        self.socket.send_json(statistics)
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'ZmqEventPublisher.send_process_statistics: {statistics}')
+        self._send(EventHeaders.PROCESS_STATISTICS, statistics)
 
 
 class ZmqEventSubscriber(EventSubscriber):
@@ -176,8 +310,14 @@ class ZmqEventSubscriber(EventSubscriber):
         else:
             for header in self.headers:
                 socket.setsockopt(zmq.SUBSCRIBE, header.encode('utf-8'))
-        # define the URI
+        # define the URI. the Unix domain socket is preferred when Supvisors is on the local node
+        # and when this process is allowed to use it (the publisher may run under another user)
+        # otherwise, ZMQ would retry silently to connect it whereas TCP would work
         uri = f'tcp://{node_name}:{event_port}'
+        if node_name in LOCAL_NODE_NAMES and zmq.has('ipc'):
+            ipc_path = get_ipc_path(event_port)
+            if os.access(ipc_path, os.R_OK | os.W_OK):
+                uri = f'ipc://{ipc_path}'
         while not stop_evt.is_set():
             self.logger.debug(f'ZmqEventSubscriber: connecting {uri}')
             socket.connect(uri)
@@ -31,7 +31,7 @@ from .options import SupvisorsOptions, SupvisorsServerOptions, Automatic, get_lo
 from .sparser import Parser
 from .statemachine import FiniteStateMachine
 from .statscompiler import HostStatisticsCompiler, ProcStatisticsCompiler
-from .strategy import RunningFailureHandler
+from .strategy import InterleavedWeightedRoundRobin, RunningFailureHandler
 from .supervisordata import SupervisorData
 from .ttypes import Payload
 
@@ -124,6 +124,8 @@ class Supvisors:
         # create the failure handler of crashing processes
         # WARN: must be created before the state machine
         self.failure_handler = RunningFailureHandler(self)
+        # create the rounds of the WEIGHTED_ROUND_ROBIN starting strategy
+        self.round_robin = InterleavedWeightedRoundRobin()
         # check rules files
         try:
             self.parser = Parser(self)
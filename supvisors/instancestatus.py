@@ -20,12 +20,13 @@
 from copy import copy
 from typing import Any, Dict, Tuple
 
-from supervisor.loggers import Logger
+from supervisor.loggers import Logger, LevelsByName
 from supervisor.xmlrpc import capped_int
 
 from .internal_com.mapper import SupvisorsInstanceId
 from .process import ProcessStatus
-from .ttypes import SupvisorsInstanceStates, SupvisorsStates, InvalidTransition, Payload
+from .ttypes import (SupvisorsInstanceStates, SupvisorsInstanceStateNames, SupvisorsStates, SupvisorsStateNames,
+                     InvalidTransition, Payload)
 from .utils import TICK_PERIOD
 
 
@@ -101,7 +102,7 @@ class StateModes:
 
     def serial(self):
         """ Return a serializable form of the StatesModes. """
-        return {'fsm_statecode': self.state.value, 'fsm_statename': self.state.name,
+        return {'fsm_statecode': self.state.value, 'fsm_statename': SupvisorsStateNames[self.state],
                 'discovery_mode': self.discovery_mode,
                 'master_identifier': self.master_identifier,
                 'starting_jobs': self.starting_jobs,
@@ -189,10 +190,11 @@ class SupvisorsInstanceStatus:
     # serialization
     def serial(self):
         """ Return a serializable form of the SupvisorsInstanceStatus. """
-        payload = {'identifier': self.identifier,
-                   'node_name': self.supvisors_id.host_id,
-                   'port': self.supvisors_id.http_port,
-                   'statecode': self.state.value, 'statename': self.state.name,
+        supvisors_id, state = self.supvisors_id, self._state
+        payload = {'identifier': supvisors_id.identifier,
+                   'node_name': supvisors_id.host_id,
+                   'port': supvisors_id.http_port,
+                   'statecode': state.value, 'statename': SupvisorsInstanceStateNames[state],
                    'sequence_counter': self.sequence_counter,
                    'remote_time': capped_int(self.remote_time),
                    'local_time': capped_int(self.local_time),
@@ -335,8 +337,11 @@ class SupvisorsInstanceStatus:
 
         :return: the total load
         """
-        instance_load = sum(process.rules.expected_load for process in self.running_processes())
-        self.logger.trace(f'SupvisorsInstanceStatus.get_load: Supvisors={self.identifier} load={instance_load}')
+        # the running processes are filtered on the fly to avoid building the intermediate list
+        instance_load = sum(process.rules.expected_load for process in self.processes.values()
+                            if process.running_on(self.identifier))
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'SupvisorsInstanceStatus.get_load: Supvisors={self.identifier} load={instance_load}')
         return instance_load
 
     def has_error(self) -> bool:
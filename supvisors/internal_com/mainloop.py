@@ -21,35 +21,122 @@ import asyncio
 import json
 import queue
 import threading
+import time
 import traceback
-from http.client import CannotSendRequest, IncompleteRead
-from typing import Any, Optional
+from http.client import CannotSendRequest, IncompleteRead, RemoteDisconnected
+from typing import Any, Dict, List, Optional
 
 from supervisor.childutils import getRPCInterface
 from supervisor.compat import xmlrpclib
-from supervisor.loggers import Logger
+from supervisor.loggers import Logger, LevelsByName
 from supervisor.xmlrpc import RPCError
 
-from supvisors.ttypes import InternalEventHeaders, SupvisorsInstanceStates, Ipv4Address, SUPVISORS, ISOLATION_STATES
+from supvisors.ttypes import (InternalEventHeaders, SupvisorsInstanceStates, Ipv4Address, Payload, PayloadList,
+                             SUPVISORS, ISOLATION_STATES)
 from supvisors.utils import SupervisorServerUrl
 from .internal_com import SupvisorsInternalReceiver
 from .internalinterface import ASYNC_TIMEOUT
 from .pushpull import DeferredRequestHeaders
 
+# use orjson to encode the events sent to Supervisor if available, as it is much faster than json
+try:
+    import orjson
+
+    def json_dumps(obj) -> str:
+        """ Encode the object in a JSON string using orjson. """
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    json_dumps = json.dumps
+
+# use uvloop for the asynchronous event loop of the main loop thread if available
+# NOTE: the global event loop policy is not changed, so that the other threads of supervisord are unaffected
+try:
+    from uvloop import new_event_loop as create_event_loop
+except ImportError:
+    create_event_loop = asyncio.new_event_loop
+
+
+class RequestWorker(threading.Thread):
+    """ Thread serving, in order, the deferred XML-RPC requests sent to one Supvisors instance.
+
+    Using one thread per Supvisors instance ensures that an unreachable Supvisors instance does not delay
+    the requests sent to the other Supvisors instances.
+
+    Attributes:
+        - proxy: the SupervisorProxy that executes the requests ;
+        - identifier: the identifier of the Supvisors instance that the requests are sent to ;
+        - queue: the queue of requests to serve.
+    """
+
+    def __init__(self, proxy: 'SupervisorProxy', identifier: str):
+        """ Initialization of the attributes. """
+        threading.Thread.__init__(self, daemon=True)
+        self.proxy: SupervisorProxy = proxy
+        self.identifier: str = identifier
+        self.queue: queue.Queue = queue.Queue()
+
+    def push_request(self, request: DeferredRequestHeaders, params) -> None:
+        """ Add a request to send to the Supvisors instance. """
+        self.queue.put_nowait((request, params))
+
+    def stop(self) -> None:
+        """ Unblock the queue to stop the main loop. """
+        self.queue.put_nowait(None)
+
+    def run(self):
+        """ Main loop. """
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            try:
+                self.proxy.execute(*item)
+            except Exception:
+                # an unexpected error must not end the thread, otherwise the next requests would never be served
+                self.proxy.logger.critical(f'RequestWorker.run: failed to serve request={item}'
+                                           f' to Supvisors={self.identifier}: {traceback.format_exc()}')
+
 
 class SupervisorProxy(threading.Thread):
     """ xmlrpclib.ServerProxy is not thread-safe so all requests are pushed to a synchronous queue
-    so that the requests are served and the async loop is not blocked. """
+    so that the requests are served and the async loop is not blocked.
+
+    The XML-RPC client to the local Supervisor instance is only used from this thread.
+    The deferred XML-RPC requests are dispatched to one RequestWorker per destination, so that the requests
+    to the different Supvisors instances are served concurrently. """
 
     QUEUE_TIMEOUT = 1.0
 
+    # maximum number of queued items taken in one go, so that the events are sent to Supervisor in one XML-RPC
+    MAX_BATCH_SIZE = 100
+
+    # delay during which a Supvisors instance that could not be reached is not requested again
+    # NOTE: kept below TICK_PERIOD so that the instance is checked again at the next TICK
+    UNREACHABLE_DELAY = 3.0
+
+    # socket timeout of the XML-RPC clients to the Supvisors instances, so that a dead peer cannot block a worker
+    RPC_TIMEOUT = 10.0
+
     # List of keys useful to build a SupvisorsState event
     StateModesKeys = ['fsm_statecode', 'discovery_mode', 'master_identifier', 'starting_jobs', 'stopping_jobs']
 
+    # the methods serving the deferred requests
+    ExecuteMethods = {DeferredRequestHeaders.CHECK_INSTANCE: 'check_instance',
+                      DeferredRequestHeaders.START_PROCESS: 'start_process',
+                      DeferredRequestHeaders.STOP_PROCESS: 'stop_process',
+                      DeferredRequestHeaders.RESTART: 'restart',
+                      DeferredRequestHeaders.SHUTDOWN: 'shutdown',
+                      DeferredRequestHeaders.RESTART_SEQUENCE: 'restart_sequence',
+                      DeferredRequestHeaders.RESTART_ALL: 'restart_all',
+                      DeferredRequestHeaders.SHUTDOWN_ALL: 'shutdown_all'}
+
     # to avoid a long list of exceptions in catches
     RpcExceptions = (KeyError, ValueError, OSError, ConnectionResetError,
                      CannotSendRequest, IncompleteRead, xmlrpclib.Fault, RPCError)
 
+    # exceptions raised when re-using a connection that has been closed by the remote Supervisor
+    StaleConnectionExceptions = (RemoteDisconnected, BrokenPipeError, ConnectionResetError, CannotSendRequest)
+
     def __init__(self, supvisors: Any):
         """ Initialization of the attributes. """
         threading.Thread.__init__(self, daemon=True)
@@ -60,6 +147,12 @@ class SupervisorProxy(threading.Thread):
         self.srv_url: SupervisorServerUrl = SupervisorServerUrl(supvisors.supervisor_data.get_env())
         # create an XML-RPC client to the local Supervisor instance
         self.proxy = getRPCInterface(self.srv_url.env)
+        # the threads serving the deferred requests, per Supvisors instance
+        self.workers: Dict[str, RequestWorker] = {}
+        # the XML-RPC clients to the Supvisors instances, kept to re-use their persistent HTTP connection
+        self.remote_proxies: Dict[str, xmlrpclib.ServerProxy] = {}
+        # the monotonic dates until which the Supvisors instances that could not be reached are not requested
+        self.unreachable: Dict[str, float] = {}
 
     @property
     def logger(self) -> Logger:
@@ -75,47 +168,176 @@ class SupervisorProxy(threading.Thread):
         self.queue.put_nowait((request, params))
 
     def stop(self):
-        """ Set the event to stop the main loop. """
+        """ Set the event to stop the main loop and unblock the queue. """
         self.event.set()
+        self.queue.put_nowait(None)
 
     def run(self):
         """ Main loop. """
         self.logger.info('SupervisorProxy.run: entering main loop')
-        while not self.event.is_set():
+        # hoist the attribute lookups out of the loop
+        is_set, queue_get, process_batch = self.event.is_set, self.queue.get, self.process_batch
+        timeout = SupervisorProxy.QUEUE_TIMEOUT
+        while not is_set():
             try:
-                event_type, event_data = self.queue.get(timeout=SupervisorProxy.QUEUE_TIMEOUT)
+                item = queue_get(timeout=timeout)
             except queue.Empty:
                 self.logger.blather('SupervisorProxy.run: nothing received')
             else:
-                if event_type is not None:
-                    self.execute(event_type, event_data)
-                else:
-                    self.send_remote_comm_event(event_data)
+                if item is not None:
+                    process_batch(item)
+        # do NOT join the workers as they may be blocked in an XML-RPC
+        for worker in self.workers.values():
+            worker.stop()
         self.logger.info('SupervisorProxy.run: exiting main loop')
 
-    def execute(self, header: DeferredRequestHeaders, body) -> None:
-        """ Perform the XML-RPC according to the header. """
+    def process_batch(self, item) -> None:
+        """ Process the item received and the items already queued behind it (up to MAX_BATCH_SIZE).
+        The requests are dispatched to the workers and the events are sent to Supervisor in a single XML-RPC.
+        No waiting is added, so the latency of the events is not increased.
+
+        :param item: the first item received
+        :return: None
+        """
+        items = [item]
+        # hoist the attribute lookups out of the loops
+        get_nowait, add_item = self.queue.get_nowait, items.append
+        for _ in range(SupervisorProxy.MAX_BATCH_SIZE - 1):
+            try:
+                next_item = get_nowait()
+            except queue.Empty:
+                break
+            if next_item is None:
+                # stop requested: the loop condition is checked right after this batch
+                break
+            add_item(next_item)
+        events = []
+        dispatch, add_event = self.dispatch, events.append
+        for event_type, event_data in items:
+            if event_type is not None:
+                dispatch(event_type, event_data)
+            else:
+                add_event(event_data)
+        if events:
+            self.send_remote_comm_event(SupervisorProxy.coalesce_ticks(events))
+
+    @staticmethod
+    def coalesce_ticks(events: List) -> List:
+        """ Keep only the latest TICK event of each Supvisors instance in the events.
+        A TICK event supersedes the previous ones from the same Supvisors instance.
+
+        :param events: the events to send to Supervisor
+        :return: the events without the superseded TICK events
+        """
+        if len(events) < 2:
+            return events
+        tick_value = InternalEventHeaders.TICK.value
+        # get the index of the latest TICK event per Supvisors instance
+        latest_ticks = {event_identifier: idx
+                        for idx, (_, (event_type, (event_identifier, _))) in enumerate(events)
+                        if event_type == tick_value}
+        return [event for idx, event in enumerate(events)
+                if event[1][0] != tick_value or latest_ticks[event[1][1][0]] == idx]
+
+    def dispatch(self, header: DeferredRequestHeaders, body) -> None:
+        """ Push the XML-RPC request to the worker of the destination Supvisors instance. """
         # first element of body is always the identifier of the destination Supvisors instance
         identifier = body[0]
+        worker = self.workers.get(identifier)
+        if worker is None:
+            worker = self.workers[identifier] = RequestWorker(self, identifier)
+            worker.start()
+        worker.push_request(header, body)
+
+    def get_env(self, identifier: str) -> Dict[str, str]:
+        """ Return the environment used to create an XML-RPC client to the Supvisors instance. """
         instance = self.supvisors.mapper.instances[identifier]
-        self.srv_url.update_url(instance.host_id, instance.http_port)
-        # send message
-        if header == DeferredRequestHeaders.CHECK_INSTANCE:
-            self.check_instance(*body)
-        elif header == DeferredRequestHeaders.START_PROCESS:
-            self.start_process(*body)
-        elif header == DeferredRequestHeaders.STOP_PROCESS:
-            self.stop_process(*body)
-        elif header == DeferredRequestHeaders.RESTART:
-            self.restart(*body)
-        elif header == DeferredRequestHeaders.SHUTDOWN:
-            self.shutdown(*body)
-        elif header == DeferredRequestHeaders.RESTART_SEQUENCE:
-            self.restart_sequence(*body)
-        elif header == DeferredRequestHeaders.RESTART_ALL:
-            self.restart_all(*body)
-        elif header == DeferredRequestHeaders.SHUTDOWN_ALL:
-            self.shutdown_all(*body)
+        return self.srv_url.get_env(instance.host_id, instance.http_port)
+
+    def get_proxy(self, identifier: str) -> xmlrpclib.ServerProxy:
+        """ Return the XML-RPC client to the Supvisors instance, created on first use.
+        All the requests to a Supvisors instance are served by the same RequestWorker, so a client is never shared
+        between threads.
+
+        :param identifier: the identifier of the Supvisors instance
+        :return: the XML-RPC client
+        """
+        proxy = self.remote_proxies.get(identifier)
+        if proxy is None:
+            proxy = self.remote_proxies[identifier] = getRPCInterface(self.get_env(identifier))
+            SupervisorProxy.set_timeout(proxy, SupervisorProxy.RPC_TIMEOUT)
+        return proxy
+
+    @staticmethod
+    def set_timeout(proxy: xmlrpclib.ServerProxy, timeout: float) -> None:
+        """ Apply a socket timeout to the connections created by the SupervisorTransport of the XML-RPC client.
+
+        :param proxy: the XML-RPC client
+        :param timeout: the socket timeout, in seconds
+        :return: None
+        """
+        transport = proxy('transport')
+        get_connection = transport._get_connection
+
+        def get_connection_with_timeout():
+            connection = get_connection()
+            connection.timeout = timeout
+            return connection
+        transport._get_connection = get_connection_with_timeout
+
+    def close_proxy(self, identifier: str) -> None:
+        """ Close the XML-RPC client to the Supvisors instance, so that a new connection is used next time.
+
+        :param identifier: the identifier of the Supvisors instance
+        :return: None
+        """
+        proxy = self.remote_proxies.pop(identifier, None)
+        if proxy is not None:
+            proxy('close')()
+
+    def remote_call(self, identifier: str, rpc_name: str, *args):
+        """ Perform the XML-RPC on the Supvisors instance using its persistent connection.
+        If the remote Supervisor has closed the connection in the meantime, the request is sent again once
+        on a new connection.
+        If the remote Supervisor cannot be reached, the next requests fail immediately during UNREACHABLE_DELAY
+        instead of waiting for the same connection failure again.
+
+        :param identifier: the identifier of the Supvisors instance
+        :param rpc_name: the name of the XML-RPC, including its namespace
+        :param args: the arguments of the XML-RPC
+        :return: the result of the XML-RPC
+        """
+        if self.unreachable.get(identifier, 0.0) > time.monotonic():
+            raise OSError(f'Supvisors={identifier} unreachable')
+        namespace, method_name = rpc_name.split('.')
+        reused = identifier in self.remote_proxies
+        try:
+            try:
+                return getattr(getattr(self.get_proxy(identifier), namespace), method_name)(*args)
+            except SupervisorProxy.StaleConnectionExceptions:
+                self.close_proxy(identifier)
+                if not reused:
+                    raise
+                self.logger.debug(f'SupervisorProxy.remote_call: renew connection to Supvisors={identifier}')
+            return getattr(getattr(self.get_proxy(identifier), namespace), method_name)(*args)
+        except (xmlrpclib.Fault, RPCError):
+            # the XML-RPC has been processed by the remote Supervisor so the connection is fine
+            raise
+        except OSError:
+            # the remote Supervisor cannot be reached
+            self.logger.warn(f'SupervisorProxy.remote_call: Supvisors={identifier} unreachable')
+            self.unreachable[identifier] = time.monotonic() + SupervisorProxy.UNREACHABLE_DELAY
+            self.close_proxy(identifier)
+            raise
+        except SupervisorProxy.RpcExceptions:
+            self.close_proxy(identifier)
+            raise
+
+    def execute(self, header: DeferredRequestHeaders, body) -> None:
+        """ Perform the XML-RPC according to the header. """
+        method_name = SupervisorProxy.ExecuteMethods.get(header)
+        if method_name:
+            getattr(self, method_name)(*body)
 
     def check_instance(self, identifier: str) -> None:
         """ Check isolation and get all process info.
@@ -123,35 +345,63 @@ class SupervisorProxy(threading.Thread):
         :param identifier: the identifier of the Supvisors instance to get information from.
         :return: None.
         """
-        authorized = self._is_authorized(identifier)
+        state_modes, all_info = None, None
+        # the local status, the remote status and the process information are requested in a single round trip
+        results = self._get_check_results(identifier)
+        authorized = self._is_authorized(results[0]) if results else None
         self.logger.info(f'SupervisorProxy.check_instance: identifier={identifier} authorized={authorized}')
         if authorized:
-            self._transfer_states_modes(identifier)
-            self._transfer_process_info(identifier)
+            state_modes = self._get_states_modes(identifier, results[1])
+            all_info = self._get_process_info(identifier, results[2])
         # inform local Supvisors that authorization result is available
-        message = InternalEventHeaders.AUTHORIZATION.value, (identifier, authorized)
-        self.send_remote_comm_event((self._get_origin(identifier), message))
+        # NOTE: states / modes and process information are sent along with the authorization in a single event
+        #   so that the local Supvisors is notified only once
+        message = InternalEventHeaders.AUTHORIZATION.value, (identifier, (authorized, state_modes, all_info))
+        self.push_event((self._get_origin(identifier), message))
 
     def _get_origin(self, identifier: str) -> Ipv4Address:
         """ Return the IPv4 tuple associated with the Supvisors instance. """
         instance = self.supvisors.mapper.instances[identifier]
         return instance.ip_address, instance.http_port
 
-    def _is_authorized(self, identifier: str) -> Optional[bool]:
-        """ Get authorization from remote Supvisors instance.
-        If the remote Supvisors instance considers the local Supvisors instance as ISOLATED, authorization is denied.
+    def _get_check_results(self, identifier: str) -> Optional[List]:
+        """ Get, in a single round trip, the information needed to check the remote Supvisors instance:
+            - the local Supvisors instance status, as seen by the remote Supvisors instance ;
+            - the remote Supvisors instance status ;
+            - the process information of the remote Supvisors instance.
+
+        The Supervisor system.multicall is used, so that no new XML-RPC is required on the remote side.
 
         :param identifier: the identifier of the remote Supvisors instance.
-        :return: True if the local Supvisors instance is accepted by the remote Supvisors instance.
+        :return: the results of the 3 calls, or None if the remote Supvisors instance could not be reached.
         """
+        calls = [{'methodName': 'supvisors.get_instance_info', 'params': [self.supvisors.context.local_identifier]},
+                 {'methodName': 'supvisors.get_instance_info', 'params': [identifier]},
+                 {'methodName': 'supvisors.get_all_local_process_info', 'params': []}]
         try:
-            supvisors_rpc = getRPCInterface(self.srv_url.env).supvisors
-            # check authorization
-            local_status_payload = supvisors_rpc.get_instance_info(self.supvisors.context.local_identifier)
-            self.logger.debug(f'SupervisorProxy._is_authorized: local_status_payload={local_status_payload}')
+            results = self.remote_call(identifier, 'system.multicall', calls)
         except SupervisorProxy.RpcExceptions:
             # Remote Supvisors instance closed in the gap or Supvisors is incorrectly configured
-            self.logger.error(f'SupervisorProxy._is_authorized: failed to check Supvisors={identifier}')
+            self.logger.error(f'SupervisorProxy._get_check_results: failed to check Supvisors={identifier}')
+            return None
+        self.logger.debug(f'SupervisorProxy._get_check_results: results={results}')
+        return results
+
+    @staticmethod
+    def _is_fault(result: Any) -> bool:
+        """ Return True if the result of a call in the Supervisor system.multicall is a fault. """
+        return isinstance(result, dict) and 'faultCode' in result
+
+    def _is_authorized(self, local_status_payload: Any) -> Optional[bool]:
+        """ Get authorization from remote Supvisors instance.
+        If the remote Supvisors instance considers the local Supvisors instance as ISOLATED, authorization is denied.
+
+        :param local_status_payload: the local Supvisors instance status, as seen by the remote Supvisors instance.
+        :return: True if the local Supvisors instance is accepted by the remote Supvisors instance.
+        """
+        if self._is_fault(local_status_payload):
+            # Supvisors is incorrectly configured
+            self.logger.error(f'SupervisorProxy._is_authorized: failed to get the local status={local_status_payload}')
             return None
         # check the local Supvisors instance state as seen by the remote Supvisors instance
         state = local_status_payload['statecode']
@@ -163,53 +413,39 @@ class SupervisorProxy(threading.Thread):
         # authorization is granted if the remote Supvisors instances did not isolate the local Supvisors instance
         return instance_state not in ISOLATION_STATES
 
-    def _transfer_process_info(self, identifier: str) -> None:
-        """ Get the process information from the remote Supvisors instance and post it to the local Supvisors instance.
+    def _get_process_info(self, identifier: str, all_info: Any) -> Optional[PayloadList]:
+        """ Get the process information from the result of the remote Supvisors instance.
 
         :param identifier: the identifier of the remote Supvisors instance.
-        :return: None
+        :param all_info: the result of the get_all_local_process_info call.
+        :return: the process information, or None if the remote Supvisors instance could not provide it.
         """
-        # get information about all processes handled by Supervisor
-        try:
-            supvisors_rpc = getRPCInterface(self.srv_url.env).supvisors
-            all_info = supvisors_rpc.get_all_local_process_info()
-        except SupervisorProxy.RpcExceptions:
-            self.logger.error('SupervisorProxy._transfer_process_info: failed to get process information'
-                              f' from Supvisors={identifier}')
+        if self._is_fault(all_info):
             # the remote Supvisors instance may have gone to a closing state since the previous calls and thus be
             # not able to respond to the request (long shot but not impossible)
             # do NOT set authorized to False in this case or an unwanted isolation may happen
-        else:
-            # inform local Supvisors about the processes available remotely
-            message = InternalEventHeaders.ALL_INFO.value, (identifier, all_info)
-            self.send_remote_comm_event((self._get_origin(identifier), message))
+            self.logger.error('SupervisorProxy._get_process_info: failed to get process information'
+                              f' from Supvisors={identifier}')
+            return None
+        return all_info
 
-    def _transfer_states_modes(self, identifier: str) -> None:
-        """ Get the states and modes from the remote Supvisors instance and post it to the local Supvisors instance.
+    def _get_states_modes(self, identifier: str, remote_status: Any) -> Optional[Payload]:
+        """ Get the states and modes from the result of the remote Supvisors instance.
 
         :param identifier: the identifier of the remote Supvisors instance.
-        :return: None
+        :param remote_status: the result of the get_instance_info call on the remote Supvisors instance itself.
+        :return: the states and modes, or None if the remote Supvisors instance could not provide them.
         """
-        # get authorization from remote Supvisors instance
-        try:
-            # check how the remote Supvisors instance defines itself
-            supvisors_rpc = getRPCInterface(self.srv_url.env).supvisors
-            remote_status = supvisors_rpc.get_instance_info(identifier)
-        except SupervisorProxy.RpcExceptions:
-            # Remote Supvisors instance closed in the gap or Supvisors is incorrectly configured
-            self.logger.error(f'SupervisorProxy._transfer_states_modes: failed to check Supvisors={identifier}')
-        else:
-            self.logger.debug(f'SupervisorProxy._transfer_states_modes: remote_status={remote_status}')
-            state_modes = {key: remote_status[key] for key in SupervisorProxy.StateModesKeys}
-            # provide the local Supvisors with the remote Supvisors instance state and modes
-            message = InternalEventHeaders.STATE.value, (identifier, state_modes)
-            self.send_remote_comm_event((self._get_origin(identifier), message))
+        if self._is_fault(remote_status):
+            self.logger.error(f'SupervisorProxy._get_states_modes: failed to check Supvisors={identifier}')
+            return None
+        self.logger.debug(f'SupervisorProxy._get_states_modes: remote_status={remote_status}')
+        return {key: remote_status[key] for key in SupervisorProxy.StateModesKeys}
 
     def start_process(self, identifier: str, namespec: str, extra_args: str) -> None:
         """ Start process asynchronously. """
         try:
-            proxy = getRPCInterface(self.srv_url.env)
-            proxy.supvisors.start_args(namespec, extra_args, False)
+            self.remote_call(identifier, 'supvisors.start_args', namespec, extra_args, False)
         except SupervisorProxy.RpcExceptions:
             self.logger.error(f'SupervisorProxy.start_process: failed to start process {namespec} on {identifier}'
                               f' with extra_args="{extra_args}"')
@@ -217,32 +453,32 @@ class SupervisorProxy(threading.Thread):
     def stop_process(self, identifier: str, namespec: str) -> None:
         """ Stop process asynchronously. """
         try:
-            proxy = getRPCInterface(self.srv_url.env)
-            proxy.supervisor.stopProcess(namespec, False)
+            self.remote_call(identifier, 'supervisor.stopProcess', namespec, False)
         except SupervisorProxy.RpcExceptions:
             self.logger.error(f'SupervisorProxy.stop_process: failed to stop process {namespec} on {identifier}')
 
     def restart(self, identifier: str) -> None:
         """ Restart a Supervisor instance asynchronously. """
         try:
-            proxy = getRPCInterface(self.srv_url.env)
-            proxy.supervisor.restart()
+            self.remote_call(identifier, 'supervisor.restart')
         except SupervisorProxy.RpcExceptions:
             self.logger.error(f'SupervisorProxy.restart: failed to restart node {identifier}')
+        # the remote Supervisor is about to close its connections, so do not keep the XML-RPC client
+        self.close_proxy(identifier)
 
     def shutdown(self, identifier: str) -> None:
         """ Shutdown a Supervisor instance asynchronously. """
         try:
-            proxy = getRPCInterface(self.srv_url.env)
-            proxy.supervisor.shutdown()
+            self.remote_call(identifier, 'supervisor.shutdown')
         except SupervisorProxy.RpcExceptions:
             self.logger.error(f'SupervisorProxy.shutdown: failed to shutdown node {identifier}')
+        # the remote Supervisor is about to close its connections, so do not keep the XML-RPC client
+        self.close_proxy(identifier)
 
     def restart_sequence(self, identifier: str) -> None:
         """ Ask the Supvisors Master to trigger the DEPLOYMENT phase. """
         try:
-            proxy = getRPCInterface(self.srv_url.env)
-            proxy.supvisors.restart_sequence()
+            self.remote_call(identifier, 'supvisors.restart_sequence')
         except SupervisorProxy.RpcExceptions:
             self.logger.error('SupervisorProxy.restart_sequence: failed to send Supvisors restart_sequence'
                               f' to Master {identifier}')
@@ -250,8 +486,7 @@ class SupervisorProxy(threading.Thread):
     def restart_all(self, identifier: str) -> None:
         """ Ask the Supvisors Master to restart Supvisors. """
         try:
-            proxy = getRPCInterface(self.srv_url.env)
-            proxy.supvisors.restart()
+            self.remote_call(identifier, 'supvisors.restart')
         except SupervisorProxy.RpcExceptions:
             self.logger.error('SupervisorProxy.restart_all: failed to send Supvisors restart'
                               f' to Master {identifier}')
@@ -259,16 +494,25 @@ class SupervisorProxy(threading.Thread):
     def shutdown_all(self, identifier: str) -> None:
         """ Ask the Supvisors Master to shut down Supvisors. """
         try:
-            proxy = getRPCInterface(self.srv_url.env)
-            proxy.supvisors.shutdown()
+            self.remote_call(identifier, 'supvisors.shutdown')
         except SupervisorProxy.RpcExceptions:
             self.logger.error('SupervisorProxy.shutdown_all: failed to send Supvisors shutdown'
                               f' to Master {identifier}')
 
-    def send_remote_comm_event(self, event_data) -> None:
-        """ Perform the Supervisor sendRemoteCommEvent. """
+    def send_remote_comm_event(self, event_data: List) -> None:
+        """ Perform the Supervisor sendRemoteCommEvent.
+
+        :param event_data: the list of events to send to Supervisor
+        :return: None
+        """
+        payload = json_dumps(event_data)
         try:
-            self.proxy.supervisor.sendRemoteCommEvent(SUPVISORS, json.dumps(event_data))
+            try:
+                self.proxy.supervisor.sendRemoteCommEvent(SUPVISORS, payload)
+            except SupervisorProxy.StaleConnectionExceptions:
+                # the persistent connection may have been closed by the local Supervisor: retry on a new connection
+                self.proxy('close')()
+                self.proxy.supervisor.sendRemoteCommEvent(SUPVISORS, payload)
         except SupervisorProxy.RpcExceptions:
             # expected on restart / shutdown
             self.logger.error(f'SupervisorProxy.send_remote_comm_event: failed to send to Supervisor {event_data}')
@@ -322,7 +566,7 @@ class SupvisorsMainLoop(threading.Thread):
         self.logger.info('SupvisorsMainLoop.run: entering main loop')
         self.proxy.start()
         # assign a new asynchronous event loop to this thread
-        async_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        async_loop: asyncio.AbstractEventLoop = create_event_loop()
         asyncio.set_event_loop(async_loop)
         # create the asyncio object that will receive all events
         self.receiver = SupvisorsInternalReceiver(async_loop, self.supvisors)
@@ -356,18 +600,21 @@ class SupvisorsMainLoop(threading.Thread):
 
     async def check_remote_event(self, message):
         """ Transfer the message to the Supervisor thread. """
-        self.logger.trace(f'SupvisorsMainLoop.check_remote_event: message={message}')
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'SupvisorsMainLoop.check_remote_event: message={message}')
         self.proxy.push_event(message)
 
     async def check_discovery_event(self, message):
         """ Transfer the message to the Supervisor thread. """
-        self.logger.trace(f'SupvisorsMainLoop.check_discovery_event: message={message}')
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'SupvisorsMainLoop.check_discovery_event: message={message}')
         self.proxy.push_event(message)
 
     async def check_requests(self, message) -> None:
         """ Defer internal requests. """
         header, body = message
-        self.logger.debug(f'SupvisorsMainLoop.check_requests: header={header} body={body}')
+        if LevelsByName.DEBG >= self.logger.level:
+            self.logger.debug(f'SupvisorsMainLoop.check_requests: header={header} body={body}')
         deferred_request = DeferredRequestHeaders(header)
         # check publication event or deferred request
         if deferred_request == DeferredRequestHeaders.ISOLATE_INSTANCES:
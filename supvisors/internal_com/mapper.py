@@ -27,17 +27,34 @@ from supervisor.loggers import Logger
 from supvisors.ttypes import NameList, NameSet
 
 
-def get_addresses(host_id: str, logger: Logger) -> Optional[Tuple[str, NameList, NameList]]:
+# annotation types
+HostAddresses = Tuple[str, NameList, NameList]
+HostResolutions = Dict[str, HostAddresses]
+
+
+def get_addresses(host_id: str, logger: Logger,
+                  resolutions: Optional[HostResolutions] = None) -> Optional[HostAddresses]:
     """ Get hostname, aliases and all IP addresses for the host_id.
+    The successful resolutions are stored in resolutions, if provided, so that the hosts declaring
+    many Supvisors instances are resolved only once. The failures are not stored.
 
     :param host_id: the host_name used in the Supvisors option
     :param logger: the Supvisors logger
+    :param resolutions: the host resolutions already done, if any
     :return: the list of possible node name or IP addresses
     """
-    try:
-        return gethostbyaddr(host_id)  # hostname, aliases, ip_addresses
-    except (herror, gaierror):
-        logger.error(f'get_addresses: unknown address {host_id}')
+    addresses = resolutions.get(host_id) if resolutions is not None else None
+    if addresses is None:
+        try:
+            addresses = gethostbyaddr(host_id)  # hostname, aliases, ip_addresses
+        except (herror, gaierror):
+            logger.error(f'get_addresses: unknown address {host_id}')
+            return None
+        if resolutions is not None:
+            resolutions[host_id] = addresses
+    # the lists are copied so that they are not shared between Supvisors instances
+    host_name, aliases, ip_addresses = addresses
+    return host_name, list(aliases), list(ip_addresses)
 
 
 class SupvisorsInstanceId:
@@ -59,10 +76,12 @@ class SupvisorsInstanceId:
     PATTERN = re.compile(r'^(<(?P<identifier>[\w\-:]+)>)?(?P<host>[\w\-.]+)(:(?P<http_port>\d{4,5})?'
                          r':(?P<internal_port>\d{4,5})?)?$')
 
-    def __init__(self, item: str, supvisors: Any):
+    def __init__(self, item: str, supvisors: Any, resolutions: Optional[HostResolutions] = None):
         """ Initialization of the attributes.
 
         :param item: the Supervisor parameters to be parsed
+        :param supvisors: the global Supvisors structure
+        :param resolutions: the host resolutions already done, if any
         """
         self.supvisors = supvisors
         self.logger: Logger = supvisors.logger
@@ -82,7 +101,7 @@ class SupvisorsInstanceId:
         self.aliases = None
         self.ip_addresses = None
         if self.host_id:
-            addresses = get_addresses(self.host_id, self.logger)
+            addresses = get_addresses(self.host_id, self.logger, resolutions)
             if addresses:
                 self.host_name, self.aliases, self.ip_addresses = addresses
                 self.logger.debug(f'SupvisorsInstanceId: host_id={self.host_id} host_name={self.host_name}'
@@ -233,14 +252,16 @@ class SupvisorsMapper:
         """
         return self.filter(self._core_identifiers)
 
-    def add_instance(self, item: str, discovery: bool = True) -> SupvisorsInstanceId:
+    def add_instance(self, item: str, discovery: bool = True,
+                     resolutions: Optional[HostResolutions] = None) -> SupvisorsInstanceId:
         """ Store a new Supvisors instance using a format compliant with the supvisors_list option.
 
         :param item: the Supvisors instance to add
         :param discovery: if True, instances are not statically declared in the configuration file and added on-the-fly
+        :param resolutions: the host resolutions already done, if any
         :return: the new Supvisors instance
         """
-        supvisors_id = SupvisorsInstanceId(item, self.supvisors)
+        supvisors_id = SupvisorsInstanceId(item, self.supvisors, resolutions)
         if supvisors_id.ip_address:
             if discovery:
                 self.logger.info(f'SupvisorsMapper.add_instance: new SupvisorsInstanceId={supvisors_id}')
@@ -261,8 +282,11 @@ class SupvisorsMapper:
         """
         if supvisors_list:
             # get Supervisor identification from each element
+            # the host resolutions are shared only during this configuration load, so that the instances added later
+            # in discovery mode get a fresh resolution
+            resolutions: HostResolutions = {}
             for item in supvisors_list:
-                self.add_instance(item, False)
+                self.add_instance(item, False, resolutions)
             # keep information about the initial Supvisors identifiers added to the configuration
             self.initial_identifiers = list(self._instances.keys())
         else:
@@ -36,6 +36,9 @@ from .mapper import SupvisorsInstanceId
 HEARTBEAT_PERIOD = 2
 HEARTBEAT_TIMEOUT = 10
 
+# limit the number of simultaneous connection attempts to the remote publishers
+MAX_CONNECTION_ATTEMPTS = 32
+
 
 # Publisher part
 class SubscriberClient:
@@ -285,17 +288,19 @@ class InternalAsyncSubscriber:
 
     def __init__(self, instance_id: SupvisorsInstanceId,
                  queue: asyncio.Queue, stop_event: asyncio.Event,
-                 logger: Logger):
+                 connection_semaphore: asyncio.Semaphore, logger: Logger):
         """ Initialization of the attributes.
 
         :param instance_id: the identification structure of the publisher to connect.
         :param queue: the queue used to push the messages received.
         :param stop_event: the flag to stop the task.
+        :param connection_semaphore: the semaphore bounding the simultaneous connection attempts.
         :param logger: the Supvisors logger.
         """
         self.instance_id: SupvisorsInstanceId = instance_id
         self.queue: asyncio.Queue = queue
         self.stop_event: asyncio.Event = stop_event
+        self.connection_semaphore: asyncio.Semaphore = connection_semaphore
         self.logger: Logger = logger
 
     @property
@@ -331,7 +336,10 @@ class InternalAsyncSubscriber:
         self.logger.debug(f'InternalAsyncSubscriber.handle_subscriber: connecting to {self.identifier}'
                           f' at {self.ip_address}:{self.port}')
         # connect the publisher
-        reader, writer = await asyncio.wait_for(asyncio.open_connection(self.ip_address, self.port), ASYNC_TIMEOUT)
+        # NOTE: only the connection attempt is bounded, as the established connections are all needed
+        async with self.connection_semaphore:
+            reader, writer = await asyncio.wait_for(asyncio.open_connection(self.ip_address, self.port),
+                                                    ASYNC_TIMEOUT)
         # the publisher is connected
         self.logger.info(f'InternalAsyncSubscriber.handle_subscriber: {self.identifier} connected')
         peer_name = writer.get_extra_info('peername')
@@ -405,6 +413,8 @@ class InternalAsyncSubscribers:
         self.global_stop_event: asyncio.Event = stop_event
         # create a stop event per subscriber to enable selective stop
         self.stop_events: Dict[str, asyncio.Event] = {}
+        # bound the simultaneous connection attempts in large clusters
+        self.connection_semaphore: asyncio.Semaphore = asyncio.Semaphore(MAX_CONNECTION_ATTEMPTS)
 
     def get_coroutines(self) -> List:
         """ Return the subscriber tasks:
@@ -428,7 +438,8 @@ class InternalAsyncSubscribers:
         instance_id = self.supvisors.mapper.instances.get(identifier)
         if instance_id:
             self.stop_events[identifier] = stop_event = asyncio.Event()
-            subscriber = InternalAsyncSubscriber(instance_id, self.queue, stop_event, self.supvisors.logger)
+            subscriber = InternalAsyncSubscriber(instance_id, self.queue, stop_event,
+                                                 self.connection_semaphore, self.supvisors.logger)
             return subscriber.auto_connect()
 
     async def check_stop(self):
@@ -20,6 +20,7 @@
 import asyncio
 from enum import Enum
 from socket import socket
+from typing import List, Optional
 
 from supervisor.loggers import Logger
 
@@ -40,7 +41,8 @@ class RequestPusher:
 
     Attributes:
         - logger: a reference to the Supvisors logger ;
-        - socket: the push socket.
+        - socket: the push socket ;
+        - batch_buffers: the messages gathered in the current batch, or None if no batch is in progress.
     """
 
     def __init__(self, sock: socket, logger: Logger) -> None:
@@ -51,9 +53,32 @@ class RequestPusher:
         """
         self.logger = logger
         self.socket = sock
+        self.batch_buffers: Optional[List[bytes]] = None
+
+    def start_batch(self) -> None:
+        """ Gather the next messages instead of sending them, until send_batch is called.
+
+        :return: None
+        """
+        if self.batch_buffers is None:
+            self.batch_buffers = []
+
+    def send_batch(self) -> None:
+        """ Send all the messages gathered since start_batch using a single socket call.
+        As the messages are framed with their size, the puller reads them one by one as usual.
+
+        :return: None
+        """
+        buffers, self.batch_buffers = self.batch_buffers, None
+        if buffers:
+            try:
+                self.socket.sendall(b''.join(buffers))
+            except OSError:
+                self.logger.error(f'RequestPusher.send_batch: failed to send {len(buffers)} messages')
 
     def push_message(self, *event) -> None:
         """ Serialize the event and send it to the socket.
+        If a batch is in progress, the message is kept until the batch is sent.
 
         :param event: the event to send, as a tuple
         :return: None
@@ -61,6 +86,9 @@ class RequestPusher:
         # format the event into a message
         message = payload_to_bytes(*event)
         buffer = len(message).to_bytes(4, 'big') + message
+        if self.batch_buffers is not None:
+            self.batch_buffers.append(buffer)
+            return
         # send the message bytes
         try:
             self.socket.sendall(buffer)
@@ -412,15 +412,26 @@ class SupervisorListener(object):
         try:
             self.logger.trace(f'SupervisorListener.on_remote_event: got RemoteCommunicationEvent {event.type}'
                               f' / {event.data}')
-            if event.type == SUPVISORS:
-                self.unstack_event(event.data)
+            # the Supvisors thread sends the events in batches
+            messages = json.loads(event.data) if event.type == SUPVISORS else []
         except Exception:
             # Supvisors shall never endanger the Supervisor thread
             self.logger.critical(f'SupervisorListener.on_remote_event: {format_exc()}')
+            return
+        for message in messages:
+            try:
+                self.unstack_event(message)
+            except Exception:
+                # Supvisors shall never endanger the Supervisor thread
+                self.logger.critical(f'SupervisorListener.on_remote_event: {format_exc()}')
+
+    def unstack_event(self, message) -> None:
+        """ Unstack and process one event from the event queue.
 
-    def unstack_event(self, message: str) -> None:
-        """ Unstack and process one event from the event queue. """
-        event_address, (event_type, (event_identifier, event_data)) = json.loads(message)
+        :param message: the decoded event
+        :return: None
+        """
+        event_address, (event_type, (event_identifier, event_data)) = message
         header = InternalEventHeaders(event_type)
         # Note: DISCOVERY messages contain the necessary information for Supvisors instances discovery,
         #  so it has to be processed first
@@ -441,7 +452,13 @@ class SupervisorListener(object):
         elif header == InternalEventHeaders.AUTHORIZATION:
             self.logger.trace(f'SupervisorListener.unstack_event: got AUTHORIZATION from {event_identifier}:'
                               f' {event_data}')
-            self.fsm.on_authorization(event_identifier, event_data)
+            authorized, state_modes, all_info = event_data
+            # states / modes and process information are provided along with the authorization result
+            if state_modes is not None:
+                self.fsm.on_state_event(event_identifier, state_modes)
+            if all_info is not None:
+                self.fsm.on_process_info(event_identifier, all_info)
+            self.fsm.on_authorization(event_identifier, authorized)
         elif header == InternalEventHeaders.PROCESS:
             self.logger.trace(f'SupervisorListener.unstack_event: got PROCESS from {event_identifier}:'
                               f' {event_data}')
@@ -472,10 +489,6 @@ class SupervisorListener(object):
             self.logger.trace(f'SupervisorListener.unstack_event: got STATE from {event_identifier}:'
                               f' {event_data}')
             self.fsm.on_state_event(event_identifier, event_data)
-        elif header == InternalEventHeaders.ALL_INFO:
-            self.logger.trace(f'SupervisorListener.unstack_event: got ALL_INFO from {event_identifier}:'
-                              f' {event_data}')
-            self.fsm.on_process_info(event_identifier, event_data)
 
     def on_host_statistics(self, identifier: str, event_data: Payload) -> None:
         """ Compile the host statistics received from the Supvisors instance.
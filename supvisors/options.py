@@ -28,7 +28,7 @@ from supervisor.loggers import Logger
 from supervisor.options import expand, ServerOptions, ProcessConfig, FastCGIProcessConfig, EventListenerConfig
 
 from .ttypes import (ConciliationStrategies, EventLinks, StartingStrategies, SynchronizationOptions,
-                     Ipv4Address, Payload, StatisticsTypes)
+                     Ipv4Address, NameList, Payload, StatisticsTypes)
 
 
 # Options of main section
@@ -521,6 +521,7 @@ class SupvisorsServerOptions(ServerOptions):
         - program_class: the Supervisor class type of the program among {ProcessConfig, FastCGIProcessConfig,
           EventListenerConfig} ;
         - program_processes: for each program, the group names using it and the corresponding process configurations ;
+        - program_numprocs: the current numprocs of each program ;
         - process_programs: the program associated to each process (key is a process name, not a namespec) ;
         - process_indexes: the index of each process (key is a process name, not a namespec), so numprocs_start
           has no impact on the number.
@@ -542,6 +543,7 @@ class SupvisorsServerOptions(ServerOptions):
         self.parser = None
         self.program_class: SupvisorsServerOptions.ProcessClassInfo = {}
         self.program_processes: SupvisorsServerOptions.ProcessGroupInfo = {}
+        self.program_numprocs: Dict[str, int] = {}
         self.processes_program: Dict[str, str] = {}
         self.process_indexes: Dict[str, int] = {}
 
@@ -565,6 +567,7 @@ class SupvisorsServerOptions(ServerOptions):
         program_name = section.split(':', 1)[1]
         program_groups = self.program_processes.setdefault(program_name, {})
         program_groups[group_name] = process_configs
+        self.program_numprocs[program_name] = len(process_configs)
         # store the program class type
         self.program_class[program_name] = klass
         # store the number and the program of each process
@@ -598,14 +601,16 @@ class SupvisorsServerOptions(ServerOptions):
         section = self.get_section(program_name)
         self.logger.debug(f'SupvisorsServerOptions.update_numprocs: update parser section={section}')
         self.parser[section]['numprocs'] = str(numprocs)
+        self.program_numprocs[program_name] = numprocs
         return section
 
-    def reload_processes_from_section(self, section: str, group_name: str) -> List[ProcessConfig]:
-        """ This method rebuilds the ProcessConfig instances for the program.
+    def reload_processes_from_section(self, section: str, group_names: NameList) -> ProcessConfigInfo:
+        """ This method rebuilds the ProcessConfig instances for the program, in all the groups that embed it.
+        The stored procnumbers are reset once for all groups before the section is parsed again for each group.
 
         :param section: the program section in the configuration files
-        :param group_name: the group that embeds the program definition
-        :return: the list of ProcessConfig
+        :param group_names: the groups that embed the program definition
+        :return: the list of ProcessConfig per group
         """
         # reset corresponding stored procnumbers
         program_name = section.split(':')[1]
@@ -614,5 +619,8 @@ class SupvisorsServerOptions(ServerOptions):
                 self.processes_program.pop(process.name, None)
                 self.process_indexes.pop(process.name, None)
         # call parser again
+        # WARN: the process configurations cannot be shared between groups as the group name may be used
+        #  in the expansions of the section
         klass = self.program_class[program_name]
-        return self.processes_from_section(self.parser, section, group_name, klass)
+        return {group_name: self.processes_from_section(self.parser, section, group_name, klass)
+                for group_name in group_names}
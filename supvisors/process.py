@@ -376,9 +376,10 @@ class ProcessStatus:
 
         :return: the process status in a dictionary
         """
+        displayed_state = self.displayed_state
         return {'application_name': self.application_name,
                 'process_name': self.process_name,
-                'statecode': self.displayed_state, 'statename': self.displayed_state_string(),
+                'statecode': displayed_state, 'statename': getProcessStateDescription(displayed_state),
                 'expected_exit': self.expected_exit,
                 'last_event_time': self.last_event_time,
                 'identifiers': list(self.running_identifiers),
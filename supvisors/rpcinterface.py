@@ -36,6 +36,17 @@ version_txt = os.path.join(here, 'version.txt')
 with open(version_txt, 'r') as ver:
     API_VERSION = ver.read().split('=')[1].strip()
 
+# Supvisors states allowing the RPCs, built once rather than on every RPC
+INITIALIZATION_STATES = [SupvisorsStates.INITIALIZATION]
+FROM_DEPLOYMENT_STATES = [SupvisorsStates.DEPLOYMENT, SupvisorsStates.OPERATION, SupvisorsStates.CONCILIATION,
+                          SupvisorsStates.RESTARTING, SupvisorsStates.SHUTTING_DOWN]
+OPERATING_CONCILIATION_STATES = [SupvisorsStates.OPERATION, SupvisorsStates.CONCILIATION]
+OPERATING_STATES = [SupvisorsStates.OPERATION]
+CONCILIATION_STATES = [SupvisorsStates.CONCILIATION]
+
+# program options taken from Supervisor internal model and added to the local process information
+LOCAL_OPTION_NAMES = 'startsecs', 'stopwaitsecs', 'extra_args', 'disabled'
+
 
 def startProcess(self, name: str, wait: bool = True):
     """ Overridden startProcess to handle a disabled process.
@@ -124,8 +135,8 @@ class RPCInterface(object):
         :return: a list of structures containing information about all **Supvisors** instances.
         :rtype: list[dict[str, Any]]
         """
-        return [self.get_instance_info(identifier)
-                for identifier in sorted(self.supvisors.context.instances)]
+        instances = self.supvisors.context.instances
+        return [instances[identifier].serial() for identifier in sorted(instances)]
 
     def get_instance_info(self, identifier: str) -> Payload:
         """ Get information about the **Supvisors** instance identified by ``identifier``.
@@ -153,8 +164,7 @@ class RPCInterface(object):
             ``INITIALIZATION`` state.
         """
         self._check_from_deployment()
-        return [self.get_application_info(application_name)
-                for application_name in self.supvisors.context.applications.keys()]
+        return [application.serial() for application in self.supvisors.context.applications.values()]
 
     def get_application_info(self, application_name: str) -> Payload:
         """ Get information about an application named ``application_name``.
@@ -222,9 +232,12 @@ class RPCInterface(object):
         :return: a list of structures containing information about the processes.
         :rtype: list[dict[str, Any]]
         """
-        supervisor_intf = self.supvisors.supervisor_data.supervisor_rpc_interface
-        all_info = supervisor_intf.getAllProcessInfo()
-        return [self._get_local_info(info) for info in all_info]
+        supervisor_data = self.supvisors.supervisor_data
+        all_info = supervisor_data.supervisor_rpc_interface.getAllProcessInfo()
+        # get the program options of all processes at once
+        all_options = supervisor_data.get_all_process_config_options(LOCAL_OPTION_NAMES)
+        get_local_info = self._get_local_info
+        return [get_local_info(info, all_options[make_namespec(info['group'], info['name'])]) for info in all_info]
 
     def get_local_process_info(self, namespec: str) -> Payload:
         """ Get local information about a process named ``namespec``.
@@ -252,9 +265,10 @@ class RPCInterface(object):
         """
         self._check_from_deployment()
         application, process = self._get_application_process(namespec)
+        get_rules = self._get_internal_process_rules
         if process:
-            return [self._get_internal_process_rules(process)]
-        return [self._get_internal_process_rules(proc) for proc in application.processes.values()]
+            return [get_rules(process)]
+        return [get_rules(proc) for proc in application.processes.values()]
 
     def get_conflicts(self) -> PayloadList:
         """ Get the conflicting processes among the managed applications.
@@ -292,7 +306,7 @@ class RPCInterface(object):
         self._check_operating()
         strategy_enum = self._get_starting_strategy(strategy)
         # check application is known
-        if application_name not in self.supvisors.context.applications.keys():
+        if application_name not in self.supvisors.context.applications:
             raise RPCError(Faults.BAD_NAME, application_name)
         # check application is managed
         if application_name not in self.supvisors.context.get_managed_applications():
@@ -338,7 +352,7 @@ class RPCInterface(object):
         self.logger.trace(f'RPCInterface.stop_application: application={application_name} wait={wait}')
         self._check_operating_conciliation()
         # check application is known
-        if application_name not in self.supvisors.context.applications.keys():
+        if application_name not in self.supvisors.context.applications:
             raise RPCError(Faults.BAD_NAME, application_name)
         # check application is managed
         if application_name not in self.supvisors.context.get_managed_applications():
@@ -401,11 +415,13 @@ class RPCInterface(object):
             def onwait() -> RPCInterface.OnWaitReturnType:
                 # stopping phase
                 if onwait.waitstop:
-                    if not self.supvisors.stopper.in_progress():
-                        self.logger.debug(f'RPCInterface.restart_application: stopping {application_name} completed')
-                        onwait.waitstop = False
-                    return NOT_DONE_YET
+                    if self.supvisors.stopper.in_progress():
+                        return NOT_DONE_YET
+                    self.logger.debug(f'RPCInterface.restart_application: stopping {application_name} completed')
+                    onwait.waitstop = False
                 # starting phase
+                # the Stopper triggers the pending starts as soon as its jobs are completed,
+                # so there is no need to wait for another poll to check the Starter
                 if self.supvisors.starter.in_progress():
                     return NOT_DONE_YET
                 self.logger.debug(f'RPCInterface.restart_application: starting {application_name} completed')
@@ -486,7 +502,8 @@ class RPCInterface(object):
         strategy_enum = self._get_starting_strategy(strategy)
         # check names
         application, process = self._get_application_process(namespec)
-        processes = [process] if process else application.processes.values()
+        # freeze the process list so that the deferred function does not depend on later changes of the application
+        processes = [process] if process else list(application.processes.values())
         # check processes are not already running
         for process in processes:
             if process.running():
@@ -541,7 +558,7 @@ class RPCInterface(object):
         processes = self.supvisors.context.find_runnable_processes(regex)
         namespec = next((process.namespec for process in processes
                          if get_supvisors_instance(self.supvisors, strategy_enum, process.possible_identifiers(),
-                                                   process.rules.expected_load)), None)
+                                                   process.rules.expected_load, True)), None)
         if not namespec:
             raise RPCError(Faults.BAD_NAME, f'no candidate process matching "{regex}"')
         # start the chosen one and return its namespec
@@ -570,7 +587,7 @@ class RPCInterface(object):
         self._check_operating_conciliation()
         # check names
         application, process = self._get_application_process(namespec)
-        processes = [process] if process else application.processes.values()
+        processes = [process] if process else list(application.processes.values())
         # stop all processes
         for process in processes:
             self.logger.debug(f'RPCInterface.stop_process: stopping process={process.namespec}')
@@ -627,7 +644,7 @@ class RPCInterface(object):
         strategy_enum = self._get_starting_strategy(strategy)
         # check namespec
         application, process = self._get_application_process(namespec)
-        processes = [process] if process else application.processes.values()
+        processes = [process] if process else list(application.processes.values())
         # restart all processes
         for process in processes:
             self.logger.debug(f'RPCInterface.restart_process: restarting process={process.namespec}')
@@ -642,11 +659,13 @@ class RPCInterface(object):
             def onwait() -> RPCInterface.OnWaitReturnType:
                 # stopping phase
                 if onwait.waitstop:
-                    if not self.supvisors.stopper.in_progress():
-                        self.logger.debug(f'RPCInterface.restart_process: stopping {namespec} completed')
-                        onwait.waitstop = False
-                    return NOT_DONE_YET
+                    if self.supvisors.stopper.in_progress():
+                        return NOT_DONE_YET
+                    self.logger.debug(f'RPCInterface.restart_process: stopping {namespec} completed')
+                    onwait.waitstop = False
                 # starting phase
+                # the Stopper triggers the pending starts as soon as its jobs are completed,
+                # so there is no need to wait for another poll to check the Starter
                 if self.supvisors.starter.in_progress():
                     return NOT_DONE_YET
                 self.logger.debug(f'RPCInterface.restart_process: starting {namespec} completed')
@@ -983,7 +1002,7 @@ class RPCInterface(object):
             ``Faults.BAD_NAME`` if master is an unknown Supvisors identifier ;
             ``Faults.NOT_RUNNING`` if the selected Master Supvisors instance is not in state ``RUNNING``.
         """
-        self._check_state([SupvisorsStates.INITIALIZATION])
+        self._check_state(INITIALIZATION_STATES)
         if self.supvisors.context.master_identifier:
             raise RPCError(SupvisorsFaults.BAD_SUPVISORS_STATE, 'Supvisors synchronization ending')
         if SynchronizationOptions.USER not in self.supvisors.options.synchro_options:
@@ -1086,29 +1105,28 @@ class RPCInterface(object):
 
     def _check_from_deployment(self) -> None:
         """ Raises a SupvisorsFaults.BAD_SUPVISORS_STATE exception if Supvisors' state is in INITIALIZATION. """
-        self._check_state([SupvisorsStates.DEPLOYMENT,
-                           SupvisorsStates.OPERATION, SupvisorsStates.CONCILIATION,
-                           SupvisorsStates.RESTARTING, SupvisorsStates.SHUTTING_DOWN])
+        self._check_state(FROM_DEPLOYMENT_STATES)
 
     def _check_operating_conciliation(self) -> None:
         """ Raises a SupvisorsFaults.BAD_SUPVISORS_STATE exception if Supvisors' state is NOT in OPERATION or
         CONCILIATION. """
-        self._check_state([SupvisorsStates.OPERATION, SupvisorsStates.CONCILIATION])
+        self._check_state(OPERATING_CONCILIATION_STATES)
 
     def _check_operating(self) -> None:
         """ Raises a SupvisorsFaults.BAD_SUPVISORS_STATE exception if Supvisors' state is NOT in OPERATION. """
-        self._check_state([SupvisorsStates.OPERATION])
+        self._check_state(OPERATING_STATES)
 
     def _check_conciliation(self) -> None:
-        """ Raises a SupvisorsFaults.BAD_SUPVISORS_STATE exception if Supvisors' state is NOT in OPERATION. """
-        self._check_state([SupvisorsStates.CONCILIATION])
+        """ Raises a SupvisorsFaults.BAD_SUPVISORS_STATE exception if Supvisors' state is NOT in CONCILIATION. """
+        self._check_state(CONCILIATION_STATES)
 
     def _check_state(self, states) -> None:
         """ Raises a SupvisorsFaults.BAD_SUPVISORS_STATE exception if Supvisors' state is NOT in one of the states. """
-        if self.supvisors.fsm.state not in states:
+        fsm_state = self.supvisors.fsm.state
+        if fsm_state not in states:
             raise RPCError(SupvisorsFaults.BAD_SUPVISORS_STATE.value,
-                           f'Supvisors (state={self.supvisors.fsm.state.name}) not in state'
-                           f' {[state.name for state in states]} to perform request')
+                           f'Supvisors (state={SupvisorsStateNames[fsm_state]}) not in state'
+                           f' {[SupvisorsStateNames[state] for state in states]} to perform request')
 
     def _get_application_process(self, namespec):
         """ Return the ApplicationStatus and ProcessStatus corresponding to the namespec.
@@ -1121,22 +1139,22 @@ class RPCInterface(object):
     def _get_application(self, application_name):
         """ Return the ApplicationStatus corresponding to the application name.
         A BAD_NAME exception is raised if the application is not found. """
-        try:
-            return self.supvisors.context.applications[application_name]
-        except KeyError:
+        application = self.supvisors.context.applications.get(application_name)
+        if application is None:
             message = f'application {application_name} unknown to Supvisors'
             self.logger.error(f'RPCInterface._get_application: {message}')
             raise RPCError(Faults.BAD_NAME, message)
+        return application
 
     def _get_process(self, application: ApplicationStatus, process_name: str):
         """ Return the ProcessStatus corresponding to process_name in application.
         A BAD_NAME exception is raised if the process is not found. """
-        try:
-            return application.processes[process_name]
-        except KeyError:
+        process = application.processes.get(process_name)
+        if process is None:
             message = f'process={process_name} unknown in application={application.application_name}'
             self.logger.error(f'RPCInterface._get_process: {message}')
             raise RPCError(Faults.BAD_NAME, message)
+        return process
 
     @staticmethod
     def _get_internal_process_rules(process):
@@ -1145,17 +1163,18 @@ class RPCInterface(object):
         result.update({'application_name': process.application_name, 'process_name': process.process_name})
         return result
 
-    def _get_local_info(self, info):
-        """ Create a payload from Supervisor process info. """
+    def _get_local_info(self, info, options: Payload = None):
+        """ Create a payload from Supervisor process info.
+        The program options are got from the Supervisor internal model if not provided. """
         sub_info = extract_process_info(info)
         # transform now from int to float
         sub_info['now'] *= 1.0
         # add program-related information for internal purpose
         # add startsecs, stopwaitsecs and extra_args values taken from Supervisor internal model
         process_name = info['name']
-        namespec = make_namespec(info['group'], process_name)
-        option_names = 'startsecs', 'stopwaitsecs', 'extra_args', 'disabled'
-        options = self.supvisors.supervisor_data.get_process_config_options(namespec, option_names)
+        if options is None:
+            namespec = make_namespec(info['group'], process_name)
+            options = self.supvisors.supervisor_data.get_process_config_options(namespec, LOCAL_OPTION_NAMES)
         sub_info.update(options)
         # add program and process_index taken from SupvisorsServerOptions
         srv_options = self.supvisors.server_options
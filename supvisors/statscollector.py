@@ -19,6 +19,7 @@
 
 import multiprocessing as mp
 import os
+import queue
 import signal
 from enum import Enum
 from time import sleep, time
@@ -264,8 +265,12 @@ def collect_process_statistics(pid_queue: mp.Queue, stats_queue: mp.Queue, perio
     stopped = False
     while not stopped:
         # get new pids to collect statistics from
-        while not pid_queue.empty():
-            msg_type, msg_body = pid_queue.get()
+        # NOTE: get_nowait is used until the queue is empty to avoid polling the pipe twice per message
+        while True:
+            try:
+                msg_type, msg_body = pid_queue.get_nowait()
+            except queue.Empty:
+                break
             if msg_type == StatsMsgType.STOP:
                 stopped = True
             elif msg_type == StatsMsgType.ALIVE:
@@ -324,8 +329,12 @@ class ProcessStatisticsCollector:
     def get_process_stats(self) -> PayloadList:
         """ Get all process statistics available. """
         proc_stats = []
-        while not self.stats_queue.empty():
-            proc_stats.append(self.stats_queue.get())
+        get_nowait = self.stats_queue.get_nowait
+        try:
+            while True:
+                proc_stats.append(get_nowait())
+        except queue.Empty:
+            pass
         return proc_stats
 
     def stop(self):
@@ -57,7 +57,7 @@ def io_statistics(last_values: InterfaceInstantStats, ref_values: InterfaceInsta
     """ Return the rate of receive / sent bytes per second per network interface. """
     io_stats = {}
     for intf, (last_recv, last_sent) in last_values.items():
-        if intf in ref_values.keys():
+        if intf in ref_values:
             ref_recv, ref_sent = ref_values[intf]
             # Warning taken from psutil documentation (https://pythonhosted.org/psutil/#network)
             # on some systems such as Linux, on a very busy or long-lived system these numbers may wrap
@@ -17,7 +17,15 @@
 # limitations under the License.
 # ======================================================================
 
-from typing import Any, Dict, List, Optional, Set, Tuple
+import random
+
+from collections import deque
+from functools import reduce
+from itertools import chain
+from math import gcd
+from typing import Any, Callable, Deque, Dict, FrozenSet, Optional, Set, Tuple
+
+from supervisor.loggers import LevelsByName
 
 from supvisors.internal_com.mapper import SupvisorsMapper
 from .application import ApplicationStatus
@@ -47,7 +55,28 @@ class AbstractStartingStrategy(AbstractStrategy):
     # Annotation types
     LoadingValidity = Tuple[bool, int, int]
     LoadingValidityMap = Dict[str, LoadingValidity]
-    IdentifierLoadMap = List[Tuple[str, int, int]]
+
+    def __init__(self, supvisors: Any, instances_load: Optional[LoadMap] = None, check_only: bool = False):
+        """ Initialization of the attributes.
+
+        :param supvisors: the global Supvisors instance
+        :param instances_load: the Supvisors instances load, if already computed for the current request
+        :param check_only: True if the strategy is only used to check that a Supvisors instance can be chosen
+        """
+        AbstractStrategy.__init__(self, supvisors)
+        self.instances_load: LoadMap = instances_load or {}
+        self.check_only: bool = check_only
+
+    def get_instance_load(self, identifier: str) -> int:
+        """ Return the load of the Supvisors instance, computed only once per strategy.
+
+        :param identifier: the identifier of the Supvisors instance
+        :return: the load of the Supvisors instance
+        """
+        load = self.instances_load.get(identifier)
+        if load is None:
+            load = self.instances_load[identifier] = self.supvisors.context.instances[identifier].get_load()
+        return load
 
     def is_loading_valid(self, identifier: str, expected_load: int, load_details: LoadDetails) -> LoadingValidity:
         """ Check if the node hosting the Supvisors instance can support the additional load.
@@ -62,19 +91,20 @@ class AbstractStartingStrategy(AbstractStrategy):
         # node_load_map: the current load per node
         # node_load_request_map: the unconsidered load per node
         load_request_map, node_load_map, node_load_request_map = load_details
-        self.logger.trace(f'AbstractStartingStrategy.is_loading_valid: identifier={identifier}'
-                          f' expected_load={expected_load} load_request_map={load_request_map}'
-                          f' node_load_map={node_load_map} node_load_request_map={node_load_request_map}')
         status = self.supvisors.context.instances[identifier]
-        self.logger.trace(f'AbstractStartingStrategy.is_loading_valid: Supvisors={identifier}'
-                          f' state={status.state.name}')
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'AbstractStartingStrategy.is_loading_valid: Supvisors={identifier}'
+                              f' state={status.state.name} expected_load={expected_load}'
+                              f' load_request_map={load_request_map} node_load_map={node_load_map}'
+                              f' node_load_request_map={node_load_request_map}')
         # calculate the theoretical load on the node
         ip_address = status.supvisors_id.ip_address
         node_loading = node_load_map.get(ip_address, 0) + node_load_request_map.get(ip_address, 0)
         # check if the node and the Supvisors instance can support the
-        instance_loading = status.get_load() + load_request_map.get(identifier, 0)
-        self.logger.debug(f'AbstractStartingStrategy.is_loading_valid: Supvisors={identifier}'
-                          f' instance_loading={instance_loading} expected_load={expected_load}')
+        instance_loading = self.get_instance_load(identifier) + load_request_map.get(identifier, 0)
+        if LevelsByName.DEBG >= self.logger.level:
+            self.logger.debug(f'AbstractStartingStrategy.is_loading_valid: Supvisors={identifier}'
+                              f' instance_loading={instance_loading} expected_load={expected_load}')
         return node_loading + expected_load <= 100, node_loading, instance_loading
 
     def get_loading_and_validity(self, identifiers: NameList, expected_load: int,
@@ -88,34 +118,58 @@ class AbstractStartingStrategy(AbstractStrategy):
         """
         loading_validity_map = {identifier: self.is_loading_valid(identifier, expected_load, load_details)
                                 for identifier in identifiers}
-        self.logger.trace(f'AbstractStartingStrategy.get_loading_and_validity:'
-                          f' loading_validity_map={loading_validity_map}')
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'AbstractStartingStrategy.get_loading_and_validity:'
+                              f' loading_validity_map={loading_validity_map}')
         return loading_validity_map
 
-    def sort_valid_by_instance_load(self, loading_validity_map: LoadingValidityMap) -> IdentifierLoadMap:
-        """ Sort the loading report by instance load and considering only valid identifiers.
+    @staticmethod
+    def select_valid(loading_validity_map: LoadingValidityMap, key, highest: bool) -> Optional[str]:
+        """ Select the valid identifier having the lowest or the highest loading, without sorting the loading report.
+        In the event of a tie, the first identifier is selected for the lowest loading and the last identifier
+        is selected for the highest loading.
+
+        :param loading_validity_map: the loading report
+        :param key: the function returning the loading to consider from the loading validity
+        :param highest: True if the highest loading is to be selected
+        :return: the selected identifier, or None if no valid identifier
+        """
+        selected_identifier, selected_loading = None, None
+        for identifier, loading_validity in loading_validity_map.items():
+            if loading_validity[0]:
+                loading = key(loading_validity)
+                # when looking for the highest loading, an equal loading replaces the selection (last one wins a tie)
+                if (selected_identifier is None
+                        or (loading >= selected_loading if highest else loading < selected_loading)):
+                    selected_identifier, selected_loading = identifier, loading
+        return selected_identifier
+
+    def select_valid_by_instance_load(self, loading_validity_map: LoadingValidityMap,
+                                      highest: bool = False) -> Optional[str]:
+        """ Select the valid identifier having the lowest or the highest instance load.
         If multiple instances have an equivalent load, the node load is considered.
 
         :param loading_validity_map: the loading report
-        :return: the valid identifiers sorted by instance load
+        :param highest: True if the highest instance load is to be selected
+        :return: the selected identifier, or None if no valid identifier
         """
-        result = sorted([(identifier, node_load, instance_load)
-                         for identifier, (validity, node_load, instance_load) in loading_validity_map.items()
-                         if validity], key=lambda x: (x[2], x[1]))
-        self.logger.trace(f'AbstractStartingStrategy.sort_valid_by_instance_load: result={result}')
+        result = self.select_valid(loading_validity_map, lambda x: (x[2], x[1]), highest)
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'AbstractStartingStrategy.select_valid_by_instance_load: result={result}')
         return result
 
-    def sort_valid_by_node_load(self, loading_validity_map: LoadingValidityMap) -> IdentifierLoadMap:
-        """ Sort the loading report by node load and considering only valid identifiers.
+    def select_valid_by_node_load(self, loading_validity_map: LoadingValidityMap,
+                                  highest: bool = False) -> Optional[str]:
+        """ Select the valid identifier having the lowest or the highest node load.
         If multiple nodes have an equivalent load, the instance load is considered.
 
         :param loading_validity_map: the loading report
-        :return: the valid identifiers sorted by node load
+        :param highest: True if the highest node load is to be selected
+        :return: the selected identifier, or None if no valid identifier
         """
-        result = sorted([(identifier, node_load, instance_load)
-                         for identifier, (validity, node_load, instance_load) in loading_validity_map.items()
-                         if validity], key=lambda x: (x[1], x[2]))
-        self.logger.trace(f'AbstractStartingStrategy.sort_valid_by_node_load: result={result}')
+        result = self.select_valid(loading_validity_map, lambda x: (x[1], x[2]), highest)
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'AbstractStartingStrategy.select_valid_by_node_load: result={result}')
         return result
 
     def get_supvisors_instance(self, identifiers: NameList, expected_load: int,
@@ -146,11 +200,13 @@ class ConfigStrategy(AbstractStartingStrategy):
         :param load_details: the load details per identifier and node
         :return: the chosen identifier
         """
-        self.logger.debug(f'ConfigStrategy.get_supvisors_instance: identifiers={identifiers}'
-                          f' expected_load={expected_load} load_details={load_details}')
-        loading_validity_map = self.get_loading_and_validity(identifiers, expected_load, load_details)
+        if LevelsByName.DEBG >= self.logger.level:
+            self.logger.debug(f'ConfigStrategy.get_supvisors_instance: identifiers={identifiers}'
+                              f' expected_load={expected_load} load_details={load_details}')
         # the first valid element is the right one
-        return next((identifier for identifier, (validity, _, _) in loading_validity_map.items() if validity), None)
+        # the generator stops at the first valid Supvisors instance, so that the next ones are not evaluated
+        return next((identifier for identifier in identifiers
+                     if self.is_loading_valid(identifier, expected_load, load_details)[0]), None)
 
 
 class LessLoadedStrategy(AbstractStartingStrategy):
@@ -166,11 +222,11 @@ class LessLoadedStrategy(AbstractStartingStrategy):
         :param load_details: the load details per identifier and node
         :return: the chosen identifier
         """
-        self.logger.trace(f'LessLoadedStrategy.get_supvisors_instance: identifiers={identifiers}'
-                          f' expected_load={expected_load} load_details={load_details}')
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'LessLoadedStrategy.get_supvisors_instance: identifiers={identifiers}'
+                              f' expected_load={expected_load} load_details={load_details}')
         loading_validity_map = self.get_loading_and_validity(identifiers, expected_load, load_details)
-        sorted_identifiers = self.sort_valid_by_instance_load(loading_validity_map)
-        return sorted_identifiers[0][0] if sorted_identifiers else None
+        return self.select_valid_by_instance_load(loading_validity_map)
 
 
 class LessLoadedNodeStrategy(AbstractStartingStrategy):
@@ -185,11 +241,11 @@ class LessLoadedNodeStrategy(AbstractStartingStrategy):
         :param load_details: the load details per identifier and node
         :return: the chosen identifier
         """
-        self.logger.trace(f'LessLoadedNodeStrategy.get_supvisors_instance: identifiers={identifiers}'
-                          f' expected_load={expected_load} load_details={load_details}')
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'LessLoadedNodeStrategy.get_supvisors_instance: identifiers={identifiers}'
+                              f' expected_load={expected_load} load_details={load_details}')
         loading_validity_map = self.get_loading_and_validity(identifiers, expected_load, load_details)
-        sorted_identifiers = self.sort_valid_by_node_load(loading_validity_map)
-        return sorted_identifiers[0][0] if sorted_identifiers else None
+        return self.select_valid_by_node_load(loading_validity_map)
 
 
 class MostLoadedStrategy(AbstractStartingStrategy):
@@ -205,11 +261,11 @@ class MostLoadedStrategy(AbstractStartingStrategy):
         :param load_details: the load details per identifier and node
         :return: the chosen identifier
         """
-        self.logger.trace(f'MostLoadedStrategy.get_supvisors_instance: identifiers={identifiers}'
-                          f' expected_load={expected_load} load_details={load_details}')
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'MostLoadedStrategy.get_supvisors_instance: identifiers={identifiers}'
+                              f' expected_load={expected_load} load_details={load_details}')
         loading_validity_map = self.get_loading_and_validity(identifiers, expected_load, load_details)
-        sorted_identifiers = self.sort_valid_by_instance_load(loading_validity_map)
-        return sorted_identifiers[-1][0] if sorted_identifiers else None
+        return self.select_valid_by_instance_load(loading_validity_map, True)
 
 
 class MostLoadedNodeStrategy(AbstractStartingStrategy):
@@ -225,11 +281,11 @@ class MostLoadedNodeStrategy(AbstractStartingStrategy):
         :param load_details: the load details per identifier and node
         :return: the list of identifiers corresponding to the Supvisors instances that can support the additional load
         """
-        self.logger.trace(f'MostLoadedNodeStrategy.get_supvisors_instance: identifiers={identifiers}'
-                          f' expected_load={expected_load} load_details={load_details}')
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'MostLoadedNodeStrategy.get_supvisors_instance: identifiers={identifiers}'
+                              f' expected_load={expected_load} load_details={load_details}')
         loading_validity_map = self.get_loading_and_validity(identifiers, expected_load, load_details)
-        sorted_identifiers = self.sort_valid_by_node_load(loading_validity_map)
-        return sorted_identifiers[-1][0] if sorted_identifiers else None
+        return self.select_valid_by_node_load(loading_validity_map, True)
 
 
 class LocalStrategy(AbstractStartingStrategy):
@@ -247,17 +303,162 @@ class LocalStrategy(AbstractStartingStrategy):
         :return: the list of identifiers corresponding to the Supvisors instances that can support the additional load
         """
         local_identifier = self.supvisors.mapper.local_identifier
-        self.logger.trace(f'LocalStrategy.get_supvisors_instance: identifiers={identifiers}'
-                          f' local_identifier={local_identifier} expected_load={expected_load}'
-                          f' load_details={load_details}')
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'LocalStrategy.get_supvisors_instance: identifiers={identifiers}'
+                              f' local_identifier={local_identifier} expected_load={expected_load}'
+                              f' load_details={load_details}')
         if local_identifier not in identifiers:
             # the local Supvisors instance is not among the candidates
             return None
-        loading_validity_map = self.get_loading_and_validity(identifiers, expected_load, load_details)
-        validity, _, _ = loading_validity_map[local_identifier]
+        validity, _, _ = self.is_loading_valid(local_identifier, expected_load, load_details)
         return local_identifier if validity else None
 
 
+class WeightedRandomStrategy(AbstractStartingStrategy):
+    """ Strategy designed to choose the Supvisors instance randomly, favouring the less loaded nodes. """
+
+    def get_supvisors_instance(self, identifiers: NameList, expected_load: int,
+                               load_details: LoadDetails) -> Optional[str]:
+        """ Choose randomly a Supvisors instance whose node can support the additional load requested.
+        The probability of a Supvisors instance to be chosen is proportional to the load that would remain available
+        on its node after the start. One is added so that a node that would be fully loaded can still be chosen.
+
+        :param identifiers: the identifiers of the candidate Supvisors instances
+        :param expected_load: the load of the program to be started
+        :param load_details: the load details per identifier and node
+        :return: the chosen identifier
+        """
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'WeightedRandomStrategy.get_supvisors_instance: identifiers={identifiers}'
+                              f' expected_load={expected_load} load_details={load_details}')
+        valid_identifiers, weights = [], []
+        for identifier in identifiers:
+            validity, node_loading, _ = self.is_loading_valid(identifier, expected_load, load_details)
+            if validity:
+                valid_identifiers.append(identifier)
+                weights.append(101 - node_loading - expected_load)
+        if valid_identifiers:
+            return random.choices(valid_identifiers, weights=weights)[0]
+
+
+class WeightedRound(object):
+    """ Interleaved weighted round-robin over a set of candidate Supvisors instances.
+    In a round, every Supvisors instance is chosen as many times as its weight, and the choices are interleaved
+    so that consecutive starts are spread over the Supvisors instances.
+
+    Attributes are:
+
+        - round_weights: the weights reduced by their greatest common divisor ;
+        - current_round: the Supvisors instances of the current round, with their remaining number of choices ;
+        - next_round: the Supvisors instances already exhausted in the current round, with their full weight.
+    """
+
+    # Annotation types
+    RoundQueue = Deque[Tuple[str, int]]
+
+    def __init__(self, weights: Dict[str, int]):
+        """ Build the rounds from the Supvisors instances weights.
+        The weights are reduced by their greatest common divisor to shorten the rounds.
+
+        :param weights: the weight per identifier
+        """
+        divisor = reduce(gcd, weights.values(), 0) or 1
+        self.round_weights: Dict[str, int] = {identifier: weight // divisor for identifier, weight in weights.items()}
+        self.current_round: WeightedRound.RoundQueue = deque(self.round_weights.items())
+        self.next_round: WeightedRound.RoundQueue = deque()
+
+    def select(self, is_valid: Callable[[str], bool], check_only: bool = False) -> Optional[str]:
+        """ Choose the next Supvisors instance in the rounds, among those that are valid.
+        A Supvisors instance that is not valid loses its remaining choices in the current round.
+        In check-only mode, the rounds are left unchanged.
+
+        :param is_valid: the function telling if a Supvisors instance can be chosen
+        :param check_only: True if the choice is only used to check that a Supvisors instance can be chosen
+        :return: the chosen identifier, or None if no candidate is valid
+        """
+        if check_only:
+            # every candidate is either in the current round or in the next round
+            return next((identifier for identifier, _ in chain(self.current_round, self.next_round)
+                         if is_valid(identifier)), None)
+        # every candidate is considered at most once
+        for _ in range(len(self.round_weights)):
+            if not self.current_round:
+                self.current_round, self.next_round = self.next_round, self.current_round
+            identifier, remaining = self.current_round.popleft()
+            if is_valid(identifier):
+                if remaining > 1:
+                    self.current_round.append((identifier, remaining - 1))
+                else:
+                    self.next_round.append((identifier, self.round_weights[identifier]))
+                return identifier
+            self.next_round.append((identifier, self.round_weights[identifier]))
+        return None
+
+
+class InterleavedWeightedRoundRobin(object):
+    """ Interleaved weighted round-robin over the Supvisors instances.
+    A rotation is kept per set of candidates and weights, so that the starts of programs having different candidates
+    do not reset each other's rotation.
+
+    Attributes are:
+
+        - rounds: the rotation per set of candidates and weights.
+    """
+
+    # Annotation types
+    RoundKey = FrozenSet[Tuple[str, int]]
+
+    def __init__(self):
+        """ Initialization of the attributes. """
+        self.rounds: Dict[InterleavedWeightedRoundRobin.RoundKey, WeightedRound] = {}
+
+    def select(self, weights: Dict[str, int], is_valid: Callable[[str], bool],
+               check_only: bool = False) -> Optional[str]:
+        """ Choose the next Supvisors instance in the rotation of the candidates, among those that are valid.
+
+        :param weights: the weight per candidate identifier
+        :param is_valid: the function telling if a Supvisors instance can be chosen
+        :param check_only: True if the choice is only used to check that a Supvisors instance can be chosen
+        :return: the chosen identifier, or None if no candidate is valid
+        """
+        key = frozenset(weights.items())
+        weighted_round = self.rounds.get(key)
+        if weighted_round is None:
+            weighted_round = self.rounds[key] = WeightedRound(weights)
+        return weighted_round.select(is_valid, check_only)
+
+
+class WeightedRoundRobinStrategy(AbstractStartingStrategy):
+    """ Strategy designed to choose the Supvisors instances in turn, iaw the number of processor cores of their host. """
+
+    def get_weights(self, identifiers: NameList) -> Dict[str, int]:
+        """ Return the weight of the Supvisors instances, i.e. the number of processor cores of their host.
+        The weight is 1 when the number of processor cores is not known yet.
+
+        :param identifiers: the identifiers of the candidate Supvisors instances
+        :return: the weight per identifier
+        """
+        return {identifier: self.supvisors.host_compiler.get_nb_cores(identifier) or 1
+                for identifier in identifiers}
+
+    def get_supvisors_instance(self, identifiers: NameList, expected_load: int,
+                               load_details: LoadDetails) -> Optional[str]:
+        """ Choose the next Supvisors instance in the weighted round-robin, provided that its node can support
+        the additional load requested.
+
+        :param identifiers: the identifiers of the candidate Supvisors instances
+        :param expected_load: the load of the program to be started
+        :param load_details: the load details per identifier and node
+        :return: the chosen identifier
+        """
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'WeightedRoundRobinStrategy.get_supvisors_instance: identifiers={identifiers}'
+                              f' expected_load={expected_load} load_details={load_details}')
+        return self.supvisors.round_robin.select(self.get_weights(identifiers),
+                                                 lambda x: self.is_loading_valid(x, expected_load, load_details)[0],
+                                                 self.check_only)
+
+
 def get_node_load_request_map(mapper: SupvisorsMapper, load_request_map: LoadMap):
     """ Sum the load_request_map per identifier by node.
 
@@ -272,35 +473,42 @@ def get_node_load_request_map(mapper: SupvisorsMapper, load_request_map: LoadMap
     return node_load_request_map
 
 
-def create_strategy(supvisors: Any, strategy: StartingStrategies) -> AbstractStartingStrategy:
+# dispatch table of the starting strategies
+StartingStrategyClasses = {StartingStrategies.CONFIG: ConfigStrategy,
+                           StartingStrategies.LESS_LOADED: LessLoadedStrategy,
+                           StartingStrategies.MOST_LOADED: MostLoadedStrategy,
+                           StartingStrategies.LOCAL: LocalStrategy,
+                           StartingStrategies.LESS_LOADED_NODE: LessLoadedNodeStrategy,
+                           StartingStrategies.MOST_LOADED_NODE: MostLoadedNodeStrategy,
+                           StartingStrategies.WEIGHTED_ROUND_ROBIN: WeightedRoundRobinStrategy,
+                           StartingStrategies.WEIGHTED_RANDOM: WeightedRandomStrategy}
+
+
+def create_strategy(supvisors: Any, strategy: StartingStrategies, instances_load: Optional[LoadMap] = None,
+                    check_only: bool = False) -> Optional[AbstractStartingStrategy]:
     """ Factory for starting strategies.
 
     :param supvisors: the global Supvisors structure
     :param strategy: the strategy used to choose a Supvisors instance
-    :return:
+    :param instances_load: the Supvisors instances load, if already computed
+    :param check_only: True if the strategy is only used to check that a Supvisors instance can be chosen
+    :return: the starting strategy instance
     """
-    if strategy == StartingStrategies.CONFIG:
-        return ConfigStrategy(supvisors)
-    if strategy == StartingStrategies.LESS_LOADED:
-        return LessLoadedStrategy(supvisors)
-    if strategy == StartingStrategies.MOST_LOADED:
-        return MostLoadedStrategy(supvisors)
-    if strategy == StartingStrategies.LOCAL:
-        return LocalStrategy(supvisors)
-    if strategy == StartingStrategies.LESS_LOADED_NODE:
-        return LessLoadedNodeStrategy(supvisors)
-    if strategy == StartingStrategies.MOST_LOADED_NODE:
-        return MostLoadedNodeStrategy(supvisors)
+    strategy_class = StartingStrategyClasses.get(strategy)
+    if strategy_class:
+        return strategy_class(supvisors, instances_load, check_only)
 
 
 def get_supvisors_instance(supvisors: Any, strategy: StartingStrategies, identifiers: NameList,
-                           expected_load: int) -> Optional[str]:
+                           expected_load: int, check_only: bool = False) -> Optional[str]:
     """ Creates a strategy and let it find a Supvisors instance to start a process having a defined load.
 
     :param supvisors: the global Supvisors structure
     :param strategy: the strategy used to choose a Supvisors instance
     :param identifiers: the identifiers of the candidate Supvisors instances (from configuration perspective)
     :param expected_load: the load of the program to be started
+    :param check_only: True if no process is started on the chosen Supvisors instance, so that the strategy state
+        (e.g. the WEIGHTED_ROUND_ROBIN rotation) must not change
     :return: the identifier of the Supvisors instance that can support the additional load
     """
     # restrict the candidate Supvisors instances to those that are actually running
@@ -308,16 +516,21 @@ def get_supvisors_instance(supvisors: Any, strategy: StartingStrategies, identif
     candidate_identifiers = [identifier for identifier in identifiers if identifier in running_identifiers]
     if not candidate_identifiers:
         return None
+    # get the Supvisors instances load once for the whole request
+    instances_load = supvisors.context.get_instances_load()
     # create the relevant strategy to choose a Supvisors instance among the candidates
-    instance = create_strategy(supvisors, strategy)
+    instance = create_strategy(supvisors, strategy, instances_load, check_only)
     # consider all pending starting requests into global load
     load_request_map = supvisors.starter.get_load_requests()
-    supvisors.logger.debug(f'get_supvisors_instance: load_request_map={load_request_map}')
+    if LevelsByName.DEBG >= supvisors.logger.level:
+        supvisors.logger.debug(f'get_supvisors_instance: load_request_map={load_request_map}')
     node_load_request_map = get_node_load_request_map(supvisors.mapper, load_request_map)
-    supvisors.logger.debug(f'get_supvisors_instance: node_load_request_map={node_load_request_map}')
+    if LevelsByName.DEBG >= supvisors.logger.level:
+        supvisors.logger.debug(f'get_supvisors_instance: node_load_request_map={node_load_request_map}')
     # get nodes load
-    node_load_map = supvisors.context.get_nodes_load()
-    supvisors.logger.debug(f'get_supvisors_instance: node_load_map={node_load_map}')
+    node_load_map = supvisors.context.get_nodes_load(instances_load)
+    if LevelsByName.DEBG >= supvisors.logger.level:
+        supvisors.logger.debug(f'get_supvisors_instance: node_load_map={node_load_map}')
     # apply strategy
     return instance.get_supvisors_instance(candidate_identifiers, expected_load,
                                            (load_request_map, node_load_request_map, node_load_map))
@@ -342,44 +555,74 @@ def get_node(supvisors: Any, strategy: StartingStrategies, identifiers: NameList
 
 
 # Strategy management for Conciliation
-class SenicideStrategy(AbstractStrategy):
-    """ Strategy designed to stop the oldest processes. """
+class UptimeStrategy(AbstractStrategy):
+    """ Base class for the conciliation strategies keeping the process iaw its uptime and stopping the others.
+
+    Attributes are:
+
+        - pickup_logic: the function choosing the uptime to keep (defined in subclasses) ;
+        - class_name: the name of the subclass used for logs.
+    """
+
+    def __init__(self, supvisors: Any):
+        """ Initialization of the attributes.
+
+        :param supvisors: the global Supvisors instance
+        """
+        AbstractStrategy.__init__(self, supvisors)
+        self.pickup_logic = None
+        # used for Logger so that Senicide / Infanticide are printed instead of Uptime
+        self.class_name = type(self).__name__
 
     def conciliate(self, conflicts):
-        """ Conciliate the conflicts by finding the process that started the most recently and stopping the others """
+        """ Conciliate the conflicts by keeping the process chosen iaw its uptime and stopping the others. """
         for process in conflicts:
-            # determine the process with lower uptime (the youngest)
             # uptime is used as there is guarantee that the Supvisors instances are time synchronized
             # so comparing start dates may be irrelevant
-            saved_identifier = min(process.running_identifiers, key=lambda x: process.info_map[x]['uptime'])
-            self.logger.warn(f'SenicideStrategy.conciliate: keep {process.namespec} at {saved_identifier}')
-            # stop other processes. work on copy as it may change during iteration
+            saved_identifier = self.pickup_logic(process.running_identifiers,
+                                                 key=lambda x: process.info_map[x]['uptime'])
+            self.logger.warn(f'{self.class_name}.conciliate: keep {process.namespec} at {saved_identifier}')
+            # stop other processes. the set difference provides a new set as process may change during iteration
             # Stopper can't be used here as it would stop all processes
-            running_identifiers = process.running_identifiers.copy()
-            running_identifiers.remove(saved_identifier)
-            self.logger.debug(f'SenicideStrategy.conciliate: stop {process.namespec} on {running_identifiers}')
+            running_identifiers = process.running_identifiers - {saved_identifier}
+            self.logger.debug(f'{self.class_name}.conciliate: stop {process.namespec} on {running_identifiers}')
             self.supvisors.stopper.stop_process(process, running_identifiers, False)
         # trigger all Stopper jobs at once
         self.supvisors.stopper.next()
 
 
-class InfanticideStrategy(AbstractStrategy):
-    """ Strategy designed to stop the youngest processes. """
+class SenicideStrategy(UptimeStrategy):
+    """ Strategy designed to stop the oldest processes.
 
-    def conciliate(self, conflicts):
-        """ Conciliate the conflicts by finding the process that started the least recently and stopping the others """
-        for process in conflicts:
-            # determine the process with higher uptime (the oldest)
-            saved_identifier = max(process.running_identifiers, key=lambda x: process.info_map[x]['uptime'])
-            self.logger.warn(f'InfanticideStrategy.conciliate: keep {process.namespec} at {saved_identifier}')
-            # stop other processes. work on copy as it may change during iteration
-            # Stopper can't be used here as it would stop all processes
-            running_identifiers = process.running_identifiers.copy()
-            running_identifiers.remove(saved_identifier)
-            self.logger.debug(f'InfanticideStrategy.conciliate: stop {process.namespec} on {running_identifiers}')
-            self.supvisors.stopper.stop_process(process, running_identifiers, False)
-        # trigger all Stopper jobs at once
-        self.supvisors.stopper.next()
+    Attributes are:
+
+        - pickup_logic: choose the process with lower uptime (the youngest).
+    """
+
+    def __init__(self, supvisors: Any):
+        """ Initialization of the attributes.
+
+        :param supvisors: the global Supvisors instance
+        """
+        UptimeStrategy.__init__(self, supvisors)
+        self.pickup_logic = min
+
+
+class InfanticideStrategy(UptimeStrategy):
+    """ Strategy designed to stop the youngest processes.
+
+    Attributes are:
+
+        - pickup_logic: choose the process with higher uptime (the oldest).
+    """
+
+    def __init__(self, supvisors: Any):
+        """ Initialization of the attributes.
+
+        :param supvisors: the global Supvisors instance
+        """
+        UptimeStrategy.__init__(self, supvisors)
+        self.pickup_logic = max
 
 
 class UserStrategy(AbstractStrategy):
@@ -431,24 +674,27 @@ class FailureStrategy(AbstractStrategy):
         self.supvisors.failure_handler.trigger_jobs()
 
 
+# dispatch table of the conciliation strategies
+ConciliationStrategyClasses = {ConciliationStrategies.SENICIDE: SenicideStrategy,
+                               ConciliationStrategies.INFANTICIDE: InfanticideStrategy,
+                               ConciliationStrategies.USER: UserStrategy,
+                               ConciliationStrategies.STOP: StopStrategy,
+                               ConciliationStrategies.RESTART: RestartStrategy,
+                               ConciliationStrategies.RUNNING_FAILURE: FailureStrategy}
+
+
 def conciliate_conflicts(supvisors, strategy, conflicts):
     """ Creates a strategy and let it conciliate the conflicts. """
-    instance = None
-    if strategy == ConciliationStrategies.SENICIDE:
-        instance = SenicideStrategy(supvisors)
-    elif strategy == ConciliationStrategies.INFANTICIDE:
-        instance = InfanticideStrategy(supvisors)
-    elif strategy == ConciliationStrategies.USER:
-        instance = UserStrategy(supvisors)
-    elif strategy == ConciliationStrategies.STOP:
-        instance = StopStrategy(supvisors)
-    elif strategy == ConciliationStrategies.RESTART:
-        instance = RestartStrategy(supvisors)
-    elif strategy == ConciliationStrategies.RUNNING_FAILURE:
-        instance = FailureStrategy(supvisors)
+    strategy_class = ConciliationStrategyClasses.get(strategy)
     # apply strategy to conflicts
-    if instance:
-        instance.conciliate(conflicts)
+    if strategy_class:
+        # the stop requests of all conflicts are sent at once
+        pusher = supvisors.internal_com.pusher
+        pusher.start_batch()
+        try:
+            strategy_class(supvisors).conciliate(conflicts)
+        finally:
+            pusher.send_batch()
 
 
 # Strategy management for a Running Failure
@@ -483,10 +729,10 @@ class RunningFailureHandler(AbstractStrategy):
 
     def abort(self):
         """ Clear all sets. """
-        self.stop_application_jobs = set()
-        self.restart_application_jobs = set()
-        self.restart_process_jobs = set()
-        self.continue_process_jobs = set()
+        self.stop_application_jobs.clear()
+        self.restart_application_jobs.clear()
+        self.restart_process_jobs.clear()
+        self.continue_process_jobs.clear()
 
     def add_stop_application_job(self, application: ApplicationStatus) -> None:
         """ Add the application name to the stop_application_jobs, checking if this job supersedes other jobs.
@@ -497,6 +743,8 @@ class RunningFailureHandler(AbstractStrategy):
         self.logger.info(f'RunningFailureHandler.add_stop_application_job: adding {application.application_name}')
         self.stop_application_jobs.add(application)
         # stop_application_jobs take precedence over all other jobs related to this application
+        # the processes are matched by application name, so that the processes removed from the application
+        # (e.g. numprocs decrease) but still queued are superseded too
         self.restart_application_jobs.discard(application)
         for job_set in [self.restart_process_jobs, self.continue_process_jobs]:
             for process in list(job_set):
@@ -519,10 +767,8 @@ class RunningFailureHandler(AbstractStrategy):
         # restart_application_jobs take precedence over all process jobs
         # remove only processes that are declared in the application start sequence
         sequenced_processes = application.get_start_sequenced_processes()
-        for job_set in [self.restart_process_jobs, self.continue_process_jobs]:
-            for process in list(job_set):
-                if process.application_name == application.application_name and process in sequenced_processes:
-                    job_set.remove(process)
+        self.restart_process_jobs.difference_update(sequenced_processes)
+        self.continue_process_jobs.difference_update(sequenced_processes)
 
     def add_restart_process_job(self, application: ApplicationStatus, process: ProcessStatus) -> None:
         """ Add the process to the restart_process_jobs, checking if this job supersedes other jobs and assuming that:
@@ -575,31 +821,33 @@ class RunningFailureHandler(AbstractStrategy):
     def add_job(self, strategy, process):
         """ Add a process or the related application name in the relevant set,
         iaw the strategy set in parameter and the priorities defined above. """
-        self.logger.trace(f'RunningFailureHandler.add_job: START stop_application_jobs={self.stop_application_jobs}'
-                          f' restart_application_jobs={self.restart_application_jobs}'
-                          f' restart_process_jobs={self.restart_process_jobs}'
-                          f' continue_process_jobs={self.continue_process_jobs}')
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'RunningFailureHandler.add_job: START stop_application_jobs={self.stop_application_jobs}'
+                              f' restart_application_jobs={self.restart_application_jobs}'
+                              f' restart_process_jobs={self.restart_process_jobs}'
+                              f' continue_process_jobs={self.continue_process_jobs}')
         application = self.supvisors.context.applications[process.application_name]
         # new job may supersede others of may be superseded by existing ones
-        if strategy == RunningFailureStrategies.STOP_APPLICATION:
+        if strategy is RunningFailureStrategies.STOP_APPLICATION:
             self.add_stop_application_job(application)
-        elif strategy == RunningFailureStrategies.RESTART_APPLICATION:
+        elif strategy is RunningFailureStrategies.RESTART_APPLICATION:
             self.add_restart_application_job(application)
-        elif strategy == RunningFailureStrategies.RESTART_PROCESS:
+        elif strategy is RunningFailureStrategies.RESTART_PROCESS:
             self.add_restart_process_job(application, process)
-        elif strategy == RunningFailureStrategies.CONTINUE:
+        elif strategy is RunningFailureStrategies.CONTINUE:
             self.add_continue_process_job(application, process)
-        self.logger.trace(f'RunningFailureHandler.add_job: END stop_application_jobs={self.stop_application_jobs}'
-                          f' restart_application_jobs={self.restart_application_jobs}'
-                          f' restart_process_jobs={self.restart_process_jobs}'
-                          f' continue_process_jobs={self.continue_process_jobs}')
+        if LevelsByName.TRAC >= self.logger.level:
+            self.logger.trace(f'RunningFailureHandler.add_job: END stop_application_jobs={self.stop_application_jobs}'
+                              f' restart_application_jobs={self.restart_application_jobs}'
+                              f' restart_process_jobs={self.restart_process_jobs}'
+                              f' continue_process_jobs={self.continue_process_jobs}')
 
     def add_default_job(self, process: ProcessStatus):
         """ Add a process or the related application name in the relevant set,
         iaw the strategy set in process rules and the priorities defined above. """
         self.add_job(process.rules.running_failure_strategy, process)
         # check strategy promotion
-        if process.rules.running_failure_strategy == RunningFailureStrategies.RESTART_PROCESS:
+        if process.rules.running_failure_strategy is RunningFailureStrategies.RESTART_PROCESS:
             # this is the case where the Supvisors instance has been invalidated
             # if the application is stopped due to such failure, it is likely that the full application needs a restart
             # rather than uncorrelated process restarts
@@ -617,52 +865,67 @@ class RunningFailureHandler(AbstractStrategy):
 
         :return: the list of application names
         """
-        return self.supvisors.starter.get_application_job_names() | self.supvisors.stopper.get_application_job_names()
+        # the Commanders return a new set, so the first one can be updated in place
+        application_job_names = self.supvisors.starter.get_application_job_names()
+        application_job_names.update(self.supvisors.stopper.get_application_job_names())
+        return application_job_names
 
     def trigger_stop_application_jobs(self, job_applications: NameSet) -> None:
         """ Trigger the STOP_APPLICATION strategy on stored jobs. """
-        for application in list(self.stop_application_jobs):
+        ready_applications = []
+        for application in self.stop_application_jobs:
             if application.application_name in job_applications:
                 self.logger.debug('RunningFailureHandler.trigger_stop_application_jobs: defer'
                                   f' {application.application_name} stop')
             else:
-                self.logger.info('RunningFailureHandler.trigger_stop_application_jobs: stopping'
-                                 f' {application.application_name}')
-                self.stop_application_jobs.remove(application)
-                self.supvisors.stopper.stop_application(application, False)
+                ready_applications.append(application)
+        # remove the triggered jobs at once
+        self.stop_application_jobs.difference_update(ready_applications)
+        for application in ready_applications:
+            self.logger.info('RunningFailureHandler.trigger_stop_application_jobs: stopping'
+                             f' {application.application_name}')
+            self.supvisors.stopper.stop_application(application, False)
 
     def trigger_restart_application_jobs(self, job_applications: NameSet) -> None:
         """ Trigger the RESTART_APPLICATION strategy on stored jobs.
         Stop application if necessary and defer start until application is fully stopped. """
-        for application in list(self.restart_application_jobs):
+        ready_applications = []
+        for application in self.restart_application_jobs:
             if application.application_name in job_applications:
-                self.logger.debug(f'RunningFailureHandler.trigger_restart_application_jobs: defer'
-                                  ' {application.application_name} restart')
+                self.logger.debug('RunningFailureHandler.trigger_restart_application_jobs: defer'
+                                  f' {application.application_name} restart')
             else:
-                self.logger.info('RunningFailureHandler.trigger_restart_application_jobs: restarting'
-                                 f' {application.application_name}')
-                self.restart_application_jobs.remove(application)
-                # first stop the application
-                self.supvisors.stopper.default_restart_application(application, False)
+                ready_applications.append(application)
+        # remove the triggered jobs at once
+        self.restart_application_jobs.difference_update(ready_applications)
+        for application in ready_applications:
+            self.logger.info('RunningFailureHandler.trigger_restart_application_jobs: restarting'
+                             f' {application.application_name}')
+            # first stop the application
+            self.supvisors.stopper.default_restart_application(application, False)
 
     def trigger_restart_process_jobs(self, job_applications: NameSet) -> None:
         """ Trigger the RESTART_PROCESS strategy on stored jobs.
         Stop process if necessary and defer start until process is stopped. """
-        for process in list(self.restart_process_jobs):
+        ready_processes = []
+        for process in self.restart_process_jobs:
             if process.application_name in job_applications:
                 self.logger.debug(f'RunningFailureHandler.trigger_restart_process_jobs: defer {process.namespec}'
                                   ' restart')
             else:
-                self.logger.info(f'RunningFailureHandler.trigger_restart_process_jobs: restarting {process.namespec}')
-                self.restart_process_jobs.remove(process)
-                self.supvisors.stopper.default_restart_process(process, False)
+                ready_processes.append(process)
+        # remove the triggered jobs at once
+        self.restart_process_jobs.difference_update(ready_processes)
+        for process in ready_processes:
+            self.logger.info(f'RunningFailureHandler.trigger_restart_process_jobs: restarting {process.namespec}')
+            self.supvisors.stopper.default_restart_process(process, False)
 
     def trigger_continue_process_jobs(self) -> None:
         """ Trigger the CONTINUE strategy on stored jobs. """
         for process in self.continue_process_jobs:
             self.logger.info('RunningFailureHandler.trigger_continue_process_jobs: continue despite failure'
                              f' of {process.namespec}')
-        self.continue_process_jobs = set()
+        self.continue_process_jobs.clear()
 
     def trigger_jobs(self):
         """ Trigger the configured strategy when a process of a running application crashes. """
@@ -20,6 +20,7 @@
 import json
 import os
 import socket
+from itertools import chain
 from typing import Any, Dict, List, Tuple
 
 from supervisor.events import notify
@@ -35,6 +36,9 @@ from .ttypes import ProcessAddedEvent, ProcessRemovedEvent, ProcessEnabledEvent,
 
 SUPERVISOR_TAIL_DEFAULT = 1024
 
+# the Supvisors web UI directory
+SUPVISORS_UI_DIR = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'ui')
+
 
 def spawn(self):
     """ Overridden Subprocess spawn to handle disabled processes.
@@ -92,6 +96,8 @@ class SupervisorData(object):
             # there MUST be an inet HTTP server
             raise ValueError(f'Supervisor MUST be configured using inet_http_server: {supervisord.options.configfile}')
         # shortcuts (not available yet)
+        self._http_server = None
+        self._rpc_handler = None
         self._system_rpc_interface = None
         self._supervisor_rpc_interface = None
         self._supvisors_rpc_interface = None
@@ -105,9 +111,27 @@ class SupervisorData(object):
 
         :return: the HTTP server structure
         """
-        for config, hs in self.supervisord.options.httpservers:
-            if config['family'] == socket.AF_INET:
-                return hs
+        if not self._http_server:
+            # the HTTP servers are not changed until they are closed
+            self._http_server = next((hs for config, hs in self.supervisord.options.httpservers
+                                      if config['family'] == socket.AF_INET), None)
+        return self._http_server
+
+    @property
+    def rpc_handler(self):
+        """ Get the internal Supervisor XML-RPC handler, without the authentication wrapper.
+        The handler is resolved once as it is not replaced after the HTTP server creation.
+
+        :return: the Supervisor XML-RPC handler
+        """
+        if not self._rpc_handler:
+            # the first handler is the XML-RPC interface for rapid access
+            handler = self.http_server.handlers[0]
+            # if authentication is used, handler is wrapped
+            if self.username:
+                handler = handler.handler
+            self._rpc_handler = handler
+        return self._rpc_handler
 
     @property
     def system_rpc_interface(self):
@@ -117,12 +141,7 @@ class SupervisorData(object):
         :return: the System Supervisor RPC handler
         """
         if not self._system_rpc_interface:
-            # the first handler is the XML-RPC interface for rapid access
-            handler = self.http_server.handlers[0]
-            # if authentication used, handler is wrapped
-            if self.username:
-                handler = handler.handler
-            self._system_rpc_interface = handler.rpcinterface.system
+            self._system_rpc_interface = self.rpc_handler.rpcinterface.system
         return self._system_rpc_interface
 
     @property
@@ -133,12 +152,7 @@ class SupervisorData(object):
         :return: the Supervisor RPC handler
         """
         if not self._supervisor_rpc_interface:
-            # the first handler is the XML-RPC interface for rapid access
-            handler = self.http_server.handlers[0]
-            # if authentication used, handler is wrapped
-            if self.username:
-                handler = handler.handler
-            self._supervisor_rpc_interface = handler.rpcinterface.supervisor
+            self._supervisor_rpc_interface = self.rpc_handler.rpcinterface.supervisor
         return self._supervisor_rpc_interface
 
     @property
@@ -149,12 +163,7 @@ class SupervisorData(object):
         :return: the Supvisors RPC handler
         """
         if not self._supvisors_rpc_interface:
-            # the first handler is the XML-RPC interface for rapid access
-            handler = self.http_server.handlers[0]
-            # if authentication is used, handler is wrapped
-            if self.username:
-                handler = handler.handler
-            self._supvisors_rpc_interface = handler.rpcinterface.supvisors
+            self._supvisors_rpc_interface = self.rpc_handler.rpcinterface.supvisors
         return self._supvisors_rpc_interface
 
     @property
@@ -228,14 +237,15 @@ class SupervisorData(object):
         else:
             groups = self.supervisord.process_groups.values()
         # apply the new configuration
-        for group in groups:
-            for process in group.processes.values():
-                # prepare process disability
-                program = self.supvisors.server_options.processes_program[process.config.name]
-                process.config.disabled = self.disabilities.setdefault(program, False)
-                # prepare extra arguments
-                process.config.command_ref = process.config.command
-                process.config.extra_args = ''
+        processes_program = self.supvisors.server_options.processes_program
+        disabilities = self.disabilities
+        for process in chain.from_iterable(group.processes.values() for group in groups):
+            config = process.config
+            # prepare process disability
+            config.disabled = disabilities.setdefault(processes_program[config.name], False)
+            # prepare extra arguments
+            config.command_ref = config.command
+            config.extra_args = ''
 
     def replace_tail_handlers(self) -> None:
         """ This method replaces Supervisor web UI tail handlers. """
@@ -257,9 +267,7 @@ class SupervisorData(object):
     def replace_default_handler(self) -> None:
         """ This method replaces Supervisor web UI with Supvisors web UI. """
         # create default handler pointing on Supvisors ui directory
-        here = os.path.abspath(os.path.dirname(__file__))
-        template_dir = os.path.join(here, 'ui')
-        filesystem = filesys.os_filesystem(template_dir)
+        filesystem = filesys.os_filesystem(SUPVISORS_UI_DIR)
         def_handler = default_handler.default_handler(filesystem)
         # deal with authentication
         if self.username:
@@ -284,6 +292,12 @@ class SupervisorData(object):
         self.http_server.socket.shutdown(socket.SHUT_RDWR)
         self.supervisord.options.close_httpservers()
         self.supervisord.options.httpservers = ()
+        # reset the cached references to the closed HTTP server
+        self._http_server = None
+        self._rpc_handler = None
+        self._system_rpc_interface = None
+        self._supervisor_rpc_interface = None
+        self._supvisors_rpc_interface = None
 
     # Access to Group / Process structures and configurations
     def get_group_processes(self, application_name: str) -> List[Subprocess]:
@@ -299,7 +313,7 @@ class SupervisorData(object):
         """ This method returns the process configuration related to a namespec. """
         # WARN: the method may throw a KeyError exception
         application_name, process_name = split_namespec(namespec)
-        return self.get_group_processes(application_name)[process_name]
+        return self.supervisord.process_groups[application_name].processes[process_name]
 
     def _get_process_config(self, namespec: str):
         """ This method returns the process configuration related to a namespec. """
@@ -323,6 +337,18 @@ class SupervisorData(object):
         process_config = self._get_process_config(namespec)
         return {option_name: getattr(process_config, option_name) for option_name in option_names}
 
+    def get_all_process_config_options(self, option_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """ Get the configured option values of all the programs.
+        The Supervisor groups are walked once, instead of resolving every namespec.
+
+        :param option_names: the options to get
+        :return: a dictionary of option values per namespec
+        """
+        return {make_namespec(group_name, process_name): {option_name: getattr(process.config, option_name)
+                                                           for option_name in option_names}
+                for group_name, group in self.supervisord.process_groups.items()
+                for process_name, process in group.processes.items()}
+
     def has_logfile(self, namespec: str, channel: str) -> bool:
         """ Return True if the process has a logfile configuration on the channel.
 
@@ -344,6 +370,9 @@ class SupervisorData(object):
         """
         """  """
         config = self._get_process_config(namespec)
+        if config.extra_args == extra_args:
+            # no change
+            return
         # reset command line
         config.command = config.command_ref
         config.extra_args = extra_args
@@ -374,33 +403,39 @@ class SupervisorData(object):
         # re-evaluate for all groups including the program
         server_options = self.supervisord.supvisors.server_options
         program_groups = server_options.program_processes[program_name]
-        current_numprocs = len(next(iter(program_groups.values())))
+        current_numprocs = server_options.program_numprocs[program_name]
         self.logger.debug(f'SupervisorData.update_numprocs: {program_name} - current_numprocs={current_numprocs}')
+        if current_numprocs == numprocs:
+            # no change
+            return [], []
+        # the obsolete processes are those over the new size (none if numprocs increases)
+        # do not remove process configs yet as they may need to be stopped before
+        obsolete_processes = []
+        if current_numprocs > numprocs:
+            obsolete_processes = [make_namespec(group_name, process_config.name)
+                                  for group_name, process_configs in program_groups.items()
+                                  for process_config in process_configs[numprocs:]]
+        # update ServerOptions parser with new numprocs for program
+        section = server_options.update_numprocs(program_name, numprocs)
+        # rebuild the process configs from the new Supervisor configuration
+        group_configs = server_options.reload_processes_from_section(section, list(program_groups.keys()))
         if current_numprocs > numprocs:
             # return the processes to stop if numprocs decreases
-            return [], self._get_obsolete_processes(program_name, numprocs, program_groups)
-        if current_numprocs < numprocs:
-            # add the new processes into Supervisor
-            return self._add_processes(program_name, numprocs, current_numprocs, list(program_groups.keys())), []
-        # else equal / no change
-        return [], []
-
-    def _add_processes(self, program_name: str, new_numprocs: int, current_numprocs: int, groups: NameList) -> NameList:
+            return [], obsolete_processes
+        # add the new processes into Supervisor
+        return self._add_processes(program_name, current_numprocs, group_configs), []
+
+    def _add_processes(self, program_name: str, current_numprocs: int,
+                       group_configs: SupvisorsServerOptions.ProcessConfigInfo) -> NameList:
         """ Add new processes to all Supervisor groups already including it.
 
-        :param program_name: the program which definition has to be updated
-        :param new_numprocs: the new numprocs value
+        :param program_name: the program which definition has been updated
         :param current_numprocs: the former numprocs value
-        :param groups: the groups that embed the processes issued from the existing program definition
-        :return: None
+        :param group_configs: the new program configurations per group
+        :return: the new process namespecs
         """
         new_process_namespecs = []
-        # update ServerOptions parser with new numprocs for program
-        server_options = self.supervisord.supvisors.server_options
-        section = server_options.update_numprocs(program_name, new_numprocs)
-        for group_name in groups:
-            # rebuild the process configs from the new Supervisor configuration
-            process_configs = server_options.reload_processes_from_section(section, group_name)
+        for group_name, process_configs in group_configs.items():
             # the new processes are those over the previous size
             new_namespecs = self._add_supervisor_processes(program_name, group_name, process_configs[current_numprocs:])
             new_process_namespecs.extend(new_namespecs)
@@ -415,50 +450,35 @@ class SupervisorData(object):
         :param new_configs: the new process configurations to add to the group
         :return: the new process namespecs
         """
-        new_process_namespecs = []
+        new_processes = {}
         # add new process configs to group in Supervisor
         group = self.supervisord.process_groups[group_name]
         group.config.process_configs.extend(new_configs)
+        # the values below are common to all the new processes
+        supervisor_options = self.supervisord.options
+        disabled = self.disabilities[program_name]
+        logger = self.logger
         # create processes from new process configs
         for process_config in new_configs:
-            self.logger.info(f'SupervisorData._add_supervisor_processes: add process={process_config.name}')
-            new_process_namespecs.append(make_namespec(group_name, process_config.name))
+            process_name = process_config.name
+            logger.info(f'SupervisorData._add_supervisor_processes: add process={process_name}')
             # WARN: replace process_config Supvisors server_options by Supervisor options
             #  this is causing "reaped unknown pid" at exit due to inadequate pidhistory
-            process_config.options = self.supervisord.options
+            process_config.options = supervisor_options
             # additional Supvisors attributes
-            process_config.disabled = self.disabilities[program_name]
+            process_config.disabled = disabled
             process_config.command_ref = process_config.command
             process_config.extra_args = ''
             # prepare log files
             process_config.create_autochildlogs()
-            # add the new process to the group
-            group.processes[process_config.name] = process = process_config.make_process(group)
-            # fire event to Supervisor listeners
+            # create the new process
+            new_processes[process_name] = process_config.make_process(group)
+        # add the new processes to the group
+        group.processes.update(new_processes)
+        # fire events to Supervisor listeners once the group is complete
+        for process in new_processes.values():
             notify(ProcessAddedEvent(process))
-        return new_process_namespecs
-
-    def _get_obsolete_processes(self, program_name: str, numprocs: int,
-                                program_configs: SupvisorsServerOptions.ProcessConfigInfo) -> NameList:
-        """ Return the obsolete processes in accordance with the new numprocs.
-        The program may be used in many groups.
-
-        :param program_name: the program which definition has to be updated
-        :param numprocs: the new numprocs value
-        :param program_configs: the current program configurations per group
-        :return: the obsolete process namespecs
-        """
-        # do not remove process configs yet as they may need to be stopped before
-        obsolete_processes = [make_namespec(group_name, process_config.name)
-                              for group_name, process_configs in program_configs.items()
-                              for process_config in process_configs[numprocs:]]
-        # update ServerOptions parser with new numprocs for program
-        server_options = self.supervisord.supvisors.server_options
-        section = server_options.update_numprocs(program_name, numprocs)
-        # rebuild the process configs from the new Supervisor configuration
-        for group_name in program_configs:
-            server_options.reload_processes_from_section(section, group_name)
-        return obsolete_processes
+        return [make_namespec(group_name, process_name) for process_name in new_processes]
 
     def delete_processes(self, namespecs: NameList):
         """ Remove processes from the internal Supervisor structure.
@@ -467,10 +487,11 @@ class SupervisorData(object):
         :param namespecs: the namespecs to delete
         :return: None
         """
+        process_groups = self.supervisord.process_groups
         for namespec in namespecs:
             # get Supervisor process from namespec
             group_name, process_name = split_namespec(namespec)
-            group = self.supervisord.process_groups[group_name]
+            group = process_groups[group_name]
             process = group.processes[process_name]
             # fire event to Supervisor listeners
             notify(ProcessRemovedEvent(process))
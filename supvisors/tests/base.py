@@ -34,6 +34,7 @@ from supvisors.internal_com import SupvisorsMapper
 from supvisors.rpcinterface import RPCInterface
 from supvisors.statscollector import ProcessStatisticsCollector, instant_host_statistics
 from supvisors.statscompiler import HostStatisticsCompiler, ProcStatisticsCompiler
+from supvisors.strategy import InterleavedWeightedRoundRobin
 from supvisors.supervisordata import SupervisorData
 from supvisors.utils import extract_process_info
 
@@ -63,6 +64,8 @@ class MockedSupvisors:
         self.process_compiler = ProcStatisticsCompiler(self.options, self.logger)
         # build context from node mapper
         self.context = Context(self)
+        # set the real rounds of the weighted round-robin starting strategy
+        self.round_robin = InterleavedWeightedRoundRobin()
         # mock by spec
         from supvisors.commander import Starter, Stopper
         from supvisors.strategy import RunningFailureHandler
@@ -97,6 +100,13 @@ class DummyRpcInterface:
         # create rpc interfaces to have a skeleton
         self.supervisor = SupervisorNamespaceRPCInterface(DummySupervisor())
         self.supvisors = RPCInterface(supvisors)
+        # mimic the transport and its closure of the ServerProxy
+        self.transport = Mock()
+        self.close = Mock()
+
+    def __call__(self, attr):
+        """ Return the ServerProxy special attributes. """
+        return getattr(self, attr)
 
 
 class DummyHttpServer:
@@ -262,9 +272,13 @@ def extract_and_complete(info):
     return extracted_info
 
 
+# the database as processed by Supvisors (values are immutable so shallow copies are enough)
+ProcessInfoCompletedDatabase = [extract_and_complete(info) for info in ProcessInfoDatabase]
+
+
 def database_copy():
     """ Return a copy of the whole database. """
-    return [extract_and_complete(info) for info in ProcessInfoDatabase]
+    return [info.copy() for info in ProcessInfoCompletedDatabase]
 
 
 def any_process_info():
@@ -770,8 +770,11 @@ def test_application_update_sequences(filled_application):
     """ Test the sequencing of the update_sequences method. """
     # call the sequencer
     filled_application.update_sequences()
-    # check the sequencing of the starting
-    sequences = sorted({process.rules.start_sequence for process in filled_application.processes.values()})
+    # sort the expected processes per sequence once
+    start_sequences, stop_sequences = {}, {}
+    for process in sorted(filled_application.processes.values(), key=lambda x: x.process_name):
+        start_sequences.setdefault(process.rules.start_sequence, []).append(process)
+        stop_sequences.setdefault(process.rules.stop_sequence, []).append(process)
     # by default, applications are unmanaged so start sequence is empty
     assert not filled_application.start_sequence
     assert filled_application.stop_sequence
@@ -782,19 +785,14 @@ def test_application_update_sequences(filled_application):
     # as key is an integer, the sequence dictionary should be sorted but doesn't work in Travis-CI
     assert filled_application.start_sequence
     assert filled_application.stop_sequence
-    for sequence, processes in sorted(filled_application.start_sequence.items()):
-        assert sequence == sequences.pop(0)
-        assert sorted(processes, key=lambda x: x.process_name) == \
-               sorted([proc for proc in filled_application.processes.values()
-                       if sequence == proc.rules.start_sequence], key=lambda x: x.process_name)
+    # check the sequencing of the starting
+    assert sorted(filled_application.start_sequence.keys()) == sorted(start_sequences.keys())
+    for sequence, processes in filled_application.start_sequence.items():
+        assert sorted(processes, key=lambda x: x.process_name) == start_sequences[sequence]
     # check the sequencing of the stopping
-    sequences = sorted({process.rules.stop_sequence for process in filled_application.processes.values()})
-    # as key is an integer, the sequence dictionary should be sorted but doesn't work in Travis-CI
-    for sequence, processes in sorted(filled_application.stop_sequence.items()):
-        assert sequence == sequences.pop(0)
-        assert sorted(processes, key=lambda x: x.process_name) == \
-               sorted([proc for proc in filled_application.processes.values()
-                       if sequence == proc.rules.stop_sequence], key=lambda x: x.process_name)
+    assert sorted(filled_application.stop_sequence.keys()) == sorted(stop_sequences.keys())
+    for sequence, processes in filled_application.stop_sequence.items():
+        assert sorted(processes, key=lambda x: x.process_name) == stop_sequences[sequence]
 
 
 def test_application_get_start_sequence_expected_load(filled_application):
@@ -818,6 +816,10 @@ def test_application_get_start_sequence_expected_load(filled_application):
 
 def test_application_update_status(filled_application):
     """ Test the rules to update the status of the application method. """
+    # sort the processes per state once
+    processes_by_state = {}
+    for process in filled_application.processes.values():
+        processes_by_state.setdefault(process.state, []).append(process)
     # as application is not managed, application is STOPPED there are no failures
     filled_application.update_status()
     assert filled_application.state == ApplicationStates.STOPPED
@@ -835,8 +837,7 @@ def test_application_update_status(filled_application):
     assert not filled_application.major_failure
     assert filled_application.minor_failure
     # set FATAL process to major
-    fatal_process = next((process for process in filled_application.processes.values()
-                          if process.state == ProcessStates.FATAL))
+    fatal_process = processes_by_state[ProcessStates.FATAL][0]
     fatal_process.rules.required = True
     # update status. major failure is now expected
     # minor still expected
@@ -845,17 +846,15 @@ def test_application_update_status(filled_application):
     assert filled_application.major_failure
     assert not filled_application.minor_failure
     # set STOPPING process to STOPPED
-    for process in filled_application.processes.values():
-        if process.state == ProcessStates.STOPPING:
-            process.state = ProcessStates.STOPPED
+    for process in processes_by_state[ProcessStates.STOPPING]:
+        process.state = ProcessStates.STOPPED
     # now STARTING is expected as it is the second priority
     filled_application.update_status()
     assert filled_application.state == ApplicationStates.STARTING
     assert filled_application.major_failure
     assert not filled_application.minor_failure
     # set STARTING process to RUNNING
-    starting_process = next((process for process in filled_application.processes.values()
-                             if process.state == ProcessStates.STARTING), None)
+    starting_process = processes_by_state[ProcessStates.STARTING][0]
     starting_process.state = ProcessStates.RUNNING
     # update status. there is still one BACKOFF process leading to STARTING application
     filled_application.update_status()
@@ -863,8 +862,7 @@ def test_application_update_status(filled_application):
     assert filled_application.major_failure
     assert not filled_application.minor_failure
     # set BACKOFF process to EXITED unexpected
-    backoff_process = next((process for process in filled_application.processes.values()
-                            if process.state == ProcessStates.BACKOFF), None)
+    backoff_process = processes_by_state[ProcessStates.BACKOFF][0]
     backoff_process.state = ProcessStates.EXITED
     backoff_process.expected_exit = False
     # update status. now there is only stopped and running processes.
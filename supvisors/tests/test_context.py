@@ -280,6 +280,19 @@ def test_export_status(mocker, context):
     assert mocked_publish.call_args_list == [call()]
 
 
+def test_get_instances_load(mocker, context):
+    """ Test the Context.get_instances_load method. """
+    local_identifier = context.local_identifier
+    # empty test
+    assert context.get_instances_load() == {identifier: 0 for identifier in context.instances}
+    # update context for some values
+    mocker.patch.object(context.local_status, 'get_load', return_value=10)
+    mocker.patch.object(context.instances['10.0.0.2'], 'get_load', return_value=8)
+    expected = {identifier: 0 for identifier in context.instances}
+    expected.update({local_identifier: 10, '10.0.0.2': 8})
+    assert context.get_instances_load() == expected
+
+
 def test_get_nodes_load(mocker, context):
     """ Test the Context.get_nodes_load method. """
     sup_id = context.local_status.supvisors_id
@@ -292,6 +305,10 @@ def test_get_nodes_load(mocker, context):
     mocker.patch.object(context.instances['test'], 'get_load', return_value=5)
     assert context.get_nodes_load() == {'10.0.0.1': 0, '10.0.0.2': 8, '10.0.0.3': 0, '10.0.0.4': 0, '10.0.0.5': 0,
                                         sup_id.ip_address: 15}
+    # test with the Supvisors instances load provided
+    instances_load = {identifier: 1 for identifier in context.instances}
+    assert context.get_nodes_load(instances_load) == {'10.0.0.1': 1, '10.0.0.2': 1, '10.0.0.3': 1, '10.0.0.4': 1,
+                                                      '10.0.0.5': 1, sup_id.ip_address: 2}
 
 
 def test_initial_running(context):
@@ -1643,6 +1660,8 @@ def test_on_timer_event(mocker, context):
     proc_2 = Mock(application_name='dummy_application', rules=Mock(expected_load=12),
                   **{'invalidate_identifier.return_value': True})
     mocker.patch.object(context.instances['10.0.0.2'], 'running_processes', return_value=[proc_1, proc_2])
+    # the instance load is computed from the processes running on the instance
+    context.instances['10.0.0.2'].processes.update({'dummy_process_1': proc_1, 'dummy_process_2': proc_2})
     # test when synchro_timeout has passed
     assert context.on_timer_event({'sequence_counter': 32, 'when': 3600}) == (['10.0.0.2'], {proc_2})
     expected_1 = {'identifier': '10.0.0.2', 'node_name': '10.0.0.2', 'port': 65000,
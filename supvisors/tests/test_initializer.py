@@ -50,6 +50,7 @@ def test_creation(mocker):
     assert isinstance(supv.context, Context)
     assert isinstance(supv.starter, Starter)
     assert isinstance(supv.stopper, Stopper)
+    assert isinstance(supv.round_robin, InterleavedWeightedRoundRobin)
     assert isinstance(supv.host_compiler, HostStatisticsCompiler)
     assert isinstance(supv.process_compiler, ProcStatisticsCompiler)
     assert isinstance(supv.fsm, FiniteStateMachine)
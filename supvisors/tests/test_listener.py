@@ -17,6 +17,7 @@
 # limitations under the License.
 # ======================================================================
 
+import json
 from unittest.mock import call, Mock
 
 import pytest
@@ -431,7 +432,7 @@ def test_unstack_event_invalid_origin(mocker, listener):
     """ Test the processing of a Supvisors process state event. """
     mocked_host = mocker.patch.object(listener.supvisors.host_compiler, 'push_statistics')
     mocked_proc = mocker.patch.object(listener.supvisors.process_compiler, 'push_statistics')
-    listener.unstack_event('[["localhost", 65100], [2, ["10.0.0.2", {"name": "dummy"}]]]')
+    listener.unstack_event(json.loads('[["localhost", 65100], [2, ["10.0.0.2", {"name": "dummy"}]]]'))
     assert not listener.supvisors.fsm.on_tick_event.called
     assert not listener.supvisors.fsm.on_authorization.called
     assert not listener.supvisors.fsm.on_process_state_event.called
@@ -447,7 +448,7 @@ def test_unstack_event_heartbeat(mocker, listener):
     """ Test the processing of a Supvisors HEARTBEAT event. """
     mocked_host = mocker.patch.object(listener.supvisors.host_compiler, 'push_statistics')
     mocked_proc = mocker.patch.object(listener.supvisors.process_compiler, 'push_statistics')
-    listener.unstack_event('[["10.0.0.1", 65100], [0, ["10.0.0.1", []]]]')
+    listener.unstack_event(json.loads('[["10.0.0.1", 65100], [0, ["10.0.0.1", []]]]'))
     assert not listener.supvisors.fsm.on_tick_event.called
     assert not listener.supvisors.fsm.on_authorization.called
     assert not listener.supvisors.fsm.on_process_state_event.called
@@ -463,7 +464,7 @@ def test_unstack_event_tick(mocker, listener):
     """ Test the processing of a Supvisors TICK event. """
     mocked_host = mocker.patch.object(listener.supvisors.host_compiler, 'push_statistics')
     mocked_proc = mocker.patch.object(listener.supvisors.process_compiler, 'push_statistics')
-    listener.unstack_event('[["10.0.0.1", 65100], [1, ["10.0.0.1", "data"]]]')
+    listener.unstack_event(json.loads('[["10.0.0.1", 65100], [1, ["10.0.0.1", "data"]]]'))
     expected = [call('10.0.0.1', 'data')]
     assert listener.supvisors.fsm.on_tick_event.call_args_list == expected
     assert not listener.supvisors.fsm.on_authorization.called
@@ -482,7 +483,7 @@ def test_unstack_event_authorization(mocker, listener):
     """ Test the processing of a Supvisors TICK event. """
     mocked_host = mocker.patch.object(listener.supvisors.host_compiler, 'push_statistics')
     mocked_proc = mocker.patch.object(listener.supvisors.process_compiler, 'push_statistics')
-    listener.unstack_event('[["10.0.0.5", 65100], [2, ["10.0.0.5", false]]]')
+    listener.unstack_event(json.loads('[["10.0.0.5", 65100], [2, ["10.0.0.5", [false, null, null]]]]'))
     expected = [call('10.0.0.5', False)]
     assert not listener.supvisors.fsm.on_tick_event.called
     assert listener.supvisors.fsm.on_authorization.call_args_list == expected
@@ -495,13 +496,28 @@ def test_unstack_event_authorization(mocker, listener):
     assert not listener.supvisors.fsm.on_discovery_event.called
     assert not mocked_host.called
     assert not mocked_proc.called
+    listener.supvisors.fsm.on_authorization.reset_mock()
+    # test with states / modes and process information joined to the authorization
+    listener.unstack_event(json.loads('[["10.0.0.5", 65100], [2, ["10.0.0.5", [true, {"fsm_statecode": 3},'
+                           ' [{"name": "dummy_1"}]]]]]'))
+    assert not listener.supvisors.fsm.on_tick_event.called
+    assert listener.supvisors.fsm.on_authorization.call_args_list == [call('10.0.0.5', True)]
+    assert not listener.supvisors.fsm.on_process_state_event.called
+    assert not listener.supvisors.fsm.on_process_added_event.called
+    assert not listener.supvisors.fsm.on_process_removed_event.called
+    assert not listener.supvisors.fsm.on_process_disability_event.called
+    assert listener.supvisors.fsm.on_state_event.call_args_list == [call('10.0.0.5', {'fsm_statecode': 3})]
+    assert listener.supvisors.fsm.on_process_info.call_args_list == [call('10.0.0.5', [{'name': 'dummy_1'}])]
+    assert not listener.supvisors.fsm.on_discovery_event.called
+    assert not mocked_host.called
+    assert not mocked_proc.called
 
 
 def test_unstack_event_process_state(mocker, listener):
     """ Test the processing of a Supvisors process state event. """
     mocked_host = mocker.patch.object(listener.supvisors.host_compiler, 'push_statistics')
     mocked_proc = mocker.patch.object(listener.supvisors.process_compiler, 'push_statistics')
-    listener.unstack_event('[["10.0.0.2", 65100], [3, ["10.0.0.2", {"name": "dummy"}]]]')
+    listener.unstack_event(json.loads('[["10.0.0.2", 65100], [3, ["10.0.0.2", {"name": "dummy"}]]]'))
     expected = [call('10.0.0.2', {'name': 'dummy'})]
     assert not listener.supvisors.fsm.on_tick_event.called
     assert not listener.supvisors.fsm.on_authorization.called
@@ -520,8 +536,8 @@ def test_unstack_event_process_added(mocker, listener):
     """ Test the processing of a Supvisors process added event. """
     mocked_host = mocker.patch.object(listener.supvisors.host_compiler, 'push_statistics')
     mocked_proc = mocker.patch.object(listener.supvisors.process_compiler, 'push_statistics')
-    listener.unstack_event('[["10.0.0.1", 65100],'
-                           '[4, ["10.0.0.1", {"group": "dummy_group", "name": "dummy_process"}]]]')
+    listener.unstack_event(json.loads('[["10.0.0.1", 65100],'
+                           '[4, ["10.0.0.1", {"group": "dummy_group", "name": "dummy_process"}]]]'))
     expected = [call('10.0.0.1', {'group': 'dummy_group', 'name': 'dummy_process'})]
     assert not listener.supvisors.fsm.on_tick_event.called
     assert not listener.supvisors.fsm.on_authorization.called
@@ -540,8 +556,8 @@ def test_unstack_event_process_removed(mocker, listener):
     """ Test the processing of a Supvisors process removed event. """
     mocked_host = mocker.patch.object(listener.supvisors.host_compiler, 'push_statistics')
     mocked_proc = mocker.patch.object(listener.supvisors.process_compiler, 'push_statistics')
-    listener.unstack_event('[["10.0.0.1", 65100],'
-                           '[5, ["10.0.0.1", {"group": "dummy_group", "name": "dummy_process"}]]]')
+    listener.unstack_event(json.loads('[["10.0.0.1", 65100],'
+                           '[5, ["10.0.0.1", {"group": "dummy_group", "name": "dummy_process"}]]]'))
     expected = [call('10.0.0.1', {'group': 'dummy_group', 'name': 'dummy_process'})]
     assert not listener.supvisors.fsm.on_tick_event.called
     assert not listener.supvisors.fsm.on_authorization.called
@@ -560,8 +576,8 @@ def test_unstack_event_process_disability(mocker, listener):
     """ Test the processing of a Supvisors process enabled event. """
     mocked_host = mocker.patch.object(listener.supvisors.host_compiler, 'push_statistics')
     mocked_proc = mocker.patch.object(listener.supvisors.process_compiler, 'push_statistics')
-    listener.unstack_event('[["10.0.0.1", 65100],'
-                           '[6, ["10.0.0.1", {"group": "dummy_group", "name": "dummy_process"}]]]')
+    listener.unstack_event(json.loads('[["10.0.0.1", 65100],'
+                           '[6, ["10.0.0.1", {"group": "dummy_group", "name": "dummy_process"}]]]'))
     expected = [call('10.0.0.1', {'group': 'dummy_group', 'name': 'dummy_process'})]
     assert not listener.supvisors.fsm.on_tick_event.called
     assert not listener.supvisors.fsm.on_authorization.called
@@ -584,7 +600,7 @@ def test_unstack_event_host_statistics(mocker, listener):
     # message definition
     message = '[["10.0.0.3", 65100],[7, ["10.0.0.3", [0, [[20, 30]], {"lo": [100, 200]}]]]]'
     # 1. external_publisher is None
-    listener.unstack_event(message)
+    listener.unstack_event(json.loads(message))
     assert not listener.supvisors.fsm.on_tick_event.called
     assert not listener.supvisors.fsm.on_authorization.called
     assert not listener.supvisors.fsm.on_process_state_event.called
@@ -600,7 +616,7 @@ def test_unstack_event_host_statistics(mocker, listener):
     mocker.resetall()
     # 2. set external_publisher but still no returned value for push_statistics
     listener.supvisors.external_publisher = Mock(**{'send_host_statistics.return_value': None})
-    listener.unstack_event(message)
+    listener.unstack_event(json.loads(message))
     assert mocked_host.call_args_list == [call('10.0.0.3', [0, [[20, 30]], {'lo': [100, 200]}])]
     assert not listener.external_publisher.send_host_statistics.called
     assert not mocked_proc.called
@@ -608,7 +624,7 @@ def test_unstack_event_host_statistics(mocker, listener):
     mocker.resetall()
     # 3. external_publisher set and integrated value available for push_statistics
     mocked_host.return_value = [{'uptime': 1234}]
-    listener.unstack_event(message)
+    listener.unstack_event(json.loads(message))
     assert mocked_host.call_args_list == [call('10.0.0.3', [0, [[20, 30]], {'lo': [100, 200]}])]
     assert listener.external_publisher.send_host_statistics.call_args_list == [call({'uptime': 1234})]
     assert not mocked_proc.called
@@ -622,8 +638,8 @@ def test_unstack_event_process_statistics(mocker, listener):
     mocked_host = mocker.patch.object(listener.supvisors.host_compiler, 'push_statistics', return_value=None)
     mocked_proc = mocker.patch.object(listener.supvisors.process_compiler, 'push_statistics')
     # 1. external_publisher is None
-    listener.unstack_event('[["10.0.0.3", 65100],'
-                           '[8, ["10.0.0.3", [{"cpu": [100, 200]}, {"cpu": [50, 20]}]]]]')
+    listener.unstack_event(json.loads('[["10.0.0.3", 65100],'
+                           '[8, ["10.0.0.3", [{"cpu": [100, 200]}, {"cpu": [50, 20]}]]]]'))
     assert not listener.supvisors.fsm.on_tick_event.called
     assert not listener.supvisors.fsm.on_authorization.called
     assert not listener.supvisors.fsm.on_process_state_event.called
@@ -638,16 +654,16 @@ def test_unstack_event_process_statistics(mocker, listener):
     mocked_proc.reset_mock()
     # 2. set external_publisher but still no returned value for push_statistics
     listener.supvisors.external_publisher = Mock(**{'send_process_statistics.return_value': None})
-    listener.unstack_event('[["10.0.0.3", 65100],'
-                           '[8, ["10.0.0.3", [{"cpu": [100, 200]}, {"cpu": [50, 20]}]]]]')
+    listener.unstack_event(json.loads('[["10.0.0.3", 65100],'
+                           '[8, ["10.0.0.3", [{"cpu": [100, 200]}, {"cpu": [50, 20]}]]]]'))
     assert not mocked_host.called
     assert mocked_proc.call_args_list == [call('10.0.0.3', [{'cpu': [100, 200]}, {'cpu': [50, 20]}])]
     assert not listener.external_publisher.send_process_statistics.called
     mocked_proc.reset_mock()
     # 3. external_publisher set and integrated value available for push_statistics
     mocked_proc.return_value = [{'uptime': 1234}]
-    listener.unstack_event('[["10.0.0.3", 65100],'
-                           '[8, ["10.0.0.3", [{"cpu": [100, 200]}, {"cpu": [50, 20]}]]]]')
+    listener.unstack_event(json.loads('[["10.0.0.3", 65100],'
+                           '[8, ["10.0.0.3", [{"cpu": [100, 200]}, {"cpu": [50, 20]}]]]]'))
     assert not mocked_host.called
     assert mocked_proc.call_args_list == [call('10.0.0.3', [{'cpu': [100, 200]}, {'cpu': [50, 20]}])]
     assert listener.external_publisher.send_process_statistics.call_args_list == [call({'uptime': 1234})]
@@ -657,8 +673,8 @@ def test_unstack_event_state(mocker, listener):
     """ Test the processing of a Supvisors state event. """
     mocked_host = mocker.patch.object(listener.supvisors.host_compiler, 'push_statistics')
     mocked_proc = mocker.patch.object(listener.supvisors.process_compiler, 'push_statistics')
-    listener.unstack_event('[["10.0.0.1", 65100],'
-                           '[9, ["10.0.0.1", {"statecode": 10, "statename": "RUNNING"}]]]')
+    listener.unstack_event(json.loads('[["10.0.0.1", 65100],'
+                           '[9, ["10.0.0.1", {"statecode": 10, "statename": "RUNNING"}]]]'))
     expected = [call('10.0.0.1', {'statecode': 10, 'statename': 'RUNNING'})]
     assert not listener.supvisors.fsm.on_tick_event.called
     assert not listener.supvisors.fsm.on_authorization.called
@@ -674,11 +690,10 @@ def test_unstack_event_state(mocker, listener):
 
 
 def test_unstack_event_all_info(mocker, listener):
-    """ Test the processing of a Supvisors state event. """
+    """ Test that a Supvisors ALL_INFO event is ignored, as the process information is joined to the authorization. """
     mocked_host = mocker.patch.object(listener.supvisors.host_compiler, 'push_statistics')
     mocked_proc = mocker.patch.object(listener.supvisors.process_compiler, 'push_statistics')
-    listener.unstack_event('[["10.0.0.4", 65100], [10, ["10.0.0.4", {"name": "dummy"}]]]')
-    expected = [call('10.0.0.4', {'name': 'dummy'})]
+    listener.unstack_event(json.loads('[["10.0.0.4", 65100], [10, ["10.0.0.4", {"name": "dummy"}]]]'))
     assert not listener.supvisors.fsm.on_tick_event.called
     assert not listener.supvisors.fsm.on_authorization.called
     assert not listener.supvisors.fsm.on_process_state_event.called
@@ -686,7 +701,7 @@ def test_unstack_event_all_info(mocker, listener):
     assert not listener.supvisors.fsm.on_process_removed_event.called
     assert not listener.supvisors.fsm.on_process_disability_event.called
     assert not listener.supvisors.fsm.on_state_event.called
-    assert listener.supvisors.fsm.on_process_info.call_args_list == expected
+    assert not listener.supvisors.fsm.on_process_info.called
     assert not listener.supvisors.fsm.on_discovery_event.called
     assert not mocked_host.called
     assert not mocked_proc.called
@@ -696,7 +711,7 @@ def test_unstack_event_discovery(mocker, listener):
     """ Test the processing of a Supvisors state event. """
     mocked_host = mocker.patch.object(listener.supvisors.host_compiler, 'push_statistics')
     mocked_proc = mocker.patch.object(listener.supvisors.process_compiler, 'push_statistics')
-    listener.unstack_event('[["10.0.0.4", 65100], [11, ["10.0.0.4", {"server_port": 6666}]]]')
+    listener.unstack_event(json.loads('[["10.0.0.4", 65100], [11, ["10.0.0.4", {"server_port": 6666}]]]'))
     expected = [call('10.0.0.4', {'server_port': 6666})]
     assert not listener.supvisors.fsm.on_tick_event.called
     assert not listener.supvisors.fsm.on_authorization.called
@@ -715,18 +730,23 @@ def test_on_remote_event(mocker, listener):
     """ Test the reception of a Supervisor remote comm event. """
     # add patches for what is tested just above
     mocker.patch.object(listener, 'unstack_event')
-    # test exception
-    event = Mock(type='Supvisors', data={})
-    listener.unstack_event.side_effect = ValueError
+    # test decoding exception
+    event = Mock(type='Supvisors', data='not json')
+    listener.on_remote_event(event)
+    assert not listener.unstack_event.called
+    # test exception on the first event: the next events are processed anyway
+    event = Mock(type='Supvisors', data='[{}, {"state": "RUNNING"}]')
+    listener.unstack_event.side_effect = [ValueError, None]
     listener.on_remote_event(event)
-    assert listener.unstack_event.call_args_list == [call({})]
+    assert listener.unstack_event.call_args_list == [call({}), call({'state': 'RUNNING'})]
     listener.unstack_event.reset_mock()
+    listener.unstack_event.side_effect = None
     # test unknown type
     event = Mock(type='unknown', data='')
     listener.on_remote_event(event)
     assert not listener.unstack_event.called
     # test event
-    event = Mock(type='Supvisors', data={'state': 'RUNNING'})
+    event = Mock(type='Supvisors', data='[{"state": "RUNNING"}]')
     listener.on_remote_event(event)
     assert listener.unstack_event.call_args_list == [call({'state': 'RUNNING'})]
 
@@ -16,11 +16,15 @@
 # limitations under the License.
 # ======================================================================
 
+import asyncio
+import json
 import time
+from http.client import RemoteDisconnected
 from socket import gethostname, gethostbyname
 from unittest.mock import call, patch, DEFAULT
 
 import pytest
+from supervisor.xmlrpc import Faults, RPCError
 
 from supvisors.internal_com.internal_com import SupvisorsInternalEmitter
 from supvisors.internal_com.mainloop import *
@@ -54,139 +58,354 @@ def test_proxy_creation(mocked_rpc, proxy, supvisors):
                                  'SUPERVISOR_USERNAME': 'user',
                                  'SUPERVISOR_PASSWORD': 'p@$$w0rd'}
     assert mocked_rpc.call_args_list == [call(proxy.srv_url.env)]
+    assert proxy.workers == {}
+    assert proxy.remote_proxies == {}
+    assert proxy.unreachable == {}
 
 
 def test_proxy_run(mocker, proxy):
     """ Test the SupvisorsProxy tread run / stop. """
     mocked_send = mocker.patch.object(proxy, 'send_remote_comm_event')
     mocked_exec = mocker.patch.object(proxy, 'execute')
+    # queue events before the thread is started: they are sent together
+    messages = [((f'10.0.0.{idx}', 65100), (InternalEventHeaders.TICK.value, (f'10.0.0.{idx}', {'when': idx})))
+                for idx in range(3)]
+    for message in messages:
+        proxy.push_event(message)
     # start the thread
     proxy.start()
-    time.sleep(1)
+    time.sleep(0.1)
     assert proxy.is_alive()
     assert not proxy.event.is_set()
+    assert mocked_send.call_args_list == [call(messages)]
+    assert not mocked_exec.called
+    mocked_send.reset_mock()
     # send a remote event
     message = ('10.0.0.1', 65100), (InternalEventHeaders.TICK.value, ('10.0.0.1', {'when': 1234}))
     proxy.push_event(message)
-    time.sleep(1.0)
-    assert mocked_send.call_args_list == [call(message)]
+    time.sleep(0.1)
+    assert mocked_send.call_args_list == [call([message])]
     assert not mocked_exec.called
     mocked_send.reset_mock()
     # send a discovery event
     message = ('10.0.0.2', 51243), (InternalEventHeaders.DISCOVERY.value, ('10.0.0.2', {'when': 4321}))
     proxy.push_event(message)
-    time.sleep(1.0)
-    assert mocked_send.call_args_list == [call(message)]
+    time.sleep(0.1)
+    assert mocked_send.call_args_list == [call([message])]
     assert not mocked_exec.called
     mocked_send.reset_mock()
     # send a request
-    proxy.push_request(DeferredRequestHeaders.RESTART_ALL, '')
-    time.sleep(1.0)
+    proxy.push_request(DeferredRequestHeaders.RESTART_ALL, ('10.0.0.1',))
+    time.sleep(0.1)
     assert not mocked_send.called
-    assert mocked_exec.call_args_list == [call(DeferredRequestHeaders.RESTART_ALL, '')]
+    assert mocked_exec.call_args_list == [call(DeferredRequestHeaders.RESTART_ALL, ('10.0.0.1',))]
+    assert list(proxy.workers.keys()) == ['10.0.0.1']
+    worker = proxy.workers['10.0.0.1']
+    assert worker.is_alive()
+    mocked_send.reset_mock()
+    # stop the thread: the queue is unblocked so the thread ends without waiting for the queue timeout
+    start_time = time.monotonic()
+    proxy.stop()
+    proxy.join()
+    assert time.monotonic() - start_time < SupervisorProxy.QUEUE_TIMEOUT
+    # the workers are stopped too
+    worker.join(timeout=1.0)
+    assert not worker.is_alive()
+
+
+def test_proxy_process_batch(mocker, proxy):
+    """ Test the SupervisorProxy processing of the queued items in one go. """
+    mocked_send = mocker.patch.object(proxy, 'send_remote_comm_event')
+    mocked_dispatch = mocker.patch.object(proxy, 'dispatch')
+    mocker.patch.object(SupervisorProxy, 'MAX_BATCH_SIZE', 3)
+    events = [(('10.0.0.1', 65100), (InternalEventHeaders.PROCESS.value, ('10.0.0.1', {'idx': idx})))
+              for idx in range(7)]
+    # test with a single request
+    proxy.process_batch((DeferredRequestHeaders.RESTART, ('10.0.0.1',)))
+    assert not mocked_send.called
+    assert mocked_dispatch.call_args_list == [call(DeferredRequestHeaders.RESTART, ('10.0.0.1',))]
+    mocked_dispatch.reset_mock()
+    # test with queued events and requests: the number of items taken is limited
+    proxy.push_request(DeferredRequestHeaders.SHUTDOWN, ('10.0.0.2',))
+    proxy.push_event(events[2])
+    proxy.push_event(events[3])
+    proxy.process_batch((None, events[1]))
+    assert mocked_send.call_args_list == [call([events[1], events[2]])]
+    assert mocked_dispatch.call_args_list == [call(DeferredRequestHeaders.SHUTDOWN, ('10.0.0.2',))]
+    # the last event is still queued
+    assert proxy.queue.get_nowait() == (None, events[3])
+    assert proxy.queue.empty()
     mocked_send.reset_mock()
-    # stop the thread
+    mocked_dispatch.reset_mock()
+    # test with a stop request queued: the batch ends there
+    proxy.push_event(events[5])
     proxy.stop()
+    proxy.push_event(events[6])
+    proxy.process_batch((None, events[4]))
+    assert mocked_send.call_args_list == [call([events[4], events[5]])]
+    assert not mocked_dispatch.called
+    assert proxy.queue.get_nowait() == (None, events[6])
+    assert proxy.queue.empty()
+
+
+def test_proxy_coalesce_ticks():
+    """ Test the SupervisorProxy removal of the superseded TICK events. """
+    tick_11 = ('10.0.0.1', 65100), (InternalEventHeaders.TICK.value, ('10.0.0.1', {'when': 1}))
+    tick_12 = ('10.0.0.1', 65100), (InternalEventHeaders.TICK.value, ('10.0.0.1', {'when': 2}))
+    tick_21 = ('10.0.0.2', 65100), (InternalEventHeaders.TICK.value, ('10.0.0.2', {'when': 1}))
+    process_1 = ('10.0.0.1', 65100), (InternalEventHeaders.PROCESS.value, ('10.0.0.1', {'name': 'dummy'}))
+    # nothing to remove
+    assert SupervisorProxy.coalesce_ticks([]) == []
+    assert SupervisorProxy.coalesce_ticks([tick_11]) == [tick_11]
+    assert SupervisorProxy.coalesce_ticks([tick_11, process_1, tick_21]) == [tick_11, process_1, tick_21]
+    # the latest TICK of each Supvisors instance is kept at its place
+    assert SupervisorProxy.coalesce_ticks([tick_11, tick_21, process_1, tick_12]) == [tick_21, process_1, tick_12]
+
+
+def test_proxy_dispatch(mocker, proxy):
+    """ Test the SupervisorProxy dispatch of the deferred requests to the workers. """
+    mocked_start = mocker.patch('supvisors.internal_com.mainloop.RequestWorker.start')
+    mocked_push = mocker.patch('supvisors.internal_com.mainloop.RequestWorker.push_request')
+    assert proxy.workers == {}
+    # first request to a Supvisors instance creates the worker
+    proxy.dispatch(DeferredRequestHeaders.CHECK_INSTANCE, ('10.0.0.1',))
+    assert list(proxy.workers.keys()) == ['10.0.0.1']
+    worker = proxy.workers['10.0.0.1']
+    assert worker.proxy is proxy
+    assert worker.identifier == '10.0.0.1'
+    assert mocked_start.call_count == 1
+    assert mocked_push.call_args_list == [call(DeferredRequestHeaders.CHECK_INSTANCE, ('10.0.0.1',))]
+    mocker.resetall()
+    # next requests to the same Supvisors instance re-use the worker
+    proxy.dispatch(DeferredRequestHeaders.STOP_PROCESS, ('10.0.0.1', 'dummy_process'))
+    assert proxy.workers == {'10.0.0.1': worker}
+    assert not mocked_start.called
+    assert mocked_push.call_args_list == [call(DeferredRequestHeaders.STOP_PROCESS, ('10.0.0.1', 'dummy_process'))]
+    mocker.resetall()
+    # request to another Supvisors instance creates another worker
+    proxy.dispatch(DeferredRequestHeaders.RESTART, ('10.0.0.2',))
+    assert sorted(proxy.workers.keys()) == ['10.0.0.1', '10.0.0.2']
+    assert mocked_start.call_count == 1
+    assert mocked_push.call_args_list == [call(DeferredRequestHeaders.RESTART, ('10.0.0.2',))]
+
+
+def test_request_worker(mocker, proxy):
+    """ Test the RequestWorker thread. """
+    mocked_exec = mocker.patch.object(proxy, 'execute')
+    worker = RequestWorker(proxy, '10.0.0.1')
+    assert isinstance(worker, threading.Thread)
+    assert worker.daemon
+    assert worker.proxy is proxy
+    assert worker.identifier == '10.0.0.1'
+    assert worker.queue.empty()
+    worker.start()
+    # requests are executed in order
+    worker.push_request(DeferredRequestHeaders.START_PROCESS, ('10.0.0.1', 'dummy_process', ''))
+    worker.push_request(DeferredRequestHeaders.STOP_PROCESS, ('10.0.0.1', 'dummy_process'))
+    worker.stop()
+    worker.join(timeout=1.0)
+    assert not worker.is_alive()
+    assert mocked_exec.call_args_list == [call(DeferredRequestHeaders.START_PROCESS, ('10.0.0.1', 'dummy_process', '')),
+                                          call(DeferredRequestHeaders.STOP_PROCESS, ('10.0.0.1', 'dummy_process'))]
+    mocked_exec.reset_mock()
+    # unexpected errors are logged and do not end the thread
+    mocked_exec.side_effect = [TypeError('unexpected'), None]
+    worker = RequestWorker(proxy, '10.0.0.1')
+    worker.start()
+    worker.push_request(DeferredRequestHeaders.START_PROCESS, ('10.0.0.1', 'dummy_process', ''))
+    worker.push_request(DeferredRequestHeaders.STOP_PROCESS, ('10.0.0.1', 'dummy_process'))
+    worker.stop()
+    worker.join(timeout=1.0)
+    assert not worker.is_alive()
+    assert mocked_exec.call_args_list == [call(DeferredRequestHeaders.START_PROCESS, ('10.0.0.1', 'dummy_process', '')),
+                                          call(DeferredRequestHeaders.STOP_PROCESS, ('10.0.0.1', 'dummy_process'))]
+    assert proxy.logger.critical.call_count == 1
+    assert 'TypeError: unexpected' in proxy.logger.critical.call_args[0][0]
+
+
+def test_proxy_get_env(proxy):
+    """ Test the SupervisorProxy environment used to reach a Supvisors instance. """
+    assert proxy.get_env('10.0.0.2') == {'SUPERVISOR_SERVER_URL': 'http://10.0.0.2:65000',
+                                         'SUPERVISOR_USERNAME': 'user',
+                                         'SUPERVISOR_PASSWORD': 'p@$$w0rd'}
+    # the local environment is not modified
+    assert proxy.srv_url.env['SUPERVISOR_SERVER_URL'] == f'http://{gethostname()}:65000'
+
+
+def test_proxy_get_close_proxy(mocked_rpc, proxy):
+    """ Test the cache of XML-RPC clients to the Supvisors instances. """
+    mocked_rpc.reset_mock()
+    assert proxy.remote_proxies == {}
+    # first request creates the XML-RPC client
+    rpc_intf = proxy.get_proxy('10.0.0.1')
+    assert rpc_intf is mocked_rpc.return_value
+    assert mocked_rpc.call_args_list == [call(proxy.get_env('10.0.0.1'))]
+    assert proxy.remote_proxies == {'10.0.0.1': rpc_intf}
+    # the socket timeout is applied to the transport
+    assert rpc_intf.call_args_list == [call('transport')]
+    mocked_rpc.reset_mock()
+    # next request re-uses it
+    assert proxy.get_proxy('10.0.0.1') is rpc_intf
+    assert not mocked_rpc.called
+    # close the client
+    proxy.close_proxy('10.0.0.1')
+    assert proxy.remote_proxies == {}
+    assert rpc_intf.call_args_list == [call('close')]
+    # closing an unknown client is harmless
+    proxy.close_proxy('10.0.0.2')
+
+
+def test_proxy_set_timeout(proxy):
+    """ Test the socket timeout applied to the XML-RPC clients. """
+    rpc_intf = getRPCInterface(proxy.get_env('10.0.0.1'))
+    assert rpc_intf('transport')._get_connection().timeout != 2.5
+    SupervisorProxy.set_timeout(rpc_intf, 2.5)
+    connection = rpc_intf('transport')._get_connection()
+    assert connection.timeout == 2.5
+    assert (connection.host, connection.port) == ('10.0.0.1', 65000)
+
+
+def test_proxy_remote_call(mocked_rpc, proxy):
+    """ Test the SupervisorProxy.remote_call method. """
+    mocked_rpc.reset_mock()
+    rpc_intf = mocked_rpc.return_value
+    mocked_call = rpc_intf.supervisor.stopProcess
+    # test success
+    mocked_call.return_value = True
+    assert proxy.remote_call('10.0.0.1', 'supervisor.stopProcess', 'dummy_process', False)
+    assert mocked_call.call_args_list == [call('dummy_process', False)]
+    assert proxy.remote_proxies == {'10.0.0.1': rpc_intf}
+    mocked_call.reset_mock()
+    # test XML-RPC fault: the client is kept
+    mocked_call.side_effect = RPCError(Faults.NOT_RUNNING)
+    with pytest.raises(RPCError):
+        proxy.remote_call('10.0.0.1', 'supervisor.stopProcess', 'dummy_process', False)
+    assert proxy.remote_proxies == {'10.0.0.1': rpc_intf}
+    mocked_call.reset_mock()
+    # test stale connection: the request is sent again on a new connection
+    mocked_call.side_effect = [RemoteDisconnected(), True]
+    assert proxy.remote_call('10.0.0.1', 'supervisor.stopProcess', 'dummy_process', False)
+    assert mocked_call.call_args_list == [call('dummy_process', False), call('dummy_process', False)]
+    assert mocked_rpc.call_count == 2
+    assert proxy.remote_proxies == {'10.0.0.1': rpc_intf}
+    mocked_call.reset_mock()
+    mocked_rpc.reset_mock()
+    # test connection failure on a new connection: no retry
+    proxy.close_proxy('10.0.0.1')
+    mocked_call.side_effect = ConnectionResetError
+    with pytest.raises(ConnectionResetError):
+        proxy.remote_call('10.0.0.1', 'supervisor.stopProcess', 'dummy_process', False)
+    assert mocked_call.call_args_list == [call('dummy_process', False)]
+    assert proxy.remote_proxies == {}
+    assert list(proxy.unreachable.keys()) == ['10.0.0.1']
+    mocked_call.reset_mock()
+    # test call to an unreachable Supvisors instance: fast failure
+    mocked_call.side_effect = None
+    with pytest.raises(OSError):
+        proxy.remote_call('10.0.0.1', 'supervisor.stopProcess', 'dummy_process', False)
+    assert not mocked_call.called
+    assert proxy.remote_proxies == {}
+    # test call to the Supvisors instance once the unreachable delay has passed
+    proxy.unreachable['10.0.0.1'] = 0.0
+    assert proxy.remote_call('10.0.0.1', 'supervisor.stopProcess', 'dummy_process', False)
+    assert mocked_call.call_args_list == [call('dummy_process', False)]
+    assert proxy.remote_proxies == {'10.0.0.1': rpc_intf}
+    mocked_call.reset_mock()
+    # test other failure: the client is closed
+    mocked_call.side_effect = KeyError
+    with pytest.raises(KeyError):
+        proxy.remote_call('10.0.0.1', 'supervisor.stopProcess', 'dummy_process', False)
+    assert mocked_call.call_args_list == [call('dummy_process', False)]
+    assert proxy.remote_proxies == {}
+    assert proxy.unreachable == {'10.0.0.1': 0.0}
 
 
 def test_proxy_check_instance(mocker, mocked_rpc, proxy):
     """ Test the SupervisorProxy.check_instance method. """
+    local_status, remote_status, all_info = {'statecode': 2}, {'fsm_statecode': 3}, [{'name': 'dummy_1'}]
+    mocked_results = mocker.patch.object(proxy, '_get_check_results', return_value=None)
     mocked_auth = mocker.patch.object(proxy, '_is_authorized', return_value=False)
-    mocked_mode = mocker.patch.object(proxy, '_transfer_states_modes')
-    mocked_info = mocker.patch.object(proxy, '_transfer_process_info')
-    mocked_send = mocker.patch.object(proxy, 'send_remote_comm_event')
+    mocked_mode = mocker.patch.object(proxy, '_get_states_modes', return_value={'fsm_statecode': 3})
+    mocked_info = mocker.patch.object(proxy, '_get_process_info', return_value=[{'name': 'dummy_1'}])
+    mocked_send = mocker.patch.object(proxy, 'push_event')
+    # test with XML-RPC failure
+    proxy.check_instance('10.0.0.1')
+    assert mocked_results.call_args_list == [call('10.0.0.1')]
+    assert not mocked_auth.called
+    assert not mocked_mode.called
+    assert not mocked_info.called
+    expected = InternalEventHeaders.AUTHORIZATION.value, ('10.0.0.1', (None, None, None))
+    assert mocked_send.call_args_list == [call((('10.0.0.1', 65000), expected))]
+    mocker.resetall()
     # test with no authorization
+    mocked_results.return_value = [local_status, remote_status, all_info]
     proxy.check_instance('10.0.0.1')
-    assert mocked_auth.call_args_list == [call('10.0.0.1')]
+    assert mocked_results.call_args_list == [call('10.0.0.1')]
+    assert mocked_auth.call_args_list == [call(local_status)]
     assert not mocked_mode.called
     assert not mocked_info.called
-    expected = InternalEventHeaders.AUTHORIZATION.value, ('10.0.0.1', False)
+    expected = InternalEventHeaders.AUTHORIZATION.value, ('10.0.0.1', (False, None, None))
     assert mocked_send.call_args_list == [call((('10.0.0.1', 65000), expected))]
     mocker.resetall()
     # test with authorization
     mocked_auth.return_value = True
     proxy.check_instance('10.0.0.1')
-    assert mocked_auth.call_args_list == [call('10.0.0.1')]
-    assert mocked_mode.call_args_list == [call('10.0.0.1')]
-    assert mocked_info.call_args_list == [call('10.0.0.1')]
-    expected = InternalEventHeaders.AUTHORIZATION.value, ('10.0.0.1', True)
+    assert mocked_results.call_args_list == [call('10.0.0.1')]
+    assert mocked_auth.call_args_list == [call(local_status)]
+    assert mocked_mode.call_args_list == [call('10.0.0.1', remote_status)]
+    assert mocked_info.call_args_list == [call('10.0.0.1', all_info)]
+    expected = InternalEventHeaders.AUTHORIZATION.value, ('10.0.0.1', (True, {'fsm_statecode': 3},
+                                                                       [{'name': 'dummy_1'}]))
     assert mocked_send.call_args_list == [call((('10.0.0.1', 65000), expected))]
 
 
-def test_proxy_is_authorized(mocker, mocked_rpc, proxy):
-    """ Test the SupervisorProxy._is_authorized method. """
-    mocked_rpc.reset_mock()
+def test_proxy_get_check_results(mocker, mocked_rpc, proxy):
+    """ Test the SupervisorProxy._get_check_results method. """
     local_identifier = proxy.supvisors.context.local_identifier
+    expected_calls = [{'methodName': 'supvisors.get_instance_info', 'params': [local_identifier]},
+                      {'methodName': 'supvisors.get_instance_info', 'params': ['10.0.0.1']},
+                      {'methodName': 'supvisors.get_all_local_process_info', 'params': []}]
+    mocked_call = mocker.patch.object(proxy, 'remote_call', side_effect=ValueError)
     # test with XML-RPC failure
-    mocked_rpc.side_effect = ValueError
-    assert proxy._is_authorized('10.0.0.1') is None
-    assert mocked_rpc.call_args_list == [call(proxy.srv_url.env)]
-    mocked_rpc.reset_mock()
-    # test with a mocked rpc interface
-    rpc_intf = DummyRpcInterface(proxy.supvisors)
-    mocked_call = mocker.patch.object(rpc_intf.supvisors, 'get_instance_info')
-    mocked_rpc.return_value = rpc_intf
-    mocked_rpc.side_effect = None
+    assert proxy._get_check_results('10.0.0.1') is None
+    assert mocked_call.call_args_list == [call('10.0.0.1', 'system.multicall', expected_calls)]
+    mocked_call.reset_mock()
+    # test with a single round trip
+    results = [{'statecode': 2}, {'fsm_statecode': 3}, [{'name': 'dummy_1'}]]
+    mocked_call.side_effect = None
+    mocked_call.return_value = results
+    assert proxy._get_check_results('10.0.0.1') == results
+    assert mocked_call.call_args_list == [call('10.0.0.1', 'system.multicall', expected_calls)]
+
+
+def test_proxy_is_authorized(proxy):
+    """ Test the SupervisorProxy._is_authorized method. """
+    # test with XML-RPC fault
+    assert proxy._is_authorized({'faultCode': 1, 'faultString': 'UNKNOWN_METHOD'}) is None
     # test with local Supvisors instance isolated by remote
     for state in ISOLATION_STATES:
-        mocked_call.return_value = {'statecode': state.value}
-        assert proxy._is_authorized('10.0.0.1') is False
-        assert mocked_call.call_args_list == [call(local_identifier)]
-        assert mocked_rpc.call_args_list == [call(proxy.srv_url.env)]
-        # reset counters
-        mocked_call.reset_mock()
-        mocked_rpc.reset_mock()
+        assert proxy._is_authorized({'statecode': state.value}) is False
     # test with local Supvisors instance not isolated by remote
     for state in [x for x in SupvisorsInstanceStates if x not in ISOLATION_STATES]:
-        mocked_call.return_value = {'statecode': state.value}
-        assert proxy._is_authorized('10.0.0.1') is True
-        assert mocked_call.call_args_list == [call(local_identifier)]
-        assert mocked_rpc.call_args_list == [call(proxy.srv_url.env)]
-        # reset counters
-        mocked_call.reset_mock()
-        mocked_rpc.reset_mock()
+        assert proxy._is_authorized({'statecode': state.value}) is True
     # test with local Supvisors instance not isolated by remote but returning an unknown state
-    mocked_call.return_value = {'statecode': 128}
-    assert proxy._is_authorized('10.0.0.1') is False
-    assert mocked_call.call_args_list == [call(local_identifier)]
-    assert mocked_rpc.call_args_list == [call(proxy.srv_url.env)]
+    assert proxy._is_authorized({'statecode': 128}) is False
 
 
-def test_proxy_transfer_process_info(mocker, mocked_rpc, proxy):
-    """ Test the SupervisorProxy._transfer_process_info method. """
-    mocked_rpc.reset_mock()
-    mocked_send = mocker.patch.object(proxy, 'send_remote_comm_event')
-    # test with XML-RPC failure
-    mocked_rpc.side_effect = ValueError
-    proxy._transfer_process_info('10.0.0.1')
-    assert mocked_rpc.call_args_list == [call(proxy.srv_url.env)]
-    assert not mocked_send.called
-    mocked_rpc.reset_mock()
-    # test with a mocked rpc interface
-    rpc_intf = DummyRpcInterface(proxy.supvisors)
+def test_proxy_get_process_info(proxy):
+    """ Test the SupervisorProxy._get_process_info method. """
+    # test with XML-RPC fault
+    assert proxy._get_process_info('10.0.0.1', {'faultCode': 2, 'faultString': 'FAILED'}) is None
+    # test with process information
     proc_info = [{'name': 'dummy_1'}, {'name': 'dummy_2'}]
-    mocked_call = mocker.patch.object(rpc_intf.supvisors, 'get_all_local_process_info', return_value=proc_info)
-    mocked_rpc.return_value = rpc_intf
-    mocked_rpc.side_effect = None
-    proxy._transfer_process_info('10.0.0.1')
-    assert mocked_call.call_args_list == [call()]
-    assert mocked_rpc.call_args_list == [call(proxy.srv_url.env)]
-    expected = InternalEventHeaders.ALL_INFO.value, ('10.0.0.1', proc_info)
-    assert mocked_send.call_args_list == [call((('10.0.0.1', 65000), expected))]
+    assert proxy._get_process_info('10.0.0.1', proc_info) == proc_info
 
 
-def test_proxy_transfer_states_modes(mocker, mocked_rpc, proxy):
-    """ Test the SupervisorProxy._transfer_states_modes method. """
-    mocked_rpc.reset_mock()
-    mocked_send = mocker.patch.object(proxy, 'send_remote_comm_event')
-    # test with XML-RPC failure
-    mocked_rpc.side_effect = ValueError
-    proxy._transfer_states_modes('10.0.0.1')
-    assert mocked_rpc.call_args_list == [call(proxy.srv_url.env)]
-    assert not mocked_send.called
-    mocked_rpc.reset_mock()
-    # test with a mocked rpc interface
-    rpc_intf = DummyRpcInterface(proxy.supvisors)
+def test_proxy_get_states_modes(proxy):
+    """ Test the SupervisorProxy._get_states_modes method. """
+    # test with XML-RPC fault
+    assert proxy._get_states_modes('10.0.0.1', {'faultCode': 2, 'faultString': 'FAILED'}) is None
+    # test with instance information
     instance_info = {'identifier': 'supvisors', 'node_name': '10.0.0.1', 'port': 65000, 'loading': 0,
                      'statecode': 3, 'statename': 'RUNNING',
                      'remote_time': 50, 'local_time': 60,
@@ -195,17 +414,9 @@ def test_proxy_transfer_states_modes(mocker, mocked_rpc, proxy):
                      'discovery_mode': True,
                      'master_identifier': '10.0.0.1',
                      'starting_jobs': False, 'stopping_jobs': True}
-    mocked_call = mocker.patch.object(rpc_intf.supvisors, 'get_instance_info', return_value=instance_info)
-    mocked_rpc.return_value = rpc_intf
-    mocked_rpc.side_effect = None
-    proxy._transfer_states_modes('10.0.0.1')
-    assert mocked_call.call_args_list == [call('10.0.0.1')]
-    assert mocked_rpc.call_args_list == [call(proxy.srv_url.env)]
-    expected = InternalEventHeaders.STATE.value, ('10.0.0.1', {'fsm_statecode': 6,
-                                                               'discovery_mode': True,
-                                                               'master_identifier': '10.0.0.1',
-                                                               'starting_jobs': False, 'stopping_jobs': True})
-    assert mocked_send.call_args_list == [call((('10.0.0.1', 65000), expected))]
+    expected = {'fsm_statecode': 6, 'discovery_mode': True, 'master_identifier': '10.0.0.1',
+                'starting_jobs': False, 'stopping_jobs': True}
+    assert proxy._get_states_modes('10.0.0.1', instance_info) == expected
 
 
 def test_proxy_start_process(mocker, mocked_rpc, proxy):
@@ -214,7 +425,7 @@ def test_proxy_start_process(mocker, mocked_rpc, proxy):
     mocked_rpc.side_effect = KeyError
     proxy.start_process('10.0.0.1', 'dummy_process', 'extra args')
     assert mocked_rpc.call_count == 2
-    assert mocked_rpc.call_args == call(proxy.srv_url.env)
+    assert mocked_rpc.call_args == call(proxy.get_env('10.0.0.1'))
     # test with a mocked rpc interface
     rpc_intf = DummyRpcInterface(proxy.supvisors)
     mocked_rpc.side_effect = None
@@ -222,7 +433,7 @@ def test_proxy_start_process(mocker, mocked_rpc, proxy):
     mocked_supvisors = mocker.patch.object(rpc_intf.supvisors, 'start_args')
     proxy.start_process('10.0.0.1', 'dummy_process', 'extra args')
     assert mocked_rpc.call_count == 3
-    assert mocked_rpc.call_args == call(proxy.srv_url.env)
+    assert mocked_rpc.call_args == call(proxy.get_env('10.0.0.1'))
     assert mocked_supvisors.call_count == 1
     assert mocked_supvisors.call_args == call('dummy_process', 'extra args', False)
 
@@ -233,7 +444,10 @@ def test_proxy_stop_process(mocker, mocked_rpc, proxy):
     mocked_rpc.side_effect = ConnectionResetError
     proxy.stop_process('10.0.0.1', 'dummy_process')
     assert mocked_rpc.call_count == 2
-    assert mocked_rpc.call_args == call(proxy.srv_url.env)
+    assert mocked_rpc.call_args == call(proxy.get_env('10.0.0.1'))
+    # the Supvisors instance has been marked as unreachable
+    assert '10.0.0.1' in proxy.unreachable
+    proxy.unreachable.clear()
     # test with a mocked rpc interface
     rpc_intf = DummyRpcInterface(proxy.supvisors)
     mocked_rpc.side_effect = None
@@ -241,7 +455,7 @@ def test_proxy_stop_process(mocker, mocked_rpc, proxy):
     mocked_supervisor = mocker.patch.object(rpc_intf.supervisor, 'stopProcess')
     proxy.stop_process('10.0.0.1', 'dummy_process')
     assert mocked_rpc.call_count == 3
-    assert mocked_rpc.call_args == call(proxy.srv_url.env)
+    assert mocked_rpc.call_args == call(proxy.get_env('10.0.0.1'))
     assert mocked_supervisor.call_count == 1
     assert mocked_supervisor.call_args == call('dummy_process', False)
 
@@ -252,7 +466,10 @@ def test_proxy_restart(mocker, mocked_rpc, proxy):
     mocked_rpc.side_effect = OSError
     proxy.restart('10.0.0.1')
     assert mocked_rpc.call_count == 2
-    assert mocked_rpc.call_args == call(proxy.srv_url.env)
+    assert mocked_rpc.call_args == call(proxy.get_env('10.0.0.1'))
+    # the Supvisors instance has been marked as unreachable
+    assert '10.0.0.1' in proxy.unreachable
+    proxy.unreachable.clear()
     # test with a mocked rpc interface
     rpc_intf = DummyRpcInterface(proxy.supvisors)
     mocked_rpc.side_effect = None
@@ -260,9 +477,12 @@ def test_proxy_restart(mocker, mocked_rpc, proxy):
     mocked_supervisor = mocker.patch.object(rpc_intf.supervisor, 'restart')
     proxy.restart('10.0.0.1')
     assert mocked_rpc.call_count == 3
-    assert mocked_rpc.call_args == call(proxy.srv_url.env)
+    assert mocked_rpc.call_args == call(proxy.get_env('10.0.0.1'))
     assert mocked_supervisor.call_count == 1
     assert mocked_supervisor.call_args == call()
+    # the XML-RPC client is not kept
+    assert rpc_intf.close.call_args_list == [call()]
+    assert proxy.remote_proxies == {}
 
 
 def test_proxy_shutdown(mocker, mocked_rpc, proxy):
@@ -271,7 +491,7 @@ def test_proxy_shutdown(mocker, mocked_rpc, proxy):
     mocked_rpc.side_effect = RPCError(12)
     proxy.shutdown('10.0.0.1')
     assert mocked_rpc.call_count == 2
-    assert mocked_rpc.call_args == call(proxy.srv_url.env)
+    assert mocked_rpc.call_args == call(proxy.get_env('10.0.0.1'))
     # test with a mocked rpc interface
     rpc_intf = DummyRpcInterface(proxy.supvisors)
     mocked_rpc.side_effect = None
@@ -279,9 +499,12 @@ def test_proxy_shutdown(mocker, mocked_rpc, proxy):
     mocked_shutdown = mocker.patch.object(rpc_intf.supervisor, 'shutdown')
     proxy.shutdown('10.0.0.1')
     assert mocked_rpc.call_count == 3
-    assert mocked_rpc.call_args == call(proxy.srv_url.env)
+    assert mocked_rpc.call_args == call(proxy.get_env('10.0.0.1'))
     assert mocked_shutdown.call_count == 1
     assert mocked_shutdown.call_args == call()
+    # the XML-RPC client is not kept
+    assert rpc_intf.close.call_args_list == [call()]
+    assert proxy.remote_proxies == {}
 
 
 def test_proxy_restart_sequence(mocker, mocked_rpc, proxy):
@@ -290,7 +513,10 @@ def test_proxy_restart_sequence(mocker, mocked_rpc, proxy):
     mocked_rpc.side_effect = OSError
     proxy.restart_sequence('10.0.0.1')
     assert mocked_rpc.call_count == 2
-    assert mocked_rpc.call_args == call(proxy.srv_url.env)
+    assert mocked_rpc.call_args == call(proxy.get_env('10.0.0.1'))
+    # the Supvisors instance has been marked as unreachable
+    assert '10.0.0.1' in proxy.unreachable
+    proxy.unreachable.clear()
     # test with a mocked rpc interface
     rpc_intf = DummyRpcInterface(proxy.supvisors)
     mocked_rpc.side_effect = None
@@ -298,7 +524,7 @@ def test_proxy_restart_sequence(mocker, mocked_rpc, proxy):
     mocked_supervisor = mocker.patch.object(rpc_intf.supvisors, 'restart_sequence')
     proxy.restart_sequence('10.0.0.1')
     assert mocked_rpc.call_count == 3
-    assert mocked_rpc.call_args == call(proxy.srv_url.env)
+    assert mocked_rpc.call_args == call(proxy.get_env('10.0.0.1'))
     assert mocked_supervisor.call_count == 1
     assert mocked_supervisor.call_args == call()
 
@@ -309,7 +535,10 @@ def test_proxy_restart_all(mocker, mocked_rpc, proxy):
     mocked_rpc.side_effect = OSError
     proxy.restart_all('10.0.0.1')
     assert mocked_rpc.call_count == 2
-    assert mocked_rpc.call_args == call(proxy.srv_url.env)
+    assert mocked_rpc.call_args == call(proxy.get_env('10.0.0.1'))
+    # the Supvisors instance has been marked as unreachable
+    assert '10.0.0.1' in proxy.unreachable
+    proxy.unreachable.clear()
     # test with a mocked rpc interface
     rpc_intf = DummyRpcInterface(proxy.supvisors)
     mocked_rpc.side_effect = None
@@ -317,7 +546,7 @@ def test_proxy_restart_all(mocker, mocked_rpc, proxy):
     mocked_supervisor = mocker.patch.object(rpc_intf.supvisors, 'restart')
     proxy.restart_all('10.0.0.1')
     assert mocked_rpc.call_count == 3
-    assert mocked_rpc.call_args == call(proxy.srv_url.env)
+    assert mocked_rpc.call_args == call(proxy.get_env('10.0.0.1'))
     assert mocked_supervisor.call_count == 1
     assert mocked_supervisor.call_args == call()
 
@@ -328,7 +557,7 @@ def test_proxy_shutdown_all(mocker, mocked_rpc, proxy):
     mocked_rpc.side_effect = RPCError(12)
     proxy.shutdown_all('10.0.0.1')
     assert mocked_rpc.call_count == 2
-    assert mocked_rpc.call_args == call(proxy.srv_url.env)
+    assert mocked_rpc.call_args == call(proxy.get_env('10.0.0.1'))
     # test with a mocked rpc interface
     rpc_intf = DummyRpcInterface(proxy.supvisors)
     mocked_rpc.side_effect = None
@@ -336,7 +565,7 @@ def test_proxy_shutdown_all(mocker, mocked_rpc, proxy):
     mocked_shutdown = mocker.patch.object(rpc_intf.supvisors, 'shutdown')
     proxy.shutdown_all('10.0.0.1')
     assert mocked_rpc.call_count == 3
-    assert mocked_rpc.call_args == call(proxy.srv_url.env)
+    assert mocked_rpc.call_args == call(proxy.get_env('10.0.0.1'))
     assert mocked_shutdown.call_count == 1
     assert mocked_shutdown.call_args == call()
 
@@ -345,11 +574,26 @@ def test_proxy_comm_event(mocker, mocked_rpc, proxy):
     """ Test the SupervisorProxy function to send a comm event to the local Supervisor. """
     # test rpc error
     mocker.patch.object(proxy.proxy.supervisor, 'sendRemoteCommEvent', side_effect=RPCError(100))
-    proxy.send_remote_comm_event('event data')
+    proxy.send_remote_comm_event(['event data'])
     # test with a mocked rpc interface
     mocked_supervisor = mocker.patch.object(proxy.proxy.supervisor, 'sendRemoteCommEvent')
-    proxy.send_remote_comm_event('event data')
-    assert mocked_supervisor.call_args_list == [call('Supvisors', '"event data"')]
+    proxy.send_remote_comm_event(['event data', 'other data'])
+    assert mocked_supervisor.call_args_list == [call('Supvisors', json_dumps(['event data', 'other data']))]
+    mocked_supervisor.reset_mock()
+    # test with a stale connection: the connection is closed and the event is sent again
+    mocked_supervisor.side_effect = [RemoteDisconnected(), None]
+    proxy.send_remote_comm_event(['event data'])
+    assert proxy.proxy.call_args_list == [call('close')]
+    payload = json_dumps(['event data'])
+    assert mocked_supervisor.call_args_list == [call('Supvisors', payload), call('Supvisors', payload)]
+
+
+def test_json_dumps():
+    """ Test the JSON encoding of the events sent to Supervisor. """
+    # the events are decoded by the Supvisors listener using json
+    event = [['10.0.0.1', 65100], [1, ['10.0.0.1', {'when': 1234.5, 'sequence_counter': 12, 'stats': {3: [0.5]},
+                                                        'name': 'dummy', 'flag': True, 'none': None}]]]
+    assert json.loads(json_dumps([event, event])) == json.loads(json.dumps([event, event]))
 
 
 def check_call(proxy, mocked_loop, method_name, request, args):
@@ -357,7 +601,6 @@ def check_call(proxy, mocked_loop, method_name, request, args):
     # send request
     proxy.execute(request, args)
     # test mocked main loop
-    assert proxy.srv_url.env['SUPERVISOR_SERVER_URL'] == 'http://10.0.0.2:65000'
     for key, mocked in mocked_loop.items():
         if key == method_name:
             assert mocked.call_count == 1
@@ -398,6 +641,13 @@ def test_proxy_execute(mocker, proxy):
     # test shutdown
     check_call(proxy, mocked_proxy, 'shutdown_all',
                DeferredRequestHeaders.SHUTDOWN_ALL, ('10.0.0.2',))
+    # the requests handled by the main loop itself are ignored
+    check_call(proxy, mocked_proxy, None, DeferredRequestHeaders.ISOLATE_INSTANCES, ('10.0.0.2',))
+    check_call(proxy, mocked_proxy, None, DeferredRequestHeaders.CONNECT_INSTANCE, ('10.0.0.2',))
+    # all the other requests are served by the proxy
+    assert set(SupervisorProxy.ExecuteMethods.keys()) == (set(DeferredRequestHeaders)
+                                                          - {DeferredRequestHeaders.ISOLATE_INSTANCES,
+                                                             DeferredRequestHeaders.CONNECT_INSTANCE})
 
 
 def wait_loop_connected(main_loop: SupvisorsMainLoop, max_time: int = 10) -> bool:
@@ -434,6 +684,13 @@ def main_loop(supvisors):
     supvisors.internal_com.stop()
 
 
+def test_create_event_loop():
+    """ Test the creation of the asynchronous event loop used in the main loop thread. """
+    async_loop = create_event_loop()
+    assert isinstance(async_loop, asyncio.AbstractEventLoop)
+    async_loop.close()
+
+
 def test_mainloop_creation(supvisors, main_loop):
     """ Test the values set at construction. """
     assert isinstance(main_loop, threading.Thread)
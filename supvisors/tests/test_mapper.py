@@ -36,6 +36,29 @@ def test_get_addresses(supvisors):
     assert get_addresses('unknown node', supvisors.logger) is None
 
 
+def test_get_addresses_resolutions(mocker, supvisors):
+    """ Test the re-use of the host resolutions. """
+    mocked_resolve = mocker.patch('supvisors.internal_com.mapper.gethostbyaddr',
+                                  side_effect=[gaierror, ('rocky51', ['rocky51.cliche.bzh'], ['10.0.0.1']),
+                                               ('rocky51', ['rocky51.cliche.bzh'], ['10.0.0.2'])])
+    resolutions = {}
+    # failures are not stored
+    assert get_addresses('rocky51', supvisors.logger, resolutions) is None
+    assert resolutions == {}
+    # successful resolutions are stored and re-used
+    addresses = get_addresses('rocky51', supvisors.logger, resolutions)
+    assert addresses == ('rocky51', ['rocky51.cliche.bzh'], ['10.0.0.1'])
+    other_addresses = get_addresses('rocky51', supvisors.logger, resolutions)
+    assert other_addresses == addresses
+    assert mocked_resolve.call_args_list == [call('rocky51'), call('rocky51')]
+    # the lists are not shared
+    assert other_addresses[1] is not addresses[1]
+    assert other_addresses[2] is not addresses[2]
+    # no storage without resolutions
+    assert get_addresses('rocky51', supvisors.logger) == ('rocky51', ['rocky51.cliche.bzh'], ['10.0.0.2'])
+    assert mocked_resolve.call_args_list == [call('rocky51'), call('rocky51'), call('rocky51')]
+
+
 def test_sup_id_create_no_match(supvisors):
     """ Test the values set at SupvisorsInstanceId construction. """
     no_matches = ['', 'ident>', 'cliche81:12000', '10.0.0.1:145000:28']
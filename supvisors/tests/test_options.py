@@ -515,6 +515,7 @@ def test_server_options(mocker, server_opt):
     assert server_opt.parser is None
     assert server_opt.program_class == {}
     assert server_opt.program_processes == {}
+    assert server_opt.program_numprocs == {}
     assert server_opt.processes_program == {}
     assert server_opt.process_indexes == {}
     # call realize
@@ -531,6 +532,7 @@ def test_server_options(mocker, server_opt):
                                   'dummies': {'dummy_group': ['dummy_0', 'dummy_1', 'dummy_2']},
                                   'dummy': {'dummy_group': ['dummy']},
                                   'dummy_ears': {'dummy_ears': ['dummy_ears_20', 'dummy_ears_21']}}
+    assert server.program_numprocs == {'dumber': 2, 'dummies': 3, 'dummy': 1, 'dummy_ears': 2}
     assert server.program_class['dummy'] is ProcessConfig
     assert server.program_class['dummies'] is ProcessConfig
     assert server.program_class['dumber'] is FastCGIProcessConfig
@@ -538,9 +540,11 @@ def test_server_options(mocker, server_opt):
     # udpate procnums of a program
     assert server.update_numprocs('dummies', 1) == 'program:dummies'
     assert server.parser['program:dummies']['numprocs'] == '1'
+    assert server.program_numprocs['dummies'] == 1
     # reload programs
-    result = server.reload_processes_from_section('program:dummies', 'dummy_group')
-    expected_printable = [process.name for process in result]
+    result = server.reload_processes_from_section('program:dummies', ['dummy_group'])
+    assert list(result.keys()) == ['dummy_group']
+    expected_printable = [process.name for process in result['dummy_group']]
     assert expected_printable == ['dummy_0']
     assert server.process_indexes == {'dummy': 0, 'dummy_0': 0, 'dumber_10': 0, 'dumber_11': 1,
                                       'dummy_ears_20': 0, 'dummy_ears_21': 1}
@@ -548,16 +552,19 @@ def test_server_options(mocker, server_opt):
     assert server.update_numprocs('dumber', 1) == 'fcgi-program:dumber'
     assert server.parser['fcgi-program:dumber']['numprocs'] == '1'
     # reload programs
-    result = server.reload_processes_from_section('fcgi-program:dumber', 'dumber')
-    expected_printable = [process.name for process in result]
+    result = server.reload_processes_from_section('fcgi-program:dumber', ['dumber'])
+    assert list(result.keys()) == ['dumber']
+    expected_printable = [process.name for process in result['dumber']]
     assert expected_printable == ['dumber_10']
     assert server.process_indexes == {'dummy': 0, 'dummy_0': 0, 'dumber_10': 0, 'dummy_ears_20': 0, 'dummy_ears_21': 1}
     # udpate procnums of an event listener
     assert server.update_numprocs('dummy_ears', 3) == 'eventlistener:dummy_ears'
     assert server.parser['eventlistener:dummy_ears']['numprocs'] == '3'
+    assert server.program_numprocs['dummy_ears'] == 3
     # reload programs
-    result = server.reload_processes_from_section('eventlistener:dummy_ears', 'dummy_ears')
-    expected_printable = [process.name for process in result]
+    result = server.reload_processes_from_section('eventlistener:dummy_ears', ['dummy_ears'])
+    assert list(result.keys()) == ['dummy_ears']
+    expected_printable = [process.name for process in result['dummy_ears']]
     assert expected_printable == ['dummy_ears_20', 'dummy_ears_21', 'dummy_ears_22']
     assert server.process_indexes == {'dummy': 0, 'dummy_0': 0, 'dumber_10': 0,
                                       'dummy_ears_20': 0, 'dummy_ears_21': 1, 'dummy_ears_22': 2}
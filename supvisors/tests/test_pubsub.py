@@ -408,3 +408,30 @@ async def test_subscriber_connection_refused(publisher, subscriber, stop_event):
         stop_event.set()
 
     await run_async_tasks(subscriber, [stop_task()], 5.0)
+
+
+@pytest.mark.asyncio
+async def test_subscriber_connection_limit(mocker, supvisors, stop_event):
+    """ Test that the simultaneous connection attempts to the publishers are bounded. """
+    attempts = {'current': 0, 'max': 0}
+
+    async def open_connection(*_):
+        attempts['current'] += 1
+        attempts['max'] = max(attempts['max'], attempts['current'])
+        await asyncio.sleep(0.1)
+        attempts['current'] -= 1
+        raise ConnectionRefusedError
+    mocker.patch('asyncio.open_connection', side_effect=open_connection)
+    # declare 100 remote Supvisors instances
+    mapper = supvisors.mapper
+    local_instance_id: SupvisorsInstanceId = mapper.local_instance
+    mapper._instances = {f'async_test_{idx}': local_instance_id for idx in range(100)}
+    mapper._instances[mapper.local_identifier] = local_instance_id
+    subscribers = InternalAsyncSubscribers(asyncio.Queue(), stop_event, supvisors)
+
+    async def stop_task():
+        await asyncio.sleep(1.0)
+        stop_event.set()
+
+    await run_async_tasks(subscribers, [stop_task()], 5.0)
+    assert attempts['max'] == MAX_CONNECTION_ATTEMPTS
@@ -18,6 +18,7 @@
 # ======================================================================
 
 from socket import socketpair
+from unittest.mock import call
 
 import pytest
 
@@ -165,3 +166,34 @@ def test_push_error(supvisors, push_pull):
     pusher = RequestPusher(push_pull[0], supvisors.logger)
     push_pull[0].close()
     pusher.send_shutdown('10.0.0.1')
+
+
+def test_push_batch(supvisors, push_pull):
+    """ Test the RequestPusher batch of messages. """
+    pusher = RequestPusher(push_pull[0], supvisors.logger)
+    assert pusher.batch_buffers is None
+    push_pull[1].setblocking(False)
+    # test that the messages are gathered and not sent during the batch
+    pusher.start_batch()
+    pusher.send_stop_process('10.0.0.1', 'group:name_1')
+    pusher.send_stop_process('10.0.0.2', 'group:name_2')
+    assert len(pusher.batch_buffers) == 2
+    with pytest.raises(BlockingIOError):
+        push_pull[1].recv(1024)
+    # test that the messages are sent at once and can be read one by one
+    expected = pusher.batch_buffers[0] + pusher.batch_buffers[1]
+    pusher.send_batch()
+    assert pusher.batch_buffers is None
+    assert push_pull[1].recv(1024) == expected
+    # test that an empty batch sends nothing
+    pusher.start_batch()
+    pusher.send_batch()
+    with pytest.raises(BlockingIOError):
+        push_pull[1].recv(1024)
+    # test the exception management
+    pusher.start_batch()
+    pusher.send_shutdown('10.0.0.1')
+    push_pull[0].close()
+    pusher.send_batch()
+    assert pusher.batch_buffers is None
+    assert supvisors.logger.error.call_args_list == [call('RequestPusher.send_batch: failed to send 1 messages')]
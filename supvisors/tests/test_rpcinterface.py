@@ -118,15 +118,16 @@ def test_application_info(mocker, rpc):
 
 def test_all_applications_info(mocker, rpc):
     """ Test the get_all_applications_info RPC. """
-    mocked_get = mocker.patch('supvisors.rpcinterface.RPCInterface.get_application_info',
-                              side_effect=[{'name': 'appli_1'}, {'name': 'appli_2'}])
+    mocked_get = mocker.patch('supvisors.rpcinterface.RPCInterface.get_application_info')
     mocked_check = mocker.patch('supvisors.rpcinterface.RPCInterface._check_from_deployment')
     # prepare context
-    rpc.supvisors.context.applications = {'dummy_1': None, 'dummy_2': None}
+    rpc.supvisors.context.applications = {'dummy_1': Mock(**{'serial.return_value': {'name': 'appli_1'}}),
+                                          'dummy_2': Mock(**{'serial.return_value': {'name': 'appli_2'}})}
     # test RPC call
     assert rpc.get_all_applications_info() == [{'name': 'appli_1'}, {'name': 'appli_2'}]
     assert mocked_check.call_args_list == [call()]
-    assert mocked_get.call_args_list == [call('dummy_1'), call('dummy_2')]
+    # the state is checked once and the applications are not looked up again
+    assert not mocked_get.called
 
 
 def test_process_info(mocker, rpc):
@@ -185,10 +186,13 @@ def test_all_local_process_info(mocker, rpc):
     info_source = rpc.supvisors.supervisor_data
     mocked_rpc = info_source.supervisor_rpc_interface.getAllProcessInfo
     mocked_rpc.return_value = [{'group': 'dummy_group', 'name': 'dummy_name'}]
+    mocked_options = mocker.patch.object(info_source, 'get_all_process_config_options',
+                                         return_value={'dummy_group:dummy_name': {'startsecs': 2}})
     # test RPC call with process namespec
     assert rpc.get_all_local_process_info() == [{'group': 'group', 'name': 'name'}]
     assert mocked_rpc.call_args_list == [call()]
-    assert mocked_get.call_args_list == [call({'group': 'dummy_group', 'name': 'dummy_name'})]
+    assert mocked_options.call_args_list == [call(('startsecs', 'stopwaitsecs', 'extra_args', 'disabled'))]
+    assert mocked_get.call_args_list == [call({'group': 'dummy_group', 'name': 'dummy_name'}, {'startsecs': 2})]
 
 
 def test_application_rules(mocker, rpc):
@@ -759,7 +763,7 @@ def test_start_any_process_no_identifier(mocker, rpc):
     assert exc.value.args == (Faults.BAD_NAME, 'no candidate process matching ":x"')
     assert mocked_check.call_args_list == [call()]
     assert mocked_find.call_args_list == [call(':x')]
-    assert mocked_instance.call_args_list == [call(rpc.supvisors, StartingStrategies.CONFIG, ['10.0.0.1'], 10)]
+    assert mocked_instance.call_args_list == [call(rpc.supvisors, StartingStrategies.CONFIG, ['10.0.0.1'], 10, True)]
     assert not mocked_start.called
 
 
@@ -776,7 +780,7 @@ def test_start_any_process_no_wait(mocker, rpc):
     assert rpc.start_any_process(0, ':x', '-x 2', False) == 'process_1'
     assert mocked_check.call_args_list == [call()]
     assert mocked_find.call_args_list == [call(':x')]
-    assert mocked_instance.call_args_list == [call(rpc.supvisors, StartingStrategies.CONFIG, ['10.0.0.1'], 10)]
+    assert mocked_instance.call_args_list == [call(rpc.supvisors, StartingStrategies.CONFIG, ['10.0.0.1'], 10, True)]
     assert mocked_start.call_args_list == [call(0, 'process_1', '-x 2', False)]
 
 
@@ -795,7 +799,7 @@ def test_start_any_process_wait(mocker, rpc):
     assert callable(deferred)
     assert mocked_check.call_args_list == [call()]
     assert mocked_find.call_args_list == [call(':x')]
-    assert mocked_instance.call_args_list == [call(rpc.supvisors, StartingStrategies.CONFIG, ['10.0.0.1'], 10)]
+    assert mocked_instance.call_args_list == [call(rpc.supvisors, StartingStrategies.CONFIG, ['10.0.0.1'], 10, True)]
     assert mocked_start.call_args_list == [call(0, 'process_1', '-x 2', True)]
     # test the deferred function
     assert deferred() is NOT_DONE_YET
@@ -950,14 +954,15 @@ def check_restart_deferred_function(mocker, rpc, app_proc, deferred):
     assert mocked_stop_progress.called
     assert not mocked_start_progress.called
     mocked_stop_progress.reset_mock()
-    # 2nd call: Stopper completed / Starter working
+    # 2nd call: Stopper completed / Starter working. Starter is checked in the same call
     mocked_start_progress.return_value = True
     mocked_stop_progress.return_value = False
     assert deferred() is NOT_DONE_YET
     assert not deferred.waitstop
     assert mocked_stop_progress.called
-    assert not mocked_start_progress.called
+    assert mocked_start_progress.called
     mocked_stop_progress.reset_mock()
+    mocked_start_progress.reset_mock()
     # 3rd call: Starter still working
     assert deferred() is NOT_DONE_YET
     assert not deferred.waitstop
@@ -1770,16 +1775,24 @@ def test_get_local_info(mocker, rpc):
             'description': 'process dead',
             'spawnerr': ''}
     supervisor_data = rpc.supvisors.supervisor_data
-    mocker.patch.object(supervisor_data, 'get_process_config_options',
-                        return_value={'extra_args': '-x dummy_args', 'startsecs': 2, 'stopwaitsecs': 10})
+    mocked_options = mocker.patch.object(supervisor_data, 'get_process_config_options',
+                                         return_value={'extra_args': '-x dummy_args', 'startsecs': 2,
+                                                       'stopwaitsecs': 10})
     # test call
-    assert rpc._get_local_info(info) == {'group': 'dummy_group', 'name': 'dummy_name',
-                                         'extra_args': '-x dummy_args',
-                                         'state': 0, 'statename': 'STOPPED',
-                                         'start': 1234, 'stop': 7777, 'now': 4321.0, 'pid': 4567,
-                                         'description': 'process dead', 'expected': True, 'spawnerr': '',
-                                         'startsecs': 2, 'stopwaitsecs': 10,
-                                         'program_name': 'dummy_name', 'process_index': 0}
+    expected = {'group': 'dummy_group', 'name': 'dummy_name',
+                'extra_args': '-x dummy_args',
+                'state': 0, 'statename': 'STOPPED',
+                'start': 1234, 'stop': 7777, 'now': 4321.0, 'pid': 4567,
+                'description': 'process dead', 'expected': True, 'spawnerr': '',
+                'startsecs': 2, 'stopwaitsecs': 10,
+                'program_name': 'dummy_name', 'process_index': 0}
+    assert rpc._get_local_info(info) == expected
+    assert mocked_options.call_args_list == [call('dummy_group:dummy_name',
+                                                  ('startsecs', 'stopwaitsecs', 'extra_args', 'disabled'))]
+    mocked_options.reset_mock()
+    # test call with options provided
+    assert rpc._get_local_info(info, {'extra_args': '-x dummy_args', 'startsecs': 2, 'stopwaitsecs': 10}) == expected
+    assert not mocked_options.called
 
 
 def test_start_process(mocker, supvisors):
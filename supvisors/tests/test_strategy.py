@@ -62,6 +62,25 @@ def starting_strategy(filled_instances):
     return AbstractStartingStrategy(filled_instances)
 
 
+def test_get_instance_load(starting_strategy):
+    """ Test the cache of the Supvisors instances load. """
+    local_identifier = starting_strategy.supvisors.mapper.local_identifier
+    local_status = starting_strategy.supvisors.context.instances[local_identifier]
+    assert starting_strategy.instances_load == {}
+    assert not starting_strategy.check_only
+    # first call computes the load
+    assert starting_strategy.get_instance_load(local_identifier) == 50
+    assert local_status.get_load.call_count == 1
+    assert starting_strategy.instances_load == {local_identifier: 50}
+    # next calls re-use it
+    assert starting_strategy.get_instance_load(local_identifier) == 50
+    assert local_status.get_load.call_count == 1
+    # test with loads provided at construction
+    strategy = AbstractStartingStrategy(starting_strategy.supvisors, {local_identifier: 25})
+    assert strategy.get_instance_load(local_identifier) == 25
+    assert local_status.get_load.call_count == 1
+
+
 def test_is_loading_valid(starting_strategy, load_details):
     """ Test the validity of an address with an additional loading. """
     local_identifier = starting_strategy.supvisors.mapper.local_identifier
@@ -98,19 +117,43 @@ def test_get_loading_and_validity(starting_strategy, load_details):
                                                       load_details) == expected
 
 
-def test_sort_valid_by_instance_load(starting_strategy):
-    """ Test the AbstractStartingStrategy.sort_valid_by_instance_load method. """
+def test_select_valid_by_instance_load(starting_strategy):
+    """ Test the AbstractStartingStrategy.select_valid_by_instance_load method. """
     # first test
     parameters = {'10.0.0.0': (False, 0, 0), '10.0.0.1': (True, 20, 50), '10.0.0.2': (False, 0, 0),
                   '10.0.0.3': (True, 20, 30), '10.0.0.4': (False, 0, 0), '10.0.0.5': (True, 80, 10)}
-    expected = [('10.0.0.5', 80, 10), ('10.0.0.3', 20, 30), ('10.0.0.1', 20, 50)]
-    assert starting_strategy.sort_valid_by_instance_load(parameters) == expected
+    assert starting_strategy.select_valid_by_instance_load(parameters) == '10.0.0.5'
+    assert starting_strategy.select_valid_by_instance_load(parameters, True) == '10.0.0.1'
     # second test
     parameters = {'10.0.0.1': (False, 0, 50), '10.0.0.3': (True, 30, 20), '10.0.0.5': (False, 80, 10)}
-    assert starting_strategy.sort_valid_by_instance_load(parameters) == [('10.0.0.3', 30, 20)]
+    assert starting_strategy.select_valid_by_instance_load(parameters) == '10.0.0.3'
+    assert starting_strategy.select_valid_by_instance_load(parameters, True) == '10.0.0.3'
     # third test
     parameters = {'10.0.0.1': (False, 0, 50), '10.0.0.3': (False, 30, 20), '10.0.0.5': (False, 80, 10)}
-    assert starting_strategy.sort_valid_by_instance_load(parameters) == []
+    assert starting_strategy.select_valid_by_instance_load(parameters) is None
+    assert starting_strategy.select_valid_by_instance_load(parameters, True) is None
+    # test ties: the node load is considered, then the order (first for lowest, last for highest)
+    parameters = {'10.0.0.1': (True, 20, 10), '10.0.0.3': (True, 10, 10), '10.0.0.5': (True, 10, 10),
+                  '10.0.0.6': (True, 20, 10)}
+    assert starting_strategy.select_valid_by_instance_load(parameters) == '10.0.0.3'
+    assert starting_strategy.select_valid_by_instance_load(parameters, True) == '10.0.0.6'
+
+
+def test_select_valid_by_node_load(starting_strategy):
+    """ Test the AbstractStartingStrategy.select_valid_by_node_load method. """
+    # first test
+    parameters = {'10.0.0.0': (False, 0, 0), '10.0.0.1': (True, 20, 50), '10.0.0.2': (False, 0, 0),
+                  '10.0.0.3': (True, 20, 30), '10.0.0.4': (False, 0, 0), '10.0.0.5': (True, 80, 10)}
+    assert starting_strategy.select_valid_by_node_load(parameters) == '10.0.0.3'
+    assert starting_strategy.select_valid_by_node_load(parameters, True) == '10.0.0.5'
+    # second test
+    parameters = {'10.0.0.1': (False, 0, 50), '10.0.0.3': (False, 30, 20), '10.0.0.5': (False, 80, 10)}
+    assert starting_strategy.select_valid_by_node_load(parameters) is None
+    assert starting_strategy.select_valid_by_node_load(parameters, True) is None
+    # test ties: first for lowest, last for highest
+    parameters = {'10.0.0.1': (True, 10, 10), '10.0.0.3': (True, 10, 10)}
+    assert starting_strategy.select_valid_by_node_load(parameters) == '10.0.0.1'
+    assert starting_strategy.select_valid_by_node_load(parameters, True) == '10.0.0.3'
 
 
 def test_abstract_get_node(starting_strategy):
@@ -131,6 +174,10 @@ def test_config_strategy(filled_instances, load_details):
     assert strategy.get_supvisors_instance(instances, 45, load_details) == '10.0.0.3'
     assert strategy.get_supvisors_instance(instances, 65, load_details) == '10.0.0.3'
     assert strategy.get_supvisors_instance(instances, 85, load_details) is None
+    # test that the Supvisors instances after the first valid one are not evaluated
+    strategy.instances_load = {}
+    assert strategy.get_supvisors_instance(instances, 15, load_details) == local_identifier
+    assert list(strategy.instances_load.keys()) == [local_identifier]
 
 
 def test_less_loaded_strategy(filled_instances, load_details):
@@ -200,6 +247,113 @@ def test_local_strategy(filled_instances, load_details):
     assert strategy.get_supvisors_instance(instances, 0, load_details) is None
 
 
+def test_weighted_random_strategy(mocker, filled_instances, load_details):
+    """ Test the choice of an identifier according to the WEIGHTED_RANDOM strategy. """
+    mocked_choices = mocker.patch('random.choices', side_effect=lambda x, weights: [x[-1]])
+    strategy = WeightedRandomStrategy(filled_instances)
+    local_identifier = filled_instances.mapper.local_identifier
+    instances = [local_identifier, '10.0.0.3', '10.0.0.5', 'test']
+    # test WEIGHTED_RANDOM strategy with different values
+    assert strategy.get_supvisors_instance(instances, 0, load_details) == 'test'
+    assert mocked_choices.call_args_list == [call(instances, weights=[41, 71, 1, 41])]
+    mocked_choices.reset_mock()
+    assert strategy.get_supvisors_instance(instances, 45, load_details) == '10.0.0.3'
+    assert mocked_choices.call_args_list == [call(['10.0.0.3'], weights=[26])]
+    mocked_choices.reset_mock()
+    assert strategy.get_supvisors_instance(instances, 85, load_details) is None
+    assert not mocked_choices.called
+
+
+def test_weighted_round():
+    """ Test the interleaved weighted round-robin selection over a set of candidates. """
+    weights = {'10.0.0.1': 6, '10.0.0.2': 2, '10.0.0.3': 4}
+    weighted_round = WeightedRound(weights)
+    # test that weights are reduced
+    assert weighted_round.round_weights == {'10.0.0.1': 3, '10.0.0.2': 1, '10.0.0.3': 2}
+    assert list(weighted_round.current_round) == [('10.0.0.1', 3), ('10.0.0.2', 1), ('10.0.0.3', 2)]
+    assert not weighted_round.next_round
+    # test that choices are interleaved over rounds
+    choices = [weighted_round.select(lambda x: True) for _ in range(6)]
+    assert choices == ['10.0.0.1', '10.0.0.2', '10.0.0.3', '10.0.0.1', '10.0.0.3', '10.0.0.1']
+    assert not weighted_round.current_round
+    assert list(weighted_round.next_round) == [('10.0.0.2', 1), ('10.0.0.3', 2), ('10.0.0.1', 3)]
+    # test that an invalid instance loses its turn
+    choices = [weighted_round.select(lambda x: x != '10.0.0.1') for _ in range(3)]
+    assert choices == ['10.0.0.2', '10.0.0.3', '10.0.0.3']
+    assert list(weighted_round.current_round) == []
+    assert list(weighted_round.next_round) == [('10.0.0.2', 1), ('10.0.0.1', 3), ('10.0.0.3', 2)]
+    # test that every candidate is considered once when none is valid
+    mocked_valid = Mock(return_value=False)
+    assert weighted_round.select(mocked_valid) is None
+    assert mocked_valid.call_args_list == [call('10.0.0.2'), call('10.0.0.1'), call('10.0.0.3')]
+    # test that a check does not change the rounds
+    assert list(weighted_round.current_round) == []
+    assert list(weighted_round.next_round) == [('10.0.0.2', 1), ('10.0.0.1', 3), ('10.0.0.3', 2)]
+    assert weighted_round.select(lambda x: x != '10.0.0.2', True) == '10.0.0.1'
+    mocked_valid.reset_mock()
+    assert weighted_round.select(mocked_valid, True) is None
+    assert mocked_valid.call_args_list == [call('10.0.0.2'), call('10.0.0.1'), call('10.0.0.3')]
+    assert list(weighted_round.current_round) == []
+    assert list(weighted_round.next_round) == [('10.0.0.2', 1), ('10.0.0.1', 3), ('10.0.0.3', 2)]
+
+
+def test_interleaved_weighted_round_robin():
+    """ Test the interleaved weighted round-robin selection over several sets of candidates. """
+    round_robin = InterleavedWeightedRoundRobin()
+    assert round_robin.rounds == {}
+    # test that a rotation is created per set of candidates and weights
+    weights_ab = {'10.0.0.1': 1, '10.0.0.2': 1}
+    weights_abc = {'10.0.0.1': 1, '10.0.0.2': 1, '10.0.0.3': 1}
+    choices = [round_robin.select(weights, lambda x: True) for _ in range(3) for weights in [weights_ab, weights_abc]]
+    assert choices == ['10.0.0.1', '10.0.0.1', '10.0.0.2', '10.0.0.2', '10.0.0.1', '10.0.0.3']
+    assert sorted(round_robin.rounds.keys(), key=len) == [frozenset(weights_ab.items()),
+                                                          frozenset(weights_abc.items())]
+    key_ab = frozenset(weights_ab.items())
+    assert list(round_robin.rounds[key_ab].current_round) == [('10.0.0.2', 1)]
+    assert list(round_robin.rounds[key_ab].next_round) == [('10.0.0.1', 1)]
+    # test that a rotation is kept whatever the order of the candidates
+    assert round_robin.select({'10.0.0.2': 1, '10.0.0.1': 1}, lambda x: True) == '10.0.0.2'
+    assert len(round_robin.rounds) == 2
+    # test that another weight gives another rotation
+    assert round_robin.select({'10.0.0.1': 1, '10.0.0.2': 2}, lambda x: True) == '10.0.0.1'
+    assert len(round_robin.rounds) == 3
+    # test that checks before starts do not consume the turns
+    round_robin = InterleavedWeightedRoundRobin()
+    choices = []
+    for _ in range(4):
+        assert round_robin.select(weights_ab, lambda x: True, True) is not None
+        choices.append(round_robin.select(weights_ab, lambda x: True))
+    assert choices == ['10.0.0.1', '10.0.0.2', '10.0.0.1', '10.0.0.2']
+
+
+def test_weighted_round_robin_strategy(filled_instances, load_details):
+    """ Test the choice of an identifier according to the WEIGHTED_ROUND_ROBIN strategy. """
+    strategy = WeightedRoundRobinStrategy(filled_instances)
+    local_identifier = filled_instances.mapper.local_identifier
+    instances = [local_identifier, '10.0.0.3', '10.0.0.5', 'test']
+    # test weights when the number of processor cores is unknown or known
+    assert strategy.get_weights(instances) == {local_identifier: 1, '10.0.0.3': 1, '10.0.0.5': 1, 'test': 1}
+    filled_instances.host_compiler.nb_cores = {local_identifier: 4, '10.0.0.3': 2}
+    assert strategy.get_weights(instances) == {local_identifier: 4, '10.0.0.3': 2, '10.0.0.5': 1, 'test': 1}
+    # test WEIGHTED_ROUND_ROBIN strategy with different values
+    choices = [strategy.get_supvisors_instance(instances, 0, load_details) for _ in range(8)]
+    assert choices == [local_identifier, '10.0.0.3', '10.0.0.5', 'test', local_identifier, '10.0.0.3',
+                       local_identifier, local_identifier]
+    assert strategy.get_supvisors_instance(instances, 45, load_details) == '10.0.0.3'
+    assert strategy.get_supvisors_instance(instances, 85, load_details) is None
+    # test that a check-only strategy does not change the rotation
+    weighted_round = next(iter(filled_instances.round_robin.rounds.values()))
+    assert list(weighted_round.current_round) == [(local_identifier, 4), ('10.0.0.3', 2)]
+    assert list(weighted_round.next_round) == [('10.0.0.5', 1), ('test', 1)]
+    check_strategy = WeightedRoundRobinStrategy(filled_instances, check_only=True)
+    assert check_strategy.check_only
+    assert check_strategy.get_supvisors_instance(instances, 45, load_details) == '10.0.0.3'
+    assert check_strategy.get_supvisors_instance(instances, 85, load_details) is None
+    assert list(weighted_round.current_round) == [(local_identifier, 4), ('10.0.0.3', 2)]
+    assert list(weighted_round.next_round) == [('10.0.0.5', 1), ('test', 1)]
+    assert strategy.get_supvisors_instance(instances, 0, load_details) == local_identifier
+
+
 def test_get_supvisors_instance_no_candidate(supvisors):
     """ Test the choice of a Supvisors instance according to a strategy when no candidate is available. """
     local_identifier = supvisors.mapper.local_identifier
@@ -210,6 +364,8 @@ def test_get_supvisors_instance_no_candidate(supvisors):
     assert get_supvisors_instance(supvisors, StartingStrategies.LESS_LOADED_NODE, instances, 0) is None
     assert get_supvisors_instance(supvisors, StartingStrategies.MOST_LOADED_NODE, instances, 0) is None
     assert get_supvisors_instance(supvisors, StartingStrategies.LOCAL, instances, 0) is None
+    assert get_supvisors_instance(supvisors, StartingStrategies.WEIGHTED_ROUND_ROBIN, instances, 0) is None
+    assert get_supvisors_instance(supvisors, StartingStrategies.WEIGHTED_RANDOM, instances, 0) is None
 
 
 def test_get_supvisors_instance(filled_instances, load_details):
@@ -242,6 +398,17 @@ def test_get_supvisors_instance(filled_instances, load_details):
     strategy = StartingStrategies.LOCAL
     for load, result in [(0, local_identifier), (15, local_identifier), (65, None)]:
         assert get_supvisors_instance(filled_instances, strategy, instances, load) == result
+    # test WEIGHTED_ROUND_ROBIN strategy
+    strategy = StartingStrategies.WEIGHTED_ROUND_ROBIN
+    for _ in range(2):
+        assert get_supvisors_instance(filled_instances, strategy, instances, 0, True) == local_identifier
+    for load, result in [(0, local_identifier), (15, '10.0.0.3'), (0, '10.0.0.5'), (65, '10.0.0.3'), (85, None)]:
+        assert get_supvisors_instance(filled_instances, strategy, instances, load) == result
+    # test WEIGHTED_RANDOM strategy
+    strategy = StartingStrategies.WEIGHTED_RANDOM
+    assert get_supvisors_instance(filled_instances, strategy, instances, 0) in instances
+    for load, result in [(65, '10.0.0.3'), (85, None)]:
+        assert get_supvisors_instance(filled_instances, strategy, instances, load) == result
 
 
 def test_get_node(mocker, filled_instances):
@@ -278,6 +445,9 @@ def conflicts(supvisors):
 def test_senicide_strategy(supvisors, conflicts):
     """ Test the strategy that consists in stopping the oldest processes. """
     strategy = SenicideStrategy(supvisors)
+    assert isinstance(strategy, UptimeStrategy)
+    assert strategy.pickup_logic is min
+    assert strategy.class_name == 'SenicideStrategy'
     strategy.conciliate(conflicts)
     # check that the oldest processes are requested to stop on the relevant addresses
     expected = [call(conflicts[0], {'10.0.0.2', '10.0.0.3'}, False),
@@ -289,6 +459,9 @@ def test_senicide_strategy(supvisors, conflicts):
 def test_infanticide_strategy(supvisors, conflicts):
     """ Test the strategy that consists in stopping the youngest processes. """
     strategy = InfanticideStrategy(supvisors)
+    assert isinstance(strategy, UptimeStrategy)
+    assert strategy.pickup_logic is max
+    assert strategy.class_name == 'InfanticideStrategy'
     strategy.conciliate(conflicts)
     # check that the youngest processes are requested to stop on the relevant addresses
     expected = [call(conflicts[0], {'10.0.0.1', '10.0.0.2'}, False),
@@ -363,6 +536,9 @@ def test_conciliate_conflicts(mocker, supvisors, conflicts):
         assert not mock.called
     assert mocked_senicide.call_args_list == [call(conflicts)]
     mocked_senicide.reset_mock()
+    # test that the messages are sent at once
+    assert supvisors.internal_com.pusher.start_batch.call_args_list == [call()]
+    assert supvisors.internal_com.pusher.send_batch.call_args_list == [call()]
     # test infanticide conciliation
     conciliate_conflicts(supvisors, ConciliationStrategies.INFANTICIDE, conflicts)
     for mock in [mocked_senicide, mocked_user, mocked_stop, mocked_restart, mocked_failure]:
@@ -454,6 +630,13 @@ def test_add_stop_application_job(handler, add_jobs):
     handler.add_stop_application_job(application_a)
     compare_sets(handler, stop_app={application_a}, restart_app={application_b},
                  restart_proc={process_3}, continue_proc={process_3})
+    # check that a process removed from the application but still queued is superseded too
+    removed_process = Mock(application_name='dummy_application_A')
+    handler.restart_process_jobs.add(removed_process)
+    handler.continue_process_jobs.add(removed_process)
+    handler.add_stop_application_job(application_a)
+    compare_sets(handler, stop_app={application_a}, restart_app={application_b},
+                 restart_proc={process_3}, continue_proc={process_3})
 
 
 def test_add_restart_application_job(handler, add_jobs):
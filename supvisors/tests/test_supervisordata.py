@@ -60,6 +60,9 @@ def test_creation(supervisor, source):
     """ Test the values set at construction. """
     assert source.supervisord is supervisor
     assert source.server_config is source.supervisord.options.server_configs[0]
+    assert source._http_server is None
+    assert source._rpc_handler is None
+    assert source._system_rpc_interface is None
     assert source._supervisor_rpc_interface is None
     assert source._supvisors_rpc_interface is None
     assert source.disabilities == {}
@@ -69,6 +72,7 @@ def test_accessors(source):
     """ Test the accessors. """
     # test consistence with DummySupervisor configuration
     assert source.http_server is source.supervisord.options.httpserver
+    assert source.rpc_handler is source.http_server.handlers[0].handler
     assert source.supervisor_rpc_interface.rpc_name == 'supervisor_RPC'
     assert source.supvisors_rpc_interface.rpc_name == 'supvisors_RPC'
     assert source.server_host == gethostname()
@@ -101,12 +105,22 @@ def test_close_server(source):
     # keep reference to http servers
     http_servers = source.supervisord.options.httpservers
     assert source.supervisord.options.storage is None
+    assert source.http_server is source.supervisord.options.httpserver
+    assert source._http_server is source.supervisord.options.httpserver
+    assert source.supervisor_rpc_interface is not None
+    assert source._rpc_handler is not None
     # call the method
     source.close_httpservers()
     # test the result
     assert source.supervisord.options.storage is not None
     assert source.supervisord.options.storage is http_servers
     assert source.supervisord.options.httpservers == ()
+    assert source._http_server is None
+    assert source._rpc_handler is None
+    assert source._system_rpc_interface is None
+    assert source._supervisor_rpc_interface is None
+    assert source._supvisors_rpc_interface is None
+    assert source.http_server is None
 
 
 def test_get_group_processes(source):
@@ -204,10 +218,18 @@ def test_extra_args(source):
     source.update_extra_args(namespec, '-la')
     # test access
     assert source.get_process_config_options(namespec, ['extra_args']) == {'extra_args': '-la'}
+    assert source.get_all_process_config_options(['extra_args']) == {namespec: {'extra_args': '-la'},
+                                                                     'dummy_application:dummy_process_2':
+                                                                         {'extra_args': ''}}
     # test internal data
     assert config.command == 'ls -la'
     assert config.command_ref == 'ls'
     assert config.extra_args == '-la'
+    # apply the same extra arguments again: the command line is not rebuilt
+    config.command = 'ls -la -r'
+    source.update_extra_args(namespec, '-la')
+    assert config.command == 'ls -la -r'
+    assert config.extra_args == '-la'
     # remove them
     source.update_extra_args(namespec, '')
     # test access
@@ -229,42 +251,48 @@ def test_has_logfile(source):
 def test_update_numprocs(mocker, source):
     """ Test the possibility to update numprocs. """
     # get patches
-    mocked_obsolete = mocker.patch.object(source, '_get_obsolete_processes', return_value=['dummy_program_2'])
-    mocked_add = mocker.patch.object(source, '_add_processes', return_value=['dummy_program_3'])
+    mocked_add = mocker.patch.object(source, '_add_processes', return_value=['dummy_group:dummy_process_3'])
+    server_options = source.supervisord.supvisors.server_options
+    mocked_update = server_options.update_numprocs
+    mocked_update.return_value = 'program:dummy_program'
+    mocked_reload = server_options.reload_processes_from_section
+    mocked_reload.return_value = new_configs = {'dummy_group': [Mock(), Mock(), Mock()]}
     # set context
-    source.supervisord.supvisors.server_options.program_processes = program_processes = {}
-    program_processes['dummy_program'] = {'dummy_group': ['dummy_program_1', 'dummy_program_2']}
+    process_1, process_2 = Mock(), Mock()
+    process_1.name = 'dummy_process_1'
+    process_2.name = 'dummy_process_2'
+    server_options.program_processes = {'dummy_program': {'dummy_group': [process_1, process_2]}}
+    server_options.program_numprocs = {'dummy_program': 2}
     # test numprocs increase
-    assert source.update_numprocs('dummy_program', 3) == (['dummy_program_3'], [])
-    assert not mocked_obsolete.called
-    assert mocked_add.call_args_list == [call('dummy_program', 3, 2, ['dummy_group'])]
+    assert source.update_numprocs('dummy_program', 3) == (['dummy_group:dummy_process_3'], [])
+    assert mocked_update.call_args_list == [call('dummy_program', 3)]
+    assert mocked_reload.call_args_list == [call('program:dummy_program', ['dummy_group'])]
+    assert mocked_add.call_args_list == [call('dummy_program', 2, new_configs)]
     mocker.resetall()
+    mocked_update.reset_mock()
+    mocked_reload.reset_mock()
     # test numprocs decrease
-    assert source.update_numprocs('dummy_program', 1) == ([], ['dummy_program_2'])
-    assert mocked_obsolete.call_args_list == [call('dummy_program', 1,
-                                                   {'dummy_group': ['dummy_program_1', 'dummy_program_2']})]
+    assert source.update_numprocs('dummy_program', 1) == ([], ['dummy_group:dummy_process_2'])
+    assert mocked_update.call_args_list == [call('dummy_program', 1)]
+    assert mocked_reload.call_args_list == [call('program:dummy_program', ['dummy_group'])]
     assert not mocked_add.called
-    mocker.resetall()
+    mocked_update.reset_mock()
+    mocked_reload.reset_mock()
     # test numprocs identity
-    source.update_numprocs('dummy_program', 2)
-    assert not mocked_obsolete.called
+    assert source.update_numprocs('dummy_program', 2) == ([], [])
+    assert not mocked_update.called
+    assert not mocked_reload.called
     assert not mocked_add.called
 
 
 def test_add_processes(mocker, source):
     """ Test the possibility to increase numprocs. """
     # get the patches
-    mocked_update = source.supervisord.supvisors.server_options.update_numprocs
-    mocked_update.return_value = 'program:dummy_program'
-    mocked_reload = source.supervisord.supvisors.server_options.reload_processes_from_section
     process_1, process_2 = Mock(), Mock()
-    mocked_reload.return_value = [process_1, process_2]
-    expected = ['dummy_group:dummy_program_01', 'dummy_group:dummy_program_02']
+    expected = ['dummy_group:dummy_program_02']
     mocked_add = mocker.patch.object(source, '_add_supervisor_processes', return_value=expected)
     # test call
-    assert source._add_processes('dummy_program', 2, 1, ['dummy_group']) == expected
-    assert mocked_update.call_args_list == [call('dummy_program', 2)]
-    assert mocked_reload.call_args_list == [call('program:dummy_program', 'dummy_group')]
+    assert source._add_processes('dummy_program', 1, {'dummy_group': [process_1, process_2]}) == expected
     assert mocked_add.call_args_list == [call('dummy_program', 'dummy_group', [process_2])]
 
 
@@ -294,22 +322,6 @@ def test_add_supervisor_processes(mocker, source):
     assert notify_call.process is process_2
 
 
-def test_get_obsolete_processes(source):
-    """ Test getting the obsolete processes before decreasing numprocs. """
-    mocked_update = source.supervisord.supvisors.server_options.update_numprocs
-    mocked_update.return_value = 'program:dummy_program'
-    mocked_reload = source.supervisord.supvisors.server_options.reload_processes_from_section
-    # set context
-    process_1, process_2 = Mock(), Mock()
-    process_1.name = 'dummy_process_1'
-    process_2.name = 'dummy_process_2'
-    program_configs = {'dummy_group': [process_1, process_2]}
-    # test call
-    assert source._get_obsolete_processes('dummy_program', 1, program_configs) == ['dummy_group:dummy_process_2']
-    assert mocked_update.call_args_list == [call('dummy_program', 1)]
-    assert mocked_reload.call_args_list == [call('program:dummy_program', 'dummy_group')]
-
-
 def test_delete_processes(mocker, source):
     """ Test the possibility to decrease numprocs. """
     # get the patches
@@ -422,6 +434,8 @@ def test_replace_default_handler(source):
         source.replace_default_handler()
     # check handler type
     assert isinstance(source.supervisord.options.httpserver.handlers[-1], default_handler.default_handler)
+    assert source.supervisord.options.httpserver.handlers[-1].filesystem.root == SUPVISORS_UI_DIR
+    assert os.path.isdir(SUPVISORS_UI_DIR)
 
 
 def test_get_subprocesses(source):
@@ -20,9 +20,10 @@
 import pytest
 pytest.importorskip('zmq', reason='cannot test as optional pyzmq is not installed')
 
+import os
 import time
 
-from unittest.mock import call
+from unittest.mock import call, Mock
 
 from supvisors.client.zmqsubscriber import SupvisorsZmqEventInterface
 from supvisors.external_com.eventinterface import AsyncEventThread
@@ -90,6 +91,75 @@ def test_external_publish_subscribe(supvisors):
     assert not subscriber.thread.loop
 
 
+def test_publisher_options(publisher):
+    """ Test the options of the PyZmq publication socket. """
+    assert publisher.socket.getsockopt(zmq.SNDHWM) == ZMQ_PUB_SNDHWM
+    assert publisher.socket.getsockopt(zmq.SNDBUF) == ZMQ_PUB_SNDBUF
+    assert publisher.socket.getsockopt(zmq.LINGER) == ZMQ_LINGER
+    assert publisher.socket.getsockopt(zmq.IMMEDIATE) == 1
+
+
+def test_send_thread(supvisors):
+    """ Test the thread sending the messages of the PyZmq publisher. """
+    socket = Mock(**{'send_multipart.side_effect': [None, zmq.ZMQError('failed'), zmq.Again(), None]})
+    thread = ZmqSendThread(socket, supvisors.logger)
+    for idx in range(4):
+        thread.push_message([b'header', f'{idx}'.encode('utf-8')])
+    thread.stop()
+    # all the pending messages are sent before the thread ends, even if publication fails
+    thread.run()
+    assert socket.send_multipart.call_args_list == [call([b'header', b'0'], zmq.NOBLOCK, copy=False),
+                                                    call([b'header', b'1'], zmq.NOBLOCK, copy=False),
+                                                    call([b'header', b'2'], zmq.NOBLOCK, copy=False),
+                                                    call([b'header', b'3'], zmq.NOBLOCK, copy=False)]
+    assert supvisors.logger.error.called
+    assert socket.close.call_args_list == [call(ZMQ_LINGER)]
+
+
+def test_ipc_path(mocker):
+    """ Test the get_ipc_path function. """
+    mocker.patch('tempfile.gettempdir', return_value='/tmp/dummy')
+    assert get_ipc_path(7777) == '/tmp/dummy/supvisors-7777.sock'
+
+
+@pytest.mark.skipif(not zmq.has('ipc'), reason='IPC transport not available')
+def test_publisher_ipc(supvisors):
+    """ Test the additional Unix domain socket of the PyZmq publisher. """
+    publisher = ZmqEventPublisher(supvisors.mapper.local_instance, supvisors.logger)
+    ipc_path = get_ipc_path(supvisors.mapper.local_instance.event_port)
+    assert publisher.ipc_path == ipc_path
+    assert os.path.exists(ipc_path)
+    publisher.close()
+    assert not os.path.exists(ipc_path)
+
+
+def test_application_cache(mocker, publisher):
+    """ Test the re-use of the serialized application status in the ZeroMQ event publisher. """
+    mocked_dumps = mocker.patch('json.dumps', return_value='{}')
+    assert publisher.application_cache == {}
+    # first serialization of an application status
+    status = {'application_name': 'supvisors', 'statecode': 2}
+    assert publisher._encode_application_status(status) == b'{}'
+    assert mocked_dumps.call_args_list == [call(status)]
+    assert publisher.application_cache == {'supvisors': (status, b'{}')}
+    mocked_dumps.reset_mock()
+    # unchanged status: no serialization
+    assert publisher._encode_application_status(status.copy()) == b'{}'
+    assert not mocked_dumps.called
+    # changed status: new serialization
+    new_status = {'application_name': 'supvisors', 'statecode': 1}
+    mocked_dumps.return_value = '{"statecode": 1}'
+    assert publisher._encode_application_status(new_status) == b'{"statecode": 1}'
+    assert mocked_dumps.call_args_list == [call(new_status)]
+    assert publisher.application_cache == {'supvisors': (new_status, b'{"statecode": 1}')}
+    mocked_dumps.reset_mock()
+    # other statuses are not cached
+    publisher.send_instance_status(instance_payload)
+    publisher.send_process_status(process_payload)
+    assert mocked_dumps.call_args_list == [call(instance_payload), call(process_payload)]
+    assert list(publisher.application_cache.keys()) == ['supvisors']
+
+
 supvisors_payload = {'state': 'running', 'version': '1.0'}
 instance_payload = {'state': 'silent', 'identifier': 'cliche01', 'date': 1234}
 application_payload = {'state': 'starting', 'name': 'supvisors'}
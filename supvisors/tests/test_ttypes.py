@@ -51,7 +51,8 @@ def test_event_links():
 
 def test_starting_strategies():
     """ Test the StartingStrategies enumeration. """
-    expected = ['CONFIG', 'LESS_LOADED', 'MOST_LOADED', 'LOCAL', 'LESS_LOADED_NODE', 'MOST_LOADED_NODE']
+    expected = ['CONFIG', 'LESS_LOADED', 'MOST_LOADED', 'LOCAL', 'LESS_LOADED_NODE', 'MOST_LOADED_NODE',
+                'WEIGHTED_ROUND_ROBIN', 'WEIGHTED_RANDOM']
     assert [x.name for x in StartingStrategies] == expected
 
 
@@ -117,6 +118,7 @@ def test_exception():
     with pytest.raises(InvalidTransition) as exc:
         raise InvalidTransition('invalid transition')
     assert 'invalid transition' == str(exc.value)
+    assert exc.value.args == ('invalid transition',)
 
 
 def test_supvisors_faults():
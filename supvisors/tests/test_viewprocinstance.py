@@ -17,7 +17,6 @@
 # limitations under the License.
 # ======================================================================
 
-from random import shuffle
 from unittest.mock import call, Mock
 
 import pytest
@@ -72,53 +71,34 @@ def test_write_periods(mocker, view):
     assert mocked_period.call_args_list == [call(mocked_root, False)]
 
 
-def test_write_contents(mocker, view):
+@pytest.mark.parametrize('process, running_identifiers, process_data, expected_process, expected_stats', [
+    # no process selected
+    (None, None, ([{'namespec': 'dummy'}], []), None, {}),
+    # process selected and no corresponding status
+    # process set in excluded_list but not passed to write_process_statistics because unselected due to missing status
+    ('dummy_proc', None, ([{'namespec': 'dummy'}], [{'namespec': 'dummy_proc'}]), '', {}),
+    # process selected but not running on considered node
+    # process set in excluded_list
+    ('dummy_proc', {'10.0.0.2'}, ([{'namespec': 'dummy'}], [{'namespec': 'dummy_proc'}]), '', {}),
+    # process selected and running
+    ('dummy', {'10.0.0.1'}, ([{'namespec': 'dummy_proc'}], [{'namespec': 'dummy'}]), 'dummy', {'namespec': 'dummy'})])
+def test_write_contents(mocker, view, process, running_identifiers, process_data, expected_process, expected_stats):
     """ Test the ProcInstanceView.write_contents method. """
     mocked_stats = mocker.patch.object(view, 'write_process_statistics')
     mocked_table = mocker.patch.object(view, 'write_process_table')
-    mocked_data = mocker.patch.object(view, 'get_process_data',
-                                      side_effect=(([{'namespec': 'dummy'}], []),
-                                                   ([{'namespec': 'dummy'}], [{'namespec': 'dummy_proc'}]),
-                                                   ([{'namespec': 'dummy'}], [{'namespec': 'dummy_proc'}]),
-                                                   ([{'namespec': 'dummy_proc'}], [{'namespec': 'dummy'}])))
+    mocked_data = mocker.patch.object(view, 'get_process_data', return_value=process_data)
     # patch context
-    view.view_ctx = Mock(parameters={PROCESS: None}, local_identifier='10.0.0.1',
-                         **{'get_process_status.return_value': None})
+    process_status = Mock(running_identifiers=running_identifiers) if running_identifiers else None
+    view.view_ctx = Mock(parameters={PROCESS: process}, local_identifier='10.0.0.1',
+                         **{'get_process_status.return_value': process_status})
     # patch the meld elements
     mocked_root = Mock()
-    # test call with no process selected
-    view.write_contents(mocked_root)
-    assert mocked_data.call_args_list == [call()]
-    assert mocked_table.call_args_list == [call(mocked_root, [{'namespec': 'dummy'}], [])]
-    assert mocked_stats.call_args_list == [call(mocked_root, {})]
-    mocker.resetall()
-    # test call with process selected and no corresponding status
-    # process set in excluded_list but not passed to write_process_statistics because unselected due to missing status
-    view.view_ctx.parameters[PROCESS] = 'dummy_proc'
-    view.write_contents(mocked_root)
-    assert mocked_data.call_args_list == [call()]
-    assert mocked_table.call_args_list == [call(mocked_root, [{'namespec': 'dummy'}], [{'namespec': 'dummy_proc'}])]
-    assert view.view_ctx.parameters[PROCESS] == ''
-    assert mocked_stats.call_args_list == [call(mocked_root, {})]
-    mocker.resetall()
-    # test call with process selected but not running on considered node
-    # process set in excluded_list
-    view.view_ctx.parameters[PROCESS] = 'dummy_proc'
-    view.view_ctx.get_process_status.return_value = Mock(running_identifiers={'10.0.0.2'})
-    view.write_contents(mocked_root)
-    assert mocked_data.call_args_list == [call()]
-    assert mocked_table.call_args_list == [call(mocked_root, [{'namespec': 'dummy'}], [{'namespec': 'dummy_proc'}])]
-    assert view.view_ctx.parameters[PROCESS] == ''
-    assert mocked_stats.call_args_list == [call(mocked_root, {})]
-    mocker.resetall()
-    # test call with process selected and running
-    view.view_ctx.parameters[PROCESS] = 'dummy'
-    view.view_ctx.get_process_status.return_value = Mock(running_identifiers={'10.0.0.1'})
+    # test call
     view.write_contents(mocked_root)
     assert mocked_data.call_args_list == [call()]
-    assert mocked_table.call_args_list == [call(mocked_root, [{'namespec': 'dummy_proc'}], [{'namespec': 'dummy'}])]
-    assert view.view_ctx.parameters[PROCESS] == 'dummy'
-    assert mocked_stats.call_args_list == [call(mocked_root, {'namespec': 'dummy'})]
+    assert mocked_table.call_args_list == [call(mocked_root, *process_data)]
+    assert view.view_ctx.parameters[PROCESS] == expected_process
+    assert mocked_stats.call_args_list == [call(mocked_root, expected_stats)]
 
 
 def test_get_process_data(mocker, view):
@@ -202,10 +182,10 @@ def test_sort_data(mocker, view):
                                      {'application_name': 'sample_test_2', 'process_name': None}] * 2)
     view.view_ctx = Mock(local_identifier='10.0.0.1', **{'get_process_stats.return_value': (2, 'stats #1')})
     # build process list
+    # NOTE: the database is reversed so that the input is not already sorted, in a deterministic way
     processes = [{'application_name': info['group'], 'process_name': info['name'],
                   'single': info['group'] == info['name']}
-                 for info in ProcessInfoDatabase]
-    shuffle(processes)
+                 for info in reversed(ProcessInfoDatabase)]
     # patch context
     view.view_ctx.get_application_shex.side_effect = [(True, 0), (True, 0), (True, 0),
                                                       (True, 0), (False, 0), (False, 0)]
@@ -299,18 +279,14 @@ def test_write_process_table(mocker, view):
     mocked_common = mocker.patch.object(view, 'write_common_process_status')
     mocked_supervisord = mocker.patch.object(view, 'write_supervisord_status')
     # patch the meld elements
-    tr_elt_0 = Mock(attrib={'class': ''}, **{'findmeld.return_value': Mock()})
-    tr_elt_1 = Mock(attrib={'class': ''}, **{'findmeld.return_value': Mock()})
-    tr_elt_2 = Mock(attrib={'class': ''}, **{'findmeld.return_value': Mock()})
-    tr_elt_3 = Mock(attrib={'class': ''}, **{'findmeld.return_value': Mock()})
-    tr_elt_4 = Mock(attrib={'class': ''}, **{'findmeld.return_value': Mock()})
-    tr_elt_5 = Mock(attrib={'class': ''}, **{'findmeld.return_value': Mock()})
-    tr_mid = Mock(**{'repeat.return_value': [(tr_elt_0, {'process_name': 'info_0', 'single': True}),
-                                             (tr_elt_1, {'process_name': None}),
-                                             (tr_elt_2, {'process_name': 'info_2', 'single': False}),
-                                             (tr_elt_3, {'process_name': 'info_3', 'single': False}),
-                                             (tr_elt_4, {'process_name': None}),
-                                             (tr_elt_5, {'process_name': 'supervisord', 'single': True})]})
+    tr_elts = [Mock(attrib={'class': ''}, **{'findmeld.return_value': Mock()}) for _ in range(6)]
+    tr_data = [{'process_name': 'info_0', 'single': True},
+               {'process_name': None},
+               {'process_name': 'info_2', 'single': False},
+               {'process_name': 'info_3', 'single': False},
+               {'process_name': None},
+               {'process_name': 'supervisord', 'single': True}]
+    tr_mid = Mock(**{'repeat.return_value': list(zip(tr_elts, tr_data))})
     table_mid = Mock(**{'findmeld.return_value': tr_mid})
     mocked_root = Mock(**{'findmeld.return_value': table_mid})
     # test call with no data
@@ -321,41 +297,24 @@ def test_write_process_table(mocker, view):
     assert not mocked_common.called
     assert not mocked_total.called
     assert not mocked_appli.called
-    assert not tr_elt_0.findmeld.return_value.replace.called
-    assert not tr_elt_1.findmeld.return_value.replace.called
-    assert not tr_elt_2.findmeld.return_value.replace.called
-    assert not tr_elt_3.findmeld.return_value.replace.called
-    assert not tr_elt_4.findmeld.return_value.replace.called
-    assert not tr_elt_5.findmeld.return_value.replace.called
-    assert tr_elt_0.attrib['class'] == ''
-    assert tr_elt_1.attrib['class'] == ''
-    assert tr_elt_2.attrib['class'] == ''
-    assert tr_elt_3.attrib['class'] == ''
-    assert tr_elt_4.attrib['class'] == ''
-    assert tr_elt_5.attrib['class'] == ''
+    for tr_elt in tr_elts:
+        assert not tr_elt.findmeld.return_value.replace.called
+        assert tr_elt.attrib['class'] == ''
     table_mid.replace.reset_mock()
     # test call with data and line selected
     view.write_process_table(mocked_root, sorted_data, excluded_data)
     assert not table_mid.replace.called
     assert mocked_shex.call_args_list == [call(table_mid)]
-    assert mocked_common.call_args_list == [call(tr_elt_0, {'process_name': 'info_0', 'single': True}),
-                                            call(tr_elt_2, {'process_name': 'info_2', 'single': False}),
-                                            call(tr_elt_3, {'process_name': 'info_3', 'single': False})]
-    assert mocked_supervisord.call_args_list == [call(tr_elt_5, {'process_name': 'supervisord', 'single': True})]
-    assert mocked_appli.call_args_list == [call(tr_elt_1, {'process_name': None}, True),
-                                           call(tr_elt_4, {'process_name': None}, False)]
-    assert not tr_elt_0.findmeld.return_value.replace.called
-    assert not tr_elt_1.findmeld.return_value.replace.called
-    assert tr_elt_2.findmeld.return_value.replace.call_args_list == [call('')]
-    assert tr_elt_3.findmeld.return_value.replace.call_args_list == [call('')]
-    assert not tr_elt_4.findmeld.return_value.replace.called
-    assert not tr_elt_5.findmeld.return_value.replace.called
-    assert tr_elt_0.attrib['class'] == 'brightened'
-    assert tr_elt_1.attrib['class'] == 'shaded'
-    assert tr_elt_2.attrib['class'] == 'brightened'
-    assert tr_elt_3.attrib['class'] == 'shaded'
-    assert tr_elt_4.attrib['class'] == 'brightened'
-    assert tr_elt_5.attrib['class'] == 'shaded'
+    assert mocked_common.call_args_list == [call(tr_elts[0], tr_data[0]),
+                                            call(tr_elts[2], tr_data[2]),
+                                            call(tr_elts[3], tr_data[3])]
+    assert mocked_supervisord.call_args_list == [call(tr_elts[5], tr_data[5])]
+    assert mocked_appli.call_args_list == [call(tr_elts[1], tr_data[1], True),
+                                           call(tr_elts[4], tr_data[4], False)]
+    for idx, tr_elt in enumerate(tr_elts):
+        expected = [call('')] if idx in [2, 3] else []
+        assert tr_elt.findmeld.return_value.replace.call_args_list == expected
+    assert [tr_elt.attrib['class'] for tr_elt in tr_elts] == ['brightened', 'shaded'] * 3
     assert mocked_total.call_args_list == [call(table_mid, sorted_data, excluded_data)]
 
 
@@ -49,7 +49,8 @@ class EventLinks(Enum):
 
 class StartingStrategies(Enum):
     """ Applicable strategies that can be applied to start processes. """
-    CONFIG, LESS_LOADED, MOST_LOADED, LOCAL, LESS_LOADED_NODE, MOST_LOADED_NODE = range(6)
+    (CONFIG, LESS_LOADED, MOST_LOADED, LOCAL, LESS_LOADED_NODE, MOST_LOADED_NODE,
+     WEIGHTED_ROUND_ROBIN, WEIGHTED_RANDOM) = range(8)
 
 
 class ConciliationStrategies(Enum):
@@ -111,17 +112,16 @@ ISOLATION_STATES = [SupvisorsInstanceStates.ISOLATING, SupvisorsInstanceStates.I
 WORKING_STATES = [SupvisorsStates.DEPLOYMENT, SupvisorsStates.OPERATION, SupvisorsStates.CONCILIATION]
 CLOSING_STATES = [SupvisorsStates.RESTARTING, SupvisorsStates.SHUTTING_DOWN, SupvisorsStates.FINAL]
 
+# State names computed once, as Enum name lookups are not free
+SupvisorsStateNames = {state: state.name for state in SupvisorsStates}
+SupvisorsInstanceStateNames = {state: state.name for state in SupvisorsInstanceStates}
+ApplicationStateNames = {state: state.name for state in ApplicationStates}
+
 
 # Exceptions
 class InvalidTransition(Exception):
     """ Exception used for an invalid transition in state machines. """
 
-    def __init__(self, value):
-        self.value = value
-
-    def __str__(self):
-        return self.value
-
 
 # Supvisors related faults
 FAULTS_OFFSET = 100
@@ -138,10 +138,9 @@ class ProcessEvent(Event):
         self.process = process
 
     def payload(self):
-        groupname = ''
-        if self.process.group:
-            groupname = self.process.group.config.name
-        return 'processname:{} groupname:{} '.format(self.process.config.name, groupname)
+        group = self.process.group
+        groupname = group.config.name if group else ''
+        return f'processname:{self.process.config.name} groupname:{groupname} '
 
 
 class ProcessAddedEvent(ProcessEvent):
@@ -81,6 +81,12 @@ class SupervisorServerUrl:
         """ Update the URL by changing the hostname and the port. """
         self.env['SUPERVISOR_SERVER_URL'] = f'http://{self.authentication}{hostname}:{port}'
 
+    def get_env(self, hostname: str, port: int) -> Dict:
+        """ Return a copy of the environment where the hostname and the port are changed in the URL. """
+        env = self.env.copy()
+        env['SUPERVISOR_SERVER_URL'] = f'http://{self.authentication}{hostname}:{port}'
+        return env
+
 
 # simple functions
 def mean(x) -> float:
@@ -122,9 +128,8 @@ def get_linear_regression(xdata, ydata):
         datasize = len(xdata)
         sum_x = float(sum(xdata))
         sum_y = float(sum(ydata))
-        sum_xx = float(sum(map(lambda x: x * x, xdata)))
-        sum_products = float(sum([xdata[i] * ydata[i]
-                                  for i in range(datasize)]))
+        sum_xx = float(sum([x * x for x in xdata]))
+        sum_products = float(sum([x * y for x, y in zip(xdata, ydata)]))
         a = (sum_products - sum_x * sum_y / datasize) / (sum_xx - (sum_x * sum_x) / datasize)
         b = (sum_y - a * sum_x) / datasize
         return a, b
@@ -17,6 +17,8 @@
 # limitations under the License.
 # ======================================================================
 
+from operator import itemgetter
+
 from supervisor.states import ProcessStates
 
 from supvisors.application import ApplicationStatus
@@ -105,18 +107,11 @@ class ApplicationView(ViewHandler):
 
     def write_application_actions(self, root):
         """ Write actions related to the application. """
-        # configure start application button
-        elt = root.findmeld('startapp_a_mid')
-        url = self.view_ctx.format_url('', self.page_name, **{ACTION: 'startapp'})
-        elt.attributes(href=url)
-        # configure stop application button
-        elt = root.findmeld('stopapp_a_mid')
-        url = self.view_ctx.format_url('', self.page_name, **{ACTION: 'stopapp'})
-        elt.attributes(href=url)
-        # configure restart application button
-        elt = root.findmeld('restartapp_a_mid')
-        url = self.view_ctx.format_url('', self.page_name, **{ACTION: 'restartapp'})
-        elt.attributes(href=url)
+        # configure start / stop / restart application buttons
+        for action in ['startapp', 'stopapp', 'restartapp']:
+            elt = root.findmeld(f'{action}_a_mid')
+            url = self.view_ctx.format_url('', self.page_name, **{ACTION: action})
+            elt.attributes(href=url)
 
     # RIGHT SIDE / BODY part
     def write_contents(self, root) -> None:
@@ -168,7 +163,7 @@ class ApplicationView(ViewHandler):
                          'description': description,
                          'expected_load': process.rules.expected_load, 'nb_cores': nb_cores, 'proc_stats': proc_stats})
         # re-arrange data using alphabetical order
-        return sorted(data, key=lambda x: x['process_name'])
+        return sorted(data, key=itemgetter('process_name'))
 
     def write_process_table(self, root, data):
         """ Rendering of the application processes managed through Supervisor. """
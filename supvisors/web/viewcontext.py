@@ -345,4 +345,4 @@ class ViewContext:
     @staticmethod
     def cpu_id_to_string(idx):
         """ Get a printable form of cpu index. """
-        return '{}'.format(idx - 1) if idx > 0 else 'all'
+        return f'{idx - 1}' if idx > 0 else 'all'
@@ -18,6 +18,7 @@
 # ======================================================================
 
 import time
+from operator import attrgetter
 from typing import Type
 
 from supervisor.compat import as_bytes, as_string
@@ -177,7 +178,7 @@ class ViewHandler(MeldView):
         working_apps = (self.supvisors.starter.get_application_job_names()
                         | self.supvisors.stopper.get_application_job_names())
         # forced to list otherwise not easily testable
-        for li_elt, item in mid_elt.repeat(sorted(applications, key=lambda x: x.application_name)):
+        for li_elt, item in mid_elt.repeat(sorted(applications, key=attrgetter('application_name'))):
             failure = item.major_failure or item.minor_failure
             any_failure |= failure
             # set element class
@@ -18,6 +18,7 @@
 # ======================================================================
 
 import os
+from operator import itemgetter
 
 from supervisor.states import ProcessStates, RUNNING_STATES
 
@@ -138,7 +139,7 @@ class ProcInstanceView(SupvisorsInstanceView):
                 application_shex, _ = self.view_ctx.get_application_shex(application_name)
             if application_shex:
                 # add processes using the alphabetical ordering
-                sorted_list = sorted([info for info in application_processes], key=lambda x: x['process_name'])
+                sorted_list = sorted(application_processes, key=itemgetter('process_name'))
                 sorted_data.extend(sorted_list)
             else:
                 # push to excluded data